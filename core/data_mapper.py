@@ -7,10 +7,15 @@ data filtering.
 """
 
 from typing import Dict, Any, List, Optional, Union
+from collections import OrderedDict
 import pandas as pd
 import os
+import threading
 from datetime import datetime
 
+# Number of loaded data files kept by DataMapper.get_or_create()
+_SHARED_CACHE_SIZE = 4
+
 
 class DataMapper:
     """
@@ -25,6 +30,11 @@ class DataMapper:
     - Multi-sheet Excel support
     """
 
+    # Recently loaded (data, metadata) pairs, keyed by (path, mtime, sheet),
+    # least recently used first; guarded by _shared_lock
+    _shared_frames: 'OrderedDict[tuple, tuple]' = OrderedDict()
+    _shared_lock = threading.Lock()
+
     def __init__(self, data_path: Optional[str] = None):
         """
         Initialize DataMapper.
@@ -79,6 +89,69 @@ class DataMapper:
         except Exception as e:
             raise Exception(f"Failed to load data from {file_path}: {str(e)}") from e
 
+    @classmethod
+    def get_or_create(
+        cls,
+        file_path: str,
+        sheet_name: Union[str, int] = 0
+    ) -> 'DataMapper':
+        """
+        Get a DataMapper for a data file, reusing a recently loaded copy.
+
+        The last few loaded files are cached per process and reused until
+        their modification time changes. Each call returns a new mapper, so
+        apply_column_mapping, filter_data, etc. only affect that caller.
+
+        Args:
+            file_path: Path to data file
+            sheet_name: Sheet name or index for Excel files (default: 0)
+
+        Returns:
+            Loaded DataMapper instance
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+
+        Example:
+            mapper = DataMapper.get_or_create('data/BSH_November.xlsx')
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Data file not found: {file_path}")
+
+        abs_path = os.path.abspath(file_path)
+        key = (abs_path, os.stat(abs_path).st_mtime_ns, sheet_name)
+
+        with cls._shared_lock:
+            cached = cls._shared_frames.get(key)
+            if cached is not None:
+                cls._shared_frames.move_to_end(key)
+
+        if cached is None:
+            # Load outside the lock so other files can be served meanwhile
+            loaded = cls()
+            loaded.load_data(file_path, sheet_name)
+            cached = (loaded.data, loaded.metadata)
+
+            with cls._shared_lock:
+                # Drop stale entries for older versions of the same file/sheet
+                for stale_key in [k for k in cls._shared_frames
+                                  if k[0] == abs_path and k[2] == sheet_name]:
+                    del cls._shared_frames[stale_key]
+
+                cls._shared_frames[key] = cached
+                while len(cls._shared_frames) > _SHARED_CACHE_SIZE:
+                    cls._shared_frames.popitem(last=False)
+
+        # Hand out a private mapper over a shallow copy of the shared frame:
+        # the mapper's methods replace self.data rather than edit it in place
+        data, metadata = cached
+        mapper = cls()
+        mapper.data = data.copy(deep=False)
+        mapper.data_path = file_path
+        mapper.metadata = {**metadata, 'columns': list(metadata['columns'])}
+
+        return mapper
+
     def _extract_metadata(self) -> None:
         """Extract metadata from loaded data for use in text variables."""
         if self.data is None:
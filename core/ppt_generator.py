@@ -11,16 +11,57 @@ This is the main entry point for report generation.
 """
 
 from typing import Dict, Any, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
 from pptx import Presentation
 from pptx.util import Inches
 import os
-from datetime import datetime
+import time
+import traceback
 
 from core.component_factory import ComponentFactory
 from core.data_mapper import DataMapper
 from core.template_manager import TemplateManager
 
 
+# Characters replaced when building output filenames from template names
+_FNAME_TRANS = str.maketrans({' ': '_', '/': '_', '\\': '_', ':': '_'})
+
+# Timestamp format for auto-generated output filenames
+_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+# Write buffer size for saving presentations
+_SAVE_BUFFER_SIZE = 1 << 18
+
+# ComponentFactory is stateless, so one instance serves every generator
+_SHARED_FACTORY = ComponentFactory()
+
+
+def _print_warning(message: str) -> None:
+    """
+    Print a warning with the traceback of the exception being handled.
+
+    Args:
+        message: Warning text (without the "Warning:" prefix)
+    """
+    print(f"Warning: {message}")
+    traceback.print_exc()  # Print full traceback for debugging
+
+
+def _ensure_dir(path: str) -> None:
+    """
+    Create a directory if it doesn't exist.
+
+    Not cached: the directory may be deleted or moved while a
+    long-running process (the GUI) is open, and makedirs on an
+    existing directory is only a stat.
+
+    Args:
+        path: Directory path (empty path is ignored)
+    """
+    if path:
+        os.makedirs(path, exist_ok=True)
+
+
 class PPTGenerator:
     """
     Main PowerPoint report generation engine.
@@ -43,7 +84,8 @@ class PPTGenerator:
     def __init__(
         self,
         template_dir: str = "templates/configs",
-        output_dir: str = "output"
+        output_dir: str = "output",
+        max_workers: int = 4
     ):
         """
         Initialize PPTGenerator.
@@ -51,17 +93,24 @@ class PPTGenerator:
         Args:
             template_dir: Directory containing template JSON files
             output_dir: Directory for generated PowerPoint files
+            max_workers: Number of threads used to prepare slide data
         """
         self.template_manager = TemplateManager(template_dir)
         self.data_mapper = DataMapper()
-        self.component_factory = ComponentFactory()
+        self.component_factory = _SHARED_FACTORY
 
         self.output_dir = output_dir
+        self.max_workers = max_workers
         self.presentation: Optional[Presentation] = None
         self.custom_variables: Dict[str, Any] = {}
 
+        # Compiled slides for the current template (see _compile_template)
+        self._compiled_slides: Optional[List[Dict[str, Any]]] = None
+        self._compiled_source: Optional[Dict[str, Any]] = None
+        self._compiled_version = -1
+
         # Create output directory
-        os.makedirs(output_dir, exist_ok=True)
+        _ensure_dir(output_dir)
 
     def load_template(self, template_path: str) -> Dict[str, Any]:
         """
@@ -77,6 +126,37 @@ class PPTGenerator:
             generator.load_template('templates/configs/BSH_Template.json')
         """
         template = self.template_manager.load_template(template_path)
+
+        # Drop components compiled for the previous template
+        self._compiled_slides = None
+        self._compiled_source = None
+
+        return template
+
+    def load_template_dict(
+        self,
+        template: Dict[str, Any],
+        template_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Load an already-parsed template, skipping disk I/O and JSON parsing.
+
+        Args:
+            template: Template dictionary
+            template_path: Path the template was read from (optional)
+
+        Returns:
+            Template dictionary
+
+        Example:
+            generator.load_template_dict(template_dict)
+        """
+        template = self.template_manager.set_template(template, template_path)
+
+        # Drop components compiled for the previous template
+        self._compiled_slides = None
+        self._compiled_source = None
+
         return template
 
     def load_data(self, data_path: str, sheet_name: Union[str, int] = 0) -> None:
@@ -90,7 +170,8 @@ class PPTGenerator:
         Example:
             generator.load_data('data/BSH_November.xlsx')
         """
-        self.data_mapper.load_data(data_path, sheet_name)
+        # Reuse recently loaded data for unchanged files
+        self.data_mapper = DataMapper.get_or_create(data_path, sheet_name)
 
     def set_variables(self, variables: Dict[str, Any]) -> None:
         """
@@ -125,6 +206,9 @@ class PPTGenerator:
         Returns:
             Path to generated PowerPoint file
 
+        Raises:
+            ValueError: If no template is loaded or the template has no slides
+
         Example:
             path = generator.generate('output/BSH_November_Report.pptx')
         """
@@ -132,6 +216,14 @@ class PPTGenerator:
         if not self.template_manager.current_template:
             raise ValueError("No template loaded. Call load_template() first.")
 
+        # Get template
+        template = self.template_manager.current_template
+        slides = template.get('slides', [])
+
+        # Nothing to render - fail before building a presentation
+        if not slides:
+            raise ValueError("Template must have at least one slide")
+
         # Create presentation
         if template_pptx and os.path.exists(template_pptx):
             self.presentation = Presentation(template_pptx)
@@ -139,23 +231,45 @@ class PPTGenerator:
             self.presentation = Presentation()
             self._set_presentation_size()
 
-        # Get template
-        template = self.template_manager.current_template
+        # Resolve components once per template
+        compiled_slides = self._compile_template(template)
+        variables = self._get_component_variables(template)
 
         # Generate slides
-        slides = template.get('slides', [])
-        for slide_config in slides:
-            self._generate_slide(slide_config)
+        if len(compiled_slides) == 1:
+            # Single slide - no benefit from a thread pool
+            self._generate_slide(compiled_slides[0], variables)
+        else:
+            # Data mapping runs in worker threads; the Presentation is not
+            # thread-safe, so slides are added and rendered sequentially in
+            # the original order.
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                slide_plans = list(executor.map(
+                    lambda compiled_slide: self._prepare_slide(compiled_slide, variables),
+                    compiled_slides
+                ))
+
+            for slide_plan in slide_plans:
+                self._materialize_slide(slide_plan)
 
         # Determine output path
         if not output_path:
             output_path = self._generate_output_path(template)
 
         # Ensure output directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        _ensure_dir(os.path.dirname(output_path))
 
-        # Save presentation
-        self.presentation.save(output_path)
+        # Save presentation to a temp file, then swap it into place so an
+        # interrupted save never leaves a partial .pptx behind
+        temp_path = output_path + '.tmp'
+        try:
+            with open(temp_path, 'wb', buffering=_SAVE_BUFFER_SIZE) as f:
+                self.presentation.save(f)
+            os.replace(temp_path, output_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
 
         return output_path
 
@@ -176,30 +290,145 @@ class PPTGenerator:
             self.presentation.slide_width = Inches(10)
             self.presentation.slide_height = Inches(7.5)
 
-    def _generate_slide(self, slide_config: Dict[str, Any]) -> None:
+    def _compile_template(self, template: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Resolve a template's slides into layout indexes and render callables.
+
+        Components are created once per template and reused across
+        generate() calls; they hold no per-render state. The result is
+        cached until a different template is loaded or the current one is
+        edited through the TemplateManager (add_slide, add_slides).
+
+        Args:
+            template: Template dictionary
+
+        Returns:
+            List of compiled slides with 'layout_index' and 'components'
+            ((render_fn, component_config) tuples)
+        """
+        version = self.template_manager.template_version
+        if (self._compiled_source is template
+                and self._compiled_version == version
+                and self._compiled_slides is not None):
+            return self._compiled_slides
+
+        compiled_slides = []
+        for slide_config in template.get('slides', []):
+            components = []
+            for component_config in slide_config.get('components', []):
+                try:
+                    # Create component with template reference for brand colors
+                    component = self.component_factory.create_component(
+                        component_config,
+                        template=template
+                    )
+                    components.append((component.render, component_config))
+                except Exception as e:
+                    _print_warning(f"Failed to create component: {str(e)}")
+                    # Continue with other components
+
+            compiled_slides.append({
+                'layout_index': self._get_layout_index(slide_config.get('layout', 'blank')),
+                'components': components
+            })
+
+        self._compiled_slides = compiled_slides
+        self._compiled_source = template
+        self._compiled_version = version
+        return compiled_slides
+
+    def _get_component_variables(self, template: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build variables for text substitution, including template
+        title_slide settings.
+
+        Args:
+            template: Template dictionary
+
+        Returns:
+            Variables dictionary (shared by all components; do not mutate)
+        """
+        variables = self.custom_variables.copy()
+
+        # Add title_slide settings from template if available
+        if template and 'settings' in template:
+            title_slide = template['settings'].get('title_slide', {})
+            if title_slide:
+                # Add title_slide variables for text substitution
+                variables['title_slide_title'] = title_slide.get('title', '')
+                variables['title_slide_subtitle'] = title_slide.get('subtitle', '')
+                variables['title_slide_description'] = title_slide.get('description', '')
+
+        return variables
+
+    def _generate_slide(
+        self,
+        compiled_slide: Dict[str, Any],
+        variables: Dict[str, Any]
+    ) -> None:
         """
         Generate a single slide.
 
         Args:
-            slide_config: Slide configuration from template
+            compiled_slide: Slide from _compile_template()
+            variables: Variables for text substitution
+        """
+        self._materialize_slide(self._prepare_slide(compiled_slide, variables))
+
+    def _prepare_slide(
+        self,
+        compiled_slide: Dict[str, Any],
+        variables: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build a slide plan: fetch data for each compiled component.
+
+        Does not touch the presentation, so it is safe to run in a
+        worker thread.
+
+        Args:
+            compiled_slide: Slide from _compile_template()
+            variables: Variables for text substitution
+
+        Returns:
+            Slide plan with layout index and (render_fn, config, data) tuples
+        """
+        components = []
+        for render_fn, component_config in compiled_slide['components']:
+            try:
+                component_data = self.data_mapper.get_data_for_component(
+                    component_config,
+                    variables
+                )
+                components.append((render_fn, component_config, component_data))
+            except Exception as e:
+                _print_warning(f"Failed to prepare component data: {str(e)}")
+                # Continue with other components
+
+        return {
+            'layout_index': compiled_slide['layout_index'],
+            'components': components
+        }
+
+    def _materialize_slide(self, slide_plan: Dict[str, Any]) -> None:
+        """
+        Add a slide to the presentation and render its prepared components.
+
+        Must run on the thread that owns the presentation.
+
+        Args:
+            slide_plan: Plan returned by _prepare_slide()
         """
         if not self.presentation:
             raise ValueError("Presentation not initialized")
 
-        # Get layout
-        layout_name = slide_config.get('layout', 'blank')
-        layout_index = self._get_layout_index(layout_name)
-
         # Add slide
-        slide_layout = self.presentation.slide_layouts[layout_index]
+        slide_layout = self.presentation.slide_layouts[slide_plan['layout_index']]
         slide = self.presentation.slides.add_slide(slide_layout)
 
-        # Get components
-        components_config = slide_config.get('components', [])
-
         # Render each component
-        for component_config in components_config:
-            self._render_component(slide, component_config)
+        for render_fn, component_config, component_data in slide_plan['components']:
+            self._render_component(slide, render_fn, component_config, component_data)
 
     def _get_layout_index(self, layout_name: str) -> int:
         """
@@ -223,56 +452,35 @@ class PPTGenerator:
 
         return layout_map.get(layout_name.lower(), 5)  # Default to blank
 
-    def _render_component(self, slide, component_config: Dict[str, Any]) -> None:
+    def _render_component(
+        self,
+        slide,
+        render_fn,
+        component_config: Dict[str, Any],
+        component_data: Any
+    ) -> None:
         """
         Render a component on a slide.
 
         Args:
             slide: PowerPoint slide object
+            render_fn: Bound render method of a compiled component
             component_config: Component configuration
+            component_data: Data for the component
         """
         try:
-            # Get current template for brand colors
-            template = self.template_manager.current_template
-
-            # Create component with template reference
-            component = self.component_factory.create_component(
-                component_config,
-                template=template
-            )
-
-            # Prepare variables including template title_slide settings
-            variables = self.custom_variables.copy()
-            
-            # Add title_slide settings from template if available
-            if template and 'settings' in template:
-                title_slide = template['settings'].get('title_slide', {})
-                if title_slide:
-                    # Add title_slide variables for text substitution
-                    variables['title_slide_title'] = title_slide.get('title', '')
-                    variables['title_slide_subtitle'] = title_slide.get('subtitle', '')
-                    variables['title_slide_description'] = title_slide.get('description', '')
-            
-            # Get data for component
-            component_data = self.data_mapper.get_data_for_component(
-                component_config,
-                variables
-            )
-
             # Render component
-            component.render(slide, component_data)
+            render_fn(slide, component_data)
 
         except IndexError as e:
             # Handle tuple/list index errors specifically
-            import traceback
-            print(f"Warning: Failed to render component (index error): {str(e)}")
-            print(f"Component config: {component_config.get('type', 'unknown')}")
-            traceback.print_exc()
+            _print_warning(
+                f"Failed to render component (index error): {str(e)}\n"
+                f"Component config: {component_config.get('type', 'unknown')}"
+            )
             # Continue with other components
         except Exception as e:
-            print(f"Warning: Failed to render component: {str(e)}")
-            import traceback
-            traceback.print_exc()  # Print full traceback for debugging
+            _print_warning(f"Failed to render component: {str(e)}")
             # Continue with other components
 
     def _generate_output_path(self, template: Dict[str, Any]) -> str:
@@ -289,8 +497,8 @@ class PPTGenerator:
         template_name = metadata.get('name', 'Report')
 
         # Clean filename
-        clean_name = template_name.replace(' ', '_').replace('/', '_')
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        clean_name = template_name.translate(_FNAME_TRANS)
+        timestamp = time.strftime(_TIMESTAMP_FORMAT, time.localtime())
 
         filename = f"{clean_name}_{timestamp}.pptx"
         return os.path.join(self.output_dir, filename)
@@ -380,7 +588,9 @@ class PPTGenerator:
         """Reset generator to initial state."""
         self.presentation = None
         self.custom_variables = {}
-        self.data_mapper.reset()
+        # The loaded mapper may be shared with other generators - replace it
+        # instead of resetting it in place
+        self.data_mapper = DataMapper()
 
 
 class BatchPPTGenerator:
@@ -6,10 +6,102 @@ JSON files that define the structure of PowerPoint reports.
 """
 
 from typing import Dict, Any, List, Optional
+from collections import Counter
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import copy
 import json
+import mmap
 import os
+import threading
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+# Files at least this large are memory-mapped when parsed with orjson
+_MMAP_THRESHOLD = 1 << 20
+
+# Component types accepted in templates (tuple keeps error message order)
+_VALID_COMPONENT_TYPES = ('text', 'table', 'image', 'chart', 'summary')
+_VALID_COMPONENT_TYPE_SET = frozenset(_VALID_COMPONENT_TYPES)
+
+
+def _read_json(file_path: str) -> Any:
+    """
+    Read and parse a JSON file in a single pass over its bytes.
+
+    Large files are memory-mapped and handed to orjson without an extra
+    user-space copy.
+
+    Args:
+        file_path: Path to JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(file_path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+
+        return _loads_json(f.read())
+
+
+def _loads_json(raw: bytes) -> Any:
+    """
+    Parse JSON bytes, using orjson when available.
+
+    Args:
+        raw: UTF-8 encoded JSON
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+
+    return json.loads(raw)
+
+
+def _dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON bytes, using orjson when available.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _read_bytes(file_path: str) -> bytes:
+    """Read a whole file as bytes."""
+    with open(file_path, 'rb') as f:
+        return f.read()
+
 
 class TemplateManager:
     """
@@ -57,9 +149,73 @@ class TemplateManager:
         self.current_template: Optional[Dict[str, Any]] = None
         self.template_path: Optional[str] = None
 
+        # Bumped whenever current_template is edited in place (add_slide,
+        # add_slides), so holders of derived state can tell it changed
+        self.template_version = 0
+
+        # Parsed templates keyed by path: (st_mtime_ns, st_size, template).
+        # list_templates() fills it from worker threads, hence the lock
+        self._cache: Dict[str, tuple] = {}
+        self._cache_lock = threading.Lock()
+
         # Create template directory if it doesn't exist
         Path(template_dir).mkdir(parents=True, exist_ok=True)
 
+    def _read_template(
+        self,
+        file_path: str,
+        stat_result: Optional[os.stat_result] = None,
+        raw: Optional[bytes] = None
+    ) -> Dict[str, Any]:
+        """
+        Read a template file, reusing the parsed result while the file's
+        mtime and size are unchanged.
+
+        Cached templates are shared between callers and must be treated
+        as read-only.
+
+        Args:
+            file_path: Path to template JSON file
+            stat_result: Pre-fetched stat of the file (e.g. from os.scandir)
+            raw: File contents already read by the caller (optional)
+
+        Returns:
+            Parsed template dictionary
+        """
+        st = stat_result if stat_result is not None else os.stat(file_path)
+
+        template = self._cached_template(file_path, st)
+        if template is not None:
+            return template
+
+        template = _loads_json(raw) if raw is not None else _read_json(file_path)
+        with self._cache_lock:
+            self._cache[file_path] = (st.st_mtime_ns, st.st_size, template)
+        return template
+
+    def _cached_template(
+        self,
+        file_path: str,
+        stat_result: os.stat_result
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached parse of a template file if it is still current.
+
+        Args:
+            file_path: Path to template JSON file
+            stat_result: Current stat of the file
+
+        Returns:
+            Shared (read-only) template dictionary, or None on a cache miss
+        """
+        with self._cache_lock:
+            cached = self._cache.get(file_path)
+
+        if cached is not None and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+            return cached[2]
+
+        return None
+
     def load_template(self, template_path: str) -> Dict[str, Any]:
         """
         Load a template from JSON file.
@@ -68,7 +224,8 @@ class TemplateManager:
             template_path: Path to template JSON file
 
         Returns:
-            Template dictionary
+            Template dictionary (a private copy; the parsed file is cached
+            while it is unchanged)
 
         Raises:
             FileNotFoundError: If template file doesn't exist
@@ -82,12 +239,15 @@ class TemplateManager:
             raise FileNotFoundError(f"Template not found: {template_path}")
 
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = json.load(f)
+            template = self._read_template(template_path)
 
             # Validate template
             self._validate_template(template)
 
+            # The cached dict is shared with list_templates(); callers
+            # (and add_slide) get their own copy to edit
+            template = copy.deepcopy(template)
+
             self.current_template = template
             self.template_path = template_path
 
@@ -98,6 +258,35 @@ class TemplateManager:
         except Exception as e:
             raise ValueError(f"Failed to load template: {str(e)}") from e
 
+    def set_template(
+        self,
+        template: Dict[str, Any],
+        template_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Use an already-parsed template as the current template.
+
+        Args:
+            template: Template dictionary
+            template_path: Path the template was read from (optional)
+
+        Returns:
+            Template dictionary
+
+        Raises:
+            ValueError: If template fails validation
+
+        Example:
+            manager = TemplateManager()
+            manager.set_template(template_dict, 'templates/configs/BSH_Template.json')
+        """
+        self._validate_template(template)
+
+        self.current_template = template
+        self.template_path = template_path
+
+        return template
+
     def save_template(
         self,
         template: Dict[str, Any],
@@ -136,9 +325,14 @@ class TemplateManager:
         # Ensure directory exists
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
+        # Drop any cached copy of the file being replaced
+        with self._cache_lock:
+            self._cache.pop(file_path, None)
+
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(template, f, indent=2, ensure_ascii=False)
+            # Serialize to bytes first, then write once
+            with open(file_path, 'wb') as f:
+                f.write(_dumps_json(template))
 
             return file_path
 
@@ -155,6 +349,20 @@ class TemplateManager:
         Returns:
             True if valid
 
+        Raises:
+            ValueError: If template is invalid
+        """
+        self._validate_all(template)
+
+        return True
+
+    def _validate_all(self, template: Dict[str, Any]) -> None:
+        """
+        Validate template structure, then each slide and its components.
+
+        Args:
+            template: Template dictionary
+
         Raises:
             ValueError: If template is invalid
         """
@@ -165,21 +373,23 @@ class TemplateManager:
         if 'slides' not in template:
             raise ValueError("Template must include 'slides' key")
 
-        if not isinstance(template['slides'], list):
+        slides = template['slides']
+
+        if not isinstance(slides, list):
             raise ValueError("'slides' must be a list")
 
-        if len(template['slides']) == 0:
+        if len(slides) == 0:
             raise ValueError("Template must have at least one slide")
 
         # Validate metadata if present
         if 'metadata' in template:
             self._validate_metadata(template['metadata'])
 
-        # Validate slides
-        for idx, slide in enumerate(template['slides']):
-            self._validate_slide(slide, idx)
-
-        return True
+        # Validate slides, each validating its own components (bound
+        # method hoisted out of the loop)
+        validate_slide = self._validate_slide
+        for index, slide in enumerate(slides):
+            validate_slide(slide, index)
 
     def _validate_metadata(self, metadata: Dict[str, Any]) -> bool:
         """Validate template metadata."""
@@ -217,9 +427,10 @@ class TemplateManager:
         if not isinstance(slide['components'], list):
             raise ValueError(f"Slide {index} 'components' must be a list")
 
-        # Validate components
+        # Validate components (bound method hoisted out of the loop)
+        validate_component = self._validate_component
         for comp_idx, component in enumerate(slide['components']):
-            self._validate_component(component, index, comp_idx)
+            validate_component(component, index, comp_idx)
 
         return True
 
@@ -253,11 +464,10 @@ class TemplateManager:
                 f"Component {comp_idx} in slide {slide_idx} must include 'type' key"
             )
 
-        valid_types = ['text', 'table', 'image', 'chart', 'summary']
-        if component['type'] not in valid_types:
+        if component['type'] not in _VALID_COMPONENT_TYPE_SET:
             raise ValueError(
                 f"Component {comp_idx} in slide {slide_idx} has invalid type: "
-                f"{component['type']}. Valid types: {', '.join(valid_types)}"
+                f"{component['type']}. Valid types: {', '.join(_VALID_COMPONENT_TYPES)}"
             )
 
         # Check for position and size
@@ -288,34 +498,142 @@ class TemplateManager:
             for template in templates:
                 print(f"{template['name']} - {template['path']}")
         """
-        templates = []
+        entries = self._scan_template_entries()
+
+        if not entries:
+            return []
+
+        # Read and parse files in parallel; map() keeps the sorted order
+        with ThreadPoolExecutor(max_workers=min(8, len(entries))) as executor:
+            summaries = executor.map(self._read_template_summary, entries)
+
+        return [summary for summary in summaries if summary is not None]
+
+    async def list_templates_async(self) -> List[Dict[str, Any]]:
+        """
+        List all available templates, overlapping file reads with asyncio.
+
+        Reads are issued concurrently (via aiofiles when installed) and
+        parsing runs off the event loop. Returns the same result as
+        list_templates().
+
+        Returns:
+            List of dictionaries with template information
+
+        Example:
+            templates = await manager.list_templates_async()
+        """
+        entries = self._scan_template_entries()
+
+        summaries = await asyncio.gather(
+            *(self._read_template_summary_async(entry) for entry in entries)
+        )
+
+        return [summary for summary in summaries if summary is not None]
+
+    def list_templates_batched(self) -> List[Dict[str, Any]]:
+        """
+        Synchronous wrapper around list_templates_async().
+
+        Must not be called from inside a running event loop.
 
+        Returns:
+            List of dictionaries with template information
+        """
+        return asyncio.run(self.list_templates_async())
+
+    def _scan_template_entries(self) -> List[os.DirEntry]:
+        """
+        Get template JSON files in the template directory, sorted by name.
+
+        Returns:
+            List of directory entries (empty if the directory is missing)
+        """
         if not os.path.exists(self.template_dir):
-            return templates
+            return []
 
-        for file in os.listdir(self.template_dir):
-            if file.endswith('.json'):
-                file_path = os.path.join(self.template_dir, file)
+        # scandir entries carry the file name, path and a cached stat
+        with os.scandir(self.template_dir) as it:
+            return sorted(
+                (entry for entry in it if entry.name.endswith('.json')),
+                key=lambda entry: entry.name
+            )
 
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        template = json.load(f)
+    def _summarize_template(
+        self,
+        file: str,
+        file_path: str,
+        template: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the list_templates() entry for a parsed template."""
+        metadata = template.get('metadata', {})
+
+        return {
+            'file_name': file,
+            'path': file_path,
+            'name': metadata.get('name', file.replace('.json', '')),
+            'description': metadata.get('description', 'No description'),
+            'version': metadata.get('version', 'Unknown'),
+            'slides': len(template.get('slides', []))
+        }
+
+    def _read_template_summary(self, entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+        """
+        Read one template file and summarize it for list_templates().
+
+        Args:
+            entry: Directory entry of the template JSON file
+
+        Returns:
+            Template summary dictionary, or None if the file can't be read
+        """
+        file = entry.name
+
+        try:
+            template = self._read_template(entry.path, entry.stat())
+            return self._summarize_template(file, entry.path, template)
+
+        except Exception as e:
+            print(f"Warning: Failed to read template {file}: {str(e)}")
+            return None
 
-                    metadata = template.get('metadata', {})
+    async def _read_template_summary_async(
+        self,
+        entry: os.DirEntry
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Async counterpart of _read_template_summary(), sharing its cache.
 
-                    templates.append({
-                        'file_name': file,
-                        'path': file_path,
-                        'name': metadata.get('name', file.replace('.json', '')),
-                        'description': metadata.get('description', 'No description'),
-                        'version': metadata.get('version', 'Unknown'),
-                        'slides': len(template.get('slides', []))
-                    })
+        Args:
+            entry: Directory entry of the template JSON file
 
-                except Exception as e:
-                    print(f"Warning: Failed to read template {file}: {str(e)}")
+        Returns:
+            Template summary dictionary, or None if the file can't be read
+        """
+        file = entry.name
 
-        return templates
+        try:
+            st = entry.stat()
+
+            template = self._cached_template(entry.path, st)
+            if template is None:
+                # Only the read is async; parsing and caching are shared
+                # with the synchronous path
+                if aiofiles is not None:
+                    async with aiofiles.open(entry.path, 'rb') as f:
+                        raw = await f.read()
+                else:
+                    raw = await asyncio.to_thread(_read_bytes, entry.path)
+
+                template = await asyncio.to_thread(
+                    self._read_template, entry.path, st, raw
+                )
+
+            return self._summarize_template(file, entry.path, template)
+
+        except Exception as e:
+            print(f"Warning: Failed to read template {file}: {str(e)}")
+            return None
 
     def get_template_info(self, template_path: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -345,11 +663,11 @@ class TemplateManager:
         slides = template.get('slides', [])
 
         # Count components by type
-        component_counts = {}
-        for slide in slides:
-            for component in slide.get('components', []):
-                comp_type = component.get('type', 'unknown')
-                component_counts[comp_type] = component_counts.get(comp_type, 0) + 1
+        component_counts = dict(Counter(
+            component.get('type', 'unknown')
+            for slide in slides
+            for component in slide.get('components', ())
+        ))
 
         return {
             'name': metadata.get('name', 'Unknown'),
@@ -425,14 +743,16 @@ class TemplateManager:
         """
         from datetime import datetime
 
+        today = datetime.now().strftime('%Y-%m-%d')
+
         template = {
             'metadata': {
                 'name': name,
                 'description': description,
                 'author': author,
                 'version': '1.0',
-                'created_date': datetime.now().strftime('%Y-%m-%d'),
-                'modified_date': datetime.now().strftime('%Y-%m-%d')
+                'created_date': today,
+                'modified_date': today
             },
             'settings': {
                 'page_size': '16:9',
@@ -483,9 +803,50 @@ class TemplateManager:
             'components': components or []
         }
 
+        self._mark_current_template_modified()
+
         self.current_template['slides'].append(slide)
         return self.current_template
 
+    def add_slides(self, slide_defs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Add several slides to current template in one call.
+
+        Args:
+            slide_defs: List of slide definitions, each with 'name' and
+                        optional 'layout' (default 'blank') and 'components'
+
+        Returns:
+            Updated template
+
+        Example:
+            manager = TemplateManager()
+            template = manager.create_empty_template("Test")
+            manager.add_slides([
+                {'name': 'Title Slide', 'layout': 'title', 'components': [...]},
+                {'name': 'Data Slide', 'components': [...]}
+            ])
+        """
+        if not self.current_template:
+            raise ValueError("No template loaded. Create or load a template first.")
+
+        self._mark_current_template_modified()
+
+        slides = self.current_template['slides']
+        slides.extend(
+            {
+                'name': slide_def['name'],
+                'layout': slide_def.get('layout', 'blank'),
+                'components': slide_def.get('components') or []
+            }
+            for slide_def in slide_defs
+        )
+        return self.current_template
+
+    def _mark_current_template_modified(self) -> None:
+        """Record that the current template is about to be edited in place."""
+        self.template_version += 1
+
     def validate_current_template(self) -> bool:
         """
         Validate the current template.
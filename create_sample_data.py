@@ -2,63 +2,98 @@
 Create sample Excel data files for testing templates
 """
 
-import pandas as pd
+import functools
 import os
-from datetime import datetime, timedelta
-import random
 
-# Create data directory
-os.makedirs('data/samples', exist_ok=True)
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+
+@functools.lru_cache(maxsize=None)
+def _rng():
+    """Single seeded generator shared by all sample-data functions (reproducible runs)"""
+    import numpy as np
+
+    return np.random.default_rng(0)
+
+
+def _write_excel(df, output_path):
+    """Write a DataFrame to Excel, with xlsxwriter when available."""
+    import pandas as pd
+
+    # Create data directory
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    # No constant_memory mode: to_excel writes column by column, and
+    # constant_memory silently drops writes to rows already flushed
+    if xlsxwriter is None:
+        df.to_excel(output_path, index=False)
+    else:
+        with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
+            df.to_excel(writer, index=False)
+
+    # Round-trip check so a writer that loses cells fails loudly
+    written_shape = pd.read_excel(output_path).shape
+    if written_shape != df.shape:
+        raise RuntimeError(
+            f"{output_path} was written with shape {written_shape}, "
+            f"expected {df.shape}"
+        )
 
 
 def create_bsh_sample_data():
     """Create sample BSH media monitoring data."""
     print("Creating BSH sample data...")
 
+    import numpy as np
+    import pandas as pd
+
+    rng = _rng()
     firms = ['BSH', 'Arçelik', 'Vestel', 'Beko', 'Profilo']
     media_types = ['Basın', 'İnternet', 'Televizyon', 'Radyo']
     media_scopes = ['Ulusal', 'Yerel', 'Bölgesel']
     cities = ['İSTANBUL', 'ANKARA', 'İZMİR', 'BURSA', 'ANTALYA', 'ADANA']
 
-    data = []
-
-    for _ in range(100):
-        row = {
-            'Mecra': random.choice(media_types),
-            'Firma': random.choice(firms),
-            'Yayın Tarihi': datetime.now() - timedelta(days=random.randint(1, 30)),
-            'Analiz Tarihi': datetime.now() - timedelta(days=random.randint(0, 5)),
-            'Medya Kapsam': random.choice(media_scopes),
-            'Medya Tür': random.choice(['Gazete', 'Dergi', 'Portal', 'Blog', 'TV', 'Radyo']),
-            'Medya Adı': f'Medya {random.randint(1, 20)}',
-            'Başlık': f'Haber Başlığı {random.randint(1, 100)}',
-            'Sayfa No': random.randint(1, 50),
-            'Beyaz Eşya Olay Açıklama': 'Örnek olay açıklaması',
-            'Beyaz Eşya Ürün Kategorisi': random.choice(['KURUMSAL', 'ÜRÜN', 'HİZMET']),
-            'Beyaz Eşya Ürün Gruplandırması': random.choice(['KURUMSAL', 'ÜRÜN', 'HİZMET']),
-            'Editör': random.choice(['OLUMLU', 'OLUMSUZ', 'NÖTR']),
-            'StxCm': round(random.uniform(1, 100), 2),
-            'Sayfa/Adet': round(random.uniform(0.001, 1.0), 3),
-            'Erişim': random.randint(1000, 100000),
-            'Reklam Eşdeğeri': round(random.uniform(100, 10000), 2),
-            'Medya Tiraj': random.randint(1000, 50000),
-            'Medya Peryod': random.choice(['GÜNLÜK', 'HAFTALIK', 'AYLIK']),
-            'Medya İçerik': random.choice(['SİYASİ', 'EKONOMİ', 'MAGAZIN', 'SPOR']),
-            'Medya Şehir': random.choice(cities),
-            'Bahis Ağırlığı': random.choice(['FİRMAYA ÖZEL', 'KISA BAHİS', 'GENİŞ BAHİS']),
-            'Kupür Tipi': 'HABER',
-            'Görsel Malzeme': random.choice(['DİĞER', 'FOTOĞRAF', 'İNFOGRAFİK']),
-            'Boyut ': random.choice(['KÜÇÜK', 'ORTALAMA', 'BÜYÜK']),
-            'Algı': random.choice(['YÜKSEK', 'ORTA', 'DÜŞÜK']),
-            'Görünürlük': random.choice(['BAŞLIKTA', 'ALTTA', 'İÇERİKTE']),
-            ' Medya Grup Adı': f'Medya Grup {random.randint(1, 10)}',
-            'Net Etki': random.randint(100, 20000)
-        }
-        data.append(row)
-
-    df = pd.DataFrame(data)
+    n = 100
+    now = pd.Timestamp.now()
+
+    # One vectorized draw per column instead of per-row Python calls
+    df = pd.DataFrame({
+        'Mecra': rng.choice(media_types, n),
+        'Firma': rng.choice(firms, n),
+        'Yayın Tarihi': now - pd.to_timedelta(rng.integers(1, 31, n), unit='D'),
+        'Analiz Tarihi': now - pd.to_timedelta(rng.integers(0, 6, n), unit='D'),
+        'Medya Kapsam': rng.choice(media_scopes, n),
+        'Medya Tür': rng.choice(['Gazete', 'Dergi', 'Portal', 'Blog', 'TV', 'Radyo'], n),
+        'Medya Adı': np.char.add('Medya ', rng.integers(1, 21, n).astype(str)),
+        'Başlık': np.char.add('Haber Başlığı ', rng.integers(1, 101, n).astype(str)),
+        'Sayfa No': rng.integers(1, 51, n),
+        'Beyaz Eşya Olay Açıklama': 'Örnek olay açıklaması',
+        'Beyaz Eşya Ürün Kategorisi': rng.choice(['KURUMSAL', 'ÜRÜN', 'HİZMET'], n),
+        'Beyaz Eşya Ürün Gruplandırması': rng.choice(['KURUMSAL', 'ÜRÜN', 'HİZMET'], n),
+        'Editör': rng.choice(['OLUMLU', 'OLUMSUZ', 'NÖTR'], n),
+        'StxCm': rng.uniform(1, 100, n).round(2),
+        'Sayfa/Adet': rng.uniform(0.001, 1.0, n).round(3),
+        'Erişim': rng.integers(1000, 100001, n),
+        'Reklam Eşdeğeri': rng.uniform(100, 10000, n).round(2),
+        'Medya Tiraj': rng.integers(1000, 50001, n),
+        'Medya Peryod': rng.choice(['GÜNLÜK', 'HAFTALIK', 'AYLIK'], n),
+        'Medya İçerik': rng.choice(['SİYASİ', 'EKONOMİ', 'MAGAZIN', 'SPOR'], n),
+        'Medya Şehir': rng.choice(cities, n),
+        'Bahis Ağırlığı': rng.choice(['FİRMAYA ÖZEL', 'KISA BAHİS', 'GENİŞ BAHİS'], n),
+        'Kupür Tipi': 'HABER',
+        'Görsel Malzeme': rng.choice(['DİĞER', 'FOTOĞRAF', 'İNFOGRAFİK'], n),
+        'Boyut ': rng.choice(['KÜÇÜK', 'ORTALAMA', 'BÜYÜK'], n),
+        'Algı': rng.choice(['YÜKSEK', 'ORTA', 'DÜŞÜK'], n),
+        'Görünürlük': rng.choice(['BAŞLIKTA', 'ALTTA', 'İÇERİKTE'], n),
+        ' Medya Grup Adı': np.char.add('Medya Grup ', rng.integers(1, 11, n).astype(str)),
+        'Net Etki': rng.integers(100, 20001, n)
+    })
+
     output_path = 'data/samples/BSH_Sample_Data.xlsx'
-    df.to_excel(output_path, index=False)
+    _write_excel(df, output_path)
     print(f"[OK] Created: {output_path} ({len(df)} rows)")
 
     return df
@@ -68,32 +103,28 @@ def create_sanofi_sample_data():
     """Create sample Sanofi pharmaceutical data."""
     print("\nCreating Sanofi sample data...")
 
+    import pandas as pd
+
+    rng = _rng()
     firms = [
         'SANOFI', 'PFIZER', 'ASTRAZENECA', 'BAYER', 'NOVARTIS',
         'NOVO NORDISK', 'ABDİ İBRAHİM', 'AMGEN', 'ECZACIBAŞI İLAÇ',
         'İLKO', 'ROCHE', 'JOHNSON & JOHNSON'
     ]
 
-    data = []
+    positive = rng.integers(10, 51, len(firms))
+    negative = rng.integers(5, 26, len(firms))
 
-    for firm in firms:
-        positive = random.randint(10, 50)
-        negative = random.randint(5, 25)
-        total = positive + negative
-
-        row = {
-            'FİRMALAR': firm,
-            'OLUMLU': positive,
-            'OLUMSUZ': negative,
-            'TOTAL': total
-        }
-        data.append(row)
-
-    df = pd.DataFrame(data)
+    df = pd.DataFrame({
+        'FİRMALAR': firms,
+        'OLUMLU': positive,
+        'OLUMSUZ': negative,
+        'TOTAL': positive + negative
+    })
     df = df.sort_values('TOTAL', ascending=False).reset_index(drop=True)
 
     output_path = 'data/samples/Sanofi_Sample_Data.xlsx'
-    df.to_excel(output_path, index=False)
+    _write_excel(df, output_path)
     print(f"[OK] Created: {output_path} ({len(df)} rows)")
 
     return df
@@ -103,6 +134,9 @@ def create_socar_sample_data():
     """Create sample SOCAR energy sector data."""
     print("\nCreating SOCAR sample data...")
 
+    import pandas as pd
+
+    rng = _rng()
     categories = [
         'Kurumsal Haberler', 'Ürün ve Hizmetler', 'Sosyal Sorumluluk',
         'Yatırımlar', 'İnsan Kaynakları', 'Çevre ve Enerji',
@@ -116,54 +150,36 @@ def create_socar_sample_data():
 
     media_types = ['Basın', 'İnternet', 'Televizyon', 'Radyo', 'Sosyal Medya']
 
-    data = []
-
-    # Category data
-    for category in categories:
-        row = {
-            'Kategori': category,
-            'Toplam Haber': random.randint(20, 100),
-            'Erişim': random.randint(50000, 500000),
-            'Net Etki': random.randint(5000, 50000),
-            'Bölge': None,
-            'Medya Türü': None,
-            'Algı': None,
-            'Haber Sayısı': None
-        }
-        data.append(row)
-
-    # Regional data
-    for region in regions:
-        row = {
-            'Kategori': None,
-            'Toplam Haber': random.randint(10, 80),
-            'Erişim': random.randint(20000, 300000),
-            'Net Etki': None,
-            'Bölge': region,
-            'Medya Türü': None,
-            'Algı': None,
-            'Haber Sayısı': None
-        }
-        data.append(row)
-
-    # Media type data
-    for media_type in media_types:
-        row = {
-            'Kategori': None,
-            'Toplam Haber': random.randint(30, 120),
-            'Erişim': None,
-            'Net Etki': None,
-            'Bölge': None,
-            'Medya Türü': media_type,
-            'Algı': None,
-            'Haber Sayısı': None
-        }
-        data.append(row)
-
-    df = pd.DataFrame(data)
+    # One column-oriented frame per segment; concat fills the columns a
+    # segment doesn't have with NaN
+    category_df = pd.DataFrame({
+        'Kategori': categories,
+        'Toplam Haber': rng.integers(20, 101, len(categories)),
+        'Erişim': rng.integers(50000, 500001, len(categories)),
+        'Net Etki': rng.integers(5000, 50001, len(categories))
+    })
+
+    regional_df = pd.DataFrame({
+        'Toplam Haber': rng.integers(10, 81, len(regions)),
+        'Erişim': rng.integers(20000, 300001, len(regions)),
+        'Bölge': regions
+    })
+
+    media_df = pd.DataFrame({
+        'Toplam Haber': rng.integers(30, 121, len(media_types)),
+        'Medya Türü': media_types
+    })
+
+    df = pd.concat(
+        [category_df, regional_df, media_df],
+        ignore_index=True
+    ).reindex(columns=[
+        'Kategori', 'Toplam Haber', 'Erişim', 'Net Etki',
+        'Bölge', 'Medya Türü', 'Algı', 'Haber Sayısı'
+    ])
 
     output_path = 'data/samples/SOCAR_Sample_Data.xlsx'
-    df.to_excel(output_path, index=False)
+    _write_excel(df, output_path)
     print(f"[OK] Created: {output_path} ({len(df)} rows)")
 
     return df
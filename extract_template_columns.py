@@ -7,40 +7,83 @@ import json
 import os
 from typing import Set, List
 
+try:
+    # Prefer the C-accelerated yajl2 backend when it is available
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
 
-def extract_columns_from_template(template_path: str) -> Set[str]:
-    """Extract all column names used in a template"""
-    columns = set()
 
-    try:
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_data = json.load(f)
+# data_source keys that hold column names
+_COL_KEYS = frozenset((
+    'x_column', 'y_column', 'series_column',
+    'compare_column', 'sort_by', 'columns',
+    'metric_columns'
+))
 
-        slides = template_data.get('slides', [])
 
-        for slide in slides:
-            components = slide.get('components', [])
+def _load_template_data(template_path: str):
+    """Parse a template file into a dict (used when ijson isn't installed)"""
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-            for component in components:
-                data_source = component.get('data_source', {})
 
-                if not data_source:
-                    continue
+def _get_template_name(template_path: str, default: str) -> str:
+    """Get the template name: metadata.name (PPTGenerator format) or top-level name"""
+    if ijson is not None:
+        # Stop at the first name string - metadata comes before slides,
+        # so the slide list is never parsed
+        with open(template_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if event == 'string' and prefix in ('metadata.name', 'name'):
+                    return value
+        return default
+
+    template_data = _load_template_data(template_path)
+
+    if 'metadata' in template_data:
+        return template_data['metadata'].get('name', default)
+    return template_data.get('name', default)
+
+
+def _iter_data_sources(template_path: str):
+    """Yield the data_source of every component in a template"""
+    if ijson is not None:
+        # Stream only slides[*].components[*].data_source - metadata,
+        # settings and styling are never built into Python objects
+        with open(template_path, 'rb') as f:
+            yield from ijson.items(f, 'slides.item.components.item.data_source')
+        return
 
-                # Extract various column types
-                column_keys = [
-                    'x_column', 'y_column', 'series_column',
-                    'compare_column', 'sort_by', 'columns',
-                    'metric_columns'
-                ]
+    template_data = _load_template_data(template_path)
 
-                for key in column_keys:
-                    value = data_source.get(key)
+    for slide in template_data.get('slides', []):
+        for component in slide.get('components', []):
+            yield component.get('data_source', {})
+
+
+def extract_columns_from_template(template_path: str) -> Set[str]:
+    """Extract all column names used in a template"""
+    columns = set()
+
+    try:
+        for data_source in _iter_data_sources(template_path):
+            if not data_source:
+                continue
+
+            # Single pass over the keys actually present
+            for key, value in data_source.items():
+                if key not in _COL_KEYS:
+                    continue
 
-                    if isinstance(value, str):
-                        columns.add(value)
-                    elif isinstance(value, list):
-                        columns.update(value)
+                value_type = type(value)
+                if value_type is str:
+                    columns.add(value)
+                elif value_type is list:
+                    columns.update(value)
 
         return columns
 
@@ -65,14 +108,8 @@ def analyze_all_templates():
 
         # Get template name
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_data = json.load(f)
-
-            if 'metadata' in template_data:
-                template_name = template_data['metadata'].get('name', filename[:-5])
-            else:
-                template_name = template_data.get('name', filename[:-5])
-        except:
+            template_name = _get_template_name(template_path, filename[:-5])
+        except Exception:
             template_name = filename[:-5]
 
         # Extract columns
@@ -6,13 +6,21 @@ Simple 4-step workflow: Import Data → Select Template → Prepare Report → D
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QLineEdit, QFileDialog, QComboBox, QProgressBar,
-    QGraphicsView, QGraphicsScene, QMessageBox, QFrame
+    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QMessageBox, QFrame,
+    QDialog, QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, QRectF, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QPalette, QColor, QPixmap, QPainter
+from PyQt6.QtCore import (
+    Qt, QRectF, QThread, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QPalette, QColor, QPixmap, QPainter, QImage
+import functools
 import os
 from datetime import datetime
 
+from gui.utils import (
+    CONFIGS_SUBPATH, default_config_dir, load_json_file
+)
+
 # Import core PPTGenerator
 try:
     from core import PPTGenerator
@@ -22,15 +30,26 @@ except ImportError:
     print("Warning: Core engine not available. Using simulation mode.")
 
 
-class ReportGeneratorThread(QThread):
-    """Background thread for report generation"""
+class ReportGeneratorSignals(QObject):
+    """Signals emitted by ReportGeneratorJob"""
     progress = pyqtSignal(int, str)  # (percentage, message)
+    slide_ready = pyqtSignal(int, QImage)  # (slide index, rendered preview)
     finished = pyqtSignal(bool, str, str)  # (success, message, output_path)
 
-    def __init__(self, excel_path, template_path, output_path, variables):
+
+# Width of pre-rendered slide preview images in pixels
+PREVIEW_WIDTH = 960
+
+
+class ReportGeneratorJob(QRunnable):
+    """Report generation job, run on the window's QThreadPool"""
+
+    def __init__(self, excel_path, template_path, output_path, variables, template_data=None):
         super().__init__()
+        self.signals = ReportGeneratorSignals()
         self.excel_path = excel_path
         self.template_path = template_path
+        self.template_data = template_data
         self.output_path = output_path
         self.variables = variables
 
@@ -39,41 +58,212 @@ class ReportGeneratorThread(QThread):
         try:
             if CORE_AVAILABLE:
                 # Use actual PPTGenerator
-                self.progress.emit(10, "Initializing generator...")
+                self.signals.progress.emit(10, "Initializing generator...")
                 generator = PPTGenerator()
 
-                self.progress.emit(20, "Loading template...")
-                generator.load_template(self.template_path)
+                self.signals.progress.emit(20, "Loading template...")
+                if self.template_data is not None:
+                    # Already parsed when the template was selected
+                    generator.load_template_dict(self.template_data, self.template_path)
+                else:
+                    generator.load_template(self.template_path)
 
-                self.progress.emit(40, "Loading data...")
+                self.signals.progress.emit(40, "Loading data...")
                 generator.load_data(self.excel_path)
 
-                self.progress.emit(60, "Setting variables...")
+                self.signals.progress.emit(60, "Setting variables...")
                 generator.set_variables(self.variables)
 
-                self.progress.emit(80, "Generating PowerPoint...")
+                self.signals.progress.emit(80, "Generating PowerPoint...")
                 output = generator.generate(self.output_path)
 
-                self.progress.emit(100, "Complete!")
-                self.finished.emit(True, "Report generated successfully!", output)
+                self.signals.progress.emit(90, "Rendering previews...")
+                self.render_previews(output)
+
+                self.signals.progress.emit(100, "Complete!")
+                self.signals.finished.emit(True, "Report generated successfully!", output)
             else:
                 # Simulation mode
                 for i in range(1, 101, 10):
-                    self.progress.emit(i, f"Generating slides... {i}% complete")
-                    self.msleep(200)
+                    self.signals.progress.emit(i, f"Generating slides... {i}% complete")
+                    QThread.msleep(200)
 
-                self.finished.emit(True, "Report generated (simulation mode)!", self.output_path)
+                self.signals.finished.emit(True, "Report generated (simulation mode)!", self.output_path)
 
         except Exception as e:
             import traceback
             error_msg = f"Error: {str(e)}\n\n{traceback.format_exc()}"
-            self.finished.emit(False, error_msg, "")
+            self.signals.finished.emit(False, error_msg, "")
+
+    def render_previews(self, pptx_path):
+        """
+        Rasterize each slide of the generated deck into a QImage.
+
+        Runs on the worker thread (QImage painting is thread-safe, unlike
+        QPixmap). Draws shape outlines and their text - a layout preview,
+        not a full PowerPoint render. Failures only skip previews.
+        """
+        try:
+            from pptx import Presentation
+            prs = Presentation(pptx_path)
+        except Exception as e:
+            print(f"Warning: Could not render slide previews: {e}")
+            return
+
+        scale = PREVIEW_WIDTH / prs.slide_width
+        height = int(prs.slide_height * scale)
+        font = QFont("Segoe UI", 9)
+
+        for index, slide in enumerate(prs.slides):
+            image = QImage(PREVIEW_WIDTH, height, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(QColor("#FFFFFF"))
+
+            painter = QPainter(image)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setFont(font)
+
+            for shape in slide.shapes:
+                if None in (shape.left, shape.top, shape.width, shape.height):
+                    continue
+
+                rect = QRectF(
+                    shape.left * scale, shape.top * scale,
+                    shape.width * scale, shape.height * scale
+                )
+                painter.setPen(QColor("#D1D5DB"))
+                painter.drawRect(rect)
+
+                if shape.has_text_frame and shape.text_frame.text:
+                    painter.setPen(QColor("#1F2937"))
+                    painter.drawText(
+                        rect.adjusted(4, 4, -4, -4),
+                        Qt.TextFlag.TextWordWrap,
+                        shape.text_frame.text
+                    )
+
+            painter.end()
+            self.signals.slide_ready.emit(index, image)
+
+
+# Single stylesheet for the whole window, parsed once in init_ui. Widgets
+# pick up their rules by objectName; step buttons also by their "step"
+# property (completed / active / pending).
+_MAIN_QSS = """
+    QLabel#appTitle {
+        color: #1F2937;
+    }
+    QPushButton#templateBuilderButton {
+        background-color: #F59E0B;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 20px;
+    }
+    QPushButton#templateBuilderButton:hover {
+        background-color: #D97706;
+    }
+    QPushButton#stepButton {
+        border-radius: 8px;
+        padding: 10px;
+        text-align: left;
+    }
+    QPushButton#stepButton[step="completed"] {
+        background-color: #10B981;
+        color: white;
+        border: 2px solid #059669;
+    }
+    QPushButton#stepButton[step="completed"]:hover {
+        background-color: #059669;
+    }
+    QPushButton#stepButton[step="active"] {
+        background-color: #2563EB;
+        color: white;
+        border: 2px solid #1D4ED8;
+    }
+    QPushButton#stepButton[step="active"]:hover {
+        background-color: #1D4ED8;
+    }
+    QPushButton#stepButton[step="pending"] {
+        background-color: #F9FAFB;
+        color: #6B7280;
+        border: 2px solid #E5E7EB;
+    }
+    QPushButton#stepButton[step="pending"]:hover {
+        background-color: #F3F4F6;
+    }
+    QFrame#separator {
+        background-color: #E5E7EB;
+    }
+    QLineEdit#reportNameInput {
+        padding: 8px;
+        border: 2px solid #E5E7EB;
+        border-radius: 4px;
+        background-color: white;
+    }
+    QLineEdit#reportNameInput:focus {
+        border: 2px solid #2563EB;
+    }
+    QFrame#previewFrame, QFrame#previewFrame QFrame {
+        background-color: white;
+        border: 2px solid #E5E7EB;
+        border-radius: 8px;
+    }
+    QFrame#previewFrame QGraphicsView#slideView {
+        border: none;
+        border-radius: 0px;
+        background-color: #F9FAFB;
+    }
+    QPushButton#controlButton, QPushButton#deleteSlideButton,
+    QPushButton#addSlideButton {
+        background-color: #2563EB;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 10px 20px;
+        font-weight: bold;
+    }
+    QPushButton#controlButton:hover {
+        background-color: #1D4ED8;
+    }
+    QPushButton#deleteSlideButton {
+        background-color: #EF4444;
+    }
+    QPushButton#deleteSlideButton:hover {
+        background-color: #DC2626;
+    }
+    QPushButton#addSlideButton {
+        background-color: #10B981;
+    }
+    QPushButton#addSlideButton:hover {
+        background-color: #059669;
+    }
+    QPushButton#controlButton:disabled, QPushButton#deleteSlideButton:disabled,
+    QPushButton#addSlideButton:disabled {
+        background-color: #D1D5DB;
+        color: #9CA3AF;
+    }
+"""
+
+
+@functools.cache
+def _template_builder_cls():
+    """Import TemplateBuilder on first use (keeps startup light)"""
+    from gui.template_builder import TemplateBuilder
+    return TemplateBuilder
+
+
+@functools.lru_cache(maxsize=None)
+def _font(family, size, weight=QFont.Weight.Normal):
+    """Get a shared QFont for (family, size, weight)"""
+    return QFont(family, size, weight)
 
 
 class StepButton(QPushButton):
     """Custom button for workflow steps"""
     def __init__(self, step_number, title, description):
         super().__init__()
+        self._initialized = False
+        self._current_step = None
         self.step_number = step_number
         self.title = title
         self.description = description
@@ -82,11 +272,15 @@ class StepButton(QPushButton):
 
     def setup_ui(self):
         """Setup button appearance"""
+        # Text and font first so the size constraints invalidate layout once
+        self.setText("\n".join((f"{self.step_number}. {self.title}", self.description)))
+        self.setFont(_font("Segoe UI", 10))
         self.setFixedHeight(100)
         self.setMinimumWidth(200)
-        self.setText(f"{self.step_number}. {self.title}\n{self.description}")
-        self.setFont(QFont("Segoe UI", 10))
-        self.update_style()
+        self.setObjectName("stepButton")
+
+        # Initial style is applied by the owner once construction is done
+        self._initialized = True
 
     def mark_completed(self):
         """Mark step as completed"""
@@ -99,52 +293,24 @@ class StepButton(QPushButton):
 
     def update_style(self, active=False):
         """Update button style based on state"""
+        if not self._initialized:
+            return
+
         if self.completed:
-            # Green for completed
-            style = """
-                QPushButton {
-                    background-color: #10B981;
-                    color: white;
-                    border: 2px solid #059669;
-                    border-radius: 8px;
-                    padding: 10px;
-                    text-align: left;
-                }
-                QPushButton:hover {
-                    background-color: #059669;
-                }
-            """
+            step = "completed"
         elif active:
-            # Blue for active
-            style = """
-                QPushButton {
-                    background-color: #2563EB;
-                    color: white;
-                    border: 2px solid #1D4ED8;
-                    border-radius: 8px;
-                    padding: 10px;
-                    text-align: left;
-                }
-                QPushButton:hover {
-                    background-color: #1D4ED8;
-                }
-            """
+            step = "active"
         else:
-            # Gray for pending
-            style = """
-                QPushButton {
-                    background-color: #F9FAFB;
-                    color: #6B7280;
-                    border: 2px solid #E5E7EB;
-                    border-radius: 8px;
-                    padding: 10px;
-                    text-align: left;
-                }
-                QPushButton:hover {
-                    background-color: #F3F4F6;
-                }
-            """
-        self.setStyleSheet(style)
+            step = "pending"
+
+        # Repolishing re-resolves the window stylesheet for this button
+        if step == self._current_step:
+            return
+
+        self._current_step = step
+        self.setProperty("step", step)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
 
 class MainWindow(QMainWindow):
@@ -155,17 +321,38 @@ class MainWindow(QMainWindow):
         self.excel_path = None
         self.template_name = None
         self.template_path = None
+        self._template_cfg = None
         self.generated_slides = []
+        # Deleted slides are masked out instead of shifting the list
+        self._alive = bytearray()
+        self._alive_count = 0
+        self._slide_images = []
         self.current_slide_index = 0
 
+        # Single worker reused for every report generation run
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        # Progress updates are coalesced so at most one repaint per frame
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Template scan cache, invalidated when the directory listing or any
+        # template file's mtime changes
+        self._tpl_cache = {"signature": None, "map": {}}
+
         # Load templates dynamically from templates/configs/
-        self.template_map = self.load_templates()
+        self.template_map = self._load_templates_cached()
 
         self.init_ui()
 
     def init_ui(self):
         """Initialize user interface"""
         self.setMinimumSize(1024, 768)
+        self.setStyleSheet(_MAIN_QSS)
 
         # Create central widget
         central_widget = QWidget()
@@ -192,28 +379,17 @@ class MainWindow(QMainWindow):
 
         # App title
         title = QLabel("📊 ReportForge - Report Generator")
-        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-        title.setStyleSheet("color: #1F2937;")
+        title.setFont(_font("Segoe UI", 16, QFont.Weight.Bold))
+        title.setObjectName("appTitle")
         header_layout.addWidget(title)
 
         header_layout.addStretch()
 
         # Template Builder button
         template_builder_btn = QPushButton("🛠️ Create/Edit Templates")
-        template_builder_btn.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        template_builder_btn.setFont(_font("Segoe UI", 11, QFont.Weight.Bold))
         template_builder_btn.setFixedHeight(40)
-        template_builder_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F59E0B;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-            }
-            QPushButton:hover {
-                background-color: #D97706;
-            }
-        """)
+        template_builder_btn.setObjectName("templateBuilderButton")
         template_builder_btn.clicked.connect(self.open_template_builder)
         header_layout.addWidget(template_builder_btn)
 
@@ -231,7 +407,7 @@ class MainWindow(QMainWindow):
 
         # Arrow
         arrow1 = QLabel("→")
-        arrow1.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
+        arrow1.setFont(_font("Segoe UI", 24, QFont.Weight.Bold))
         arrow1.setAlignment(Qt.AlignmentFlag.AlignCenter)
         steps_layout.addWidget(arrow1)
 
@@ -242,7 +418,7 @@ class MainWindow(QMainWindow):
 
         # Arrow
         arrow2 = QLabel("→")
-        arrow2.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
+        arrow2.setFont(_font("Segoe UI", 24, QFont.Weight.Bold))
         arrow2.setAlignment(Qt.AlignmentFlag.AlignCenter)
         steps_layout.addWidget(arrow2)
 
@@ -253,7 +429,7 @@ class MainWindow(QMainWindow):
 
         # Arrow
         arrow3 = QLabel("→")
-        arrow3.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
+        arrow3.setFont(_font("Segoe UI", 24, QFont.Weight.Bold))
         arrow3.setAlignment(Qt.AlignmentFlag.AlignCenter)
         steps_layout.addWidget(arrow3)
 
@@ -264,6 +440,10 @@ class MainWindow(QMainWindow):
 
         layout.addLayout(steps_layout)
 
+        # Apply each step's initial style once, after construction
+        for step_btn in (self.step1_btn, self.step2_btn, self.step3_btn, self.step4_btn):
+            step_btn.update_style()
+
         # Progress bar (hidden initially)
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -275,7 +455,7 @@ class MainWindow(QMainWindow):
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
         line.setFrameShadow(QFrame.Shadow.Sunken)
-        line.setStyleSheet("background-color: #E5E7EB;")
+        line.setObjectName("separator")
         layout.addWidget(line)
 
     def _create_report_name_field(self, layout):
@@ -283,24 +463,14 @@ class MainWindow(QMainWindow):
         name_layout = QHBoxLayout()
 
         label = QLabel("Report name:")
-        label.setFont(QFont("Segoe UI", 11))
+        label.setFont(_font("Segoe UI", 11))
         name_layout.addWidget(label)
 
         self.report_name_input = QLineEdit()
         self.report_name_input.setPlaceholderText("Enter report name...")
         self.report_name_input.setText(f"Report_{datetime.now().strftime('%Y%m%d')}")
-        self.report_name_input.setFont(QFont("Segoe UI", 11))
-        self.report_name_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 2px solid #E5E7EB;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border: 2px solid #2563EB;
-            }
-        """)
+        self.report_name_input.setFont(_font("Segoe UI", 11))
+        self.report_name_input.setObjectName("reportNameInput")
         name_layout.addWidget(self.report_name_input)
 
         layout.addLayout(name_layout)
@@ -310,18 +480,12 @@ class MainWindow(QMainWindow):
         # Preview container
         preview_frame = QFrame()
         preview_frame.setFrameShape(QFrame.Shape.Box)
-        preview_frame.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 2px solid #E5E7EB;
-                border-radius: 8px;
-            }
-        """)
+        preview_frame.setObjectName("previewFrame")
         preview_layout = QVBoxLayout(preview_frame)
 
         # Slide counter
         self.slide_counter = QLabel("Slide ... of ...")
-        self.slide_counter.setFont(QFont("Segoe UI", 10))
+        self.slide_counter.setFont(_font("Segoe UI", 10))
         self.slide_counter.setAlignment(Qt.AlignmentFlag.AlignCenter)
         preview_layout.addWidget(self.slide_counter)
 
@@ -330,7 +494,16 @@ class MainWindow(QMainWindow):
         self.slide_scene = QGraphicsScene()
         self.slide_view.setScene(self.slide_scene)
         self.slide_view.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.slide_view.setStyleSheet("border: none; background-color: #F9FAFB;")
+        self.slide_view.setObjectName("slideView")
+
+        # Single long-lived text item; updated in place on every navigation
+        self._slide_text_item = self.slide_scene.addText("")
+        self._slide_text_default_color = self._slide_text_item.defaultTextColor()
+
+        # Single pixmap item for pre-rendered slide images (hidden until used)
+        self._pix_item = QGraphicsPixmapItem()
+        self._pix_item.setVisible(False)
+        self.slide_scene.addItem(self._pix_item)
 
         # Show placeholder message
         self.show_placeholder_message()
@@ -345,77 +518,74 @@ class MainWindow(QMainWindow):
 
         # Previous button
         self.prev_btn = QPushButton("◄ Previous")
-        self.prev_btn.setFont(QFont("Segoe UI", 10))
+        self.prev_btn.setFont(_font("Segoe UI", 10))
         self.prev_btn.setEnabled(False)
         self.prev_btn.clicked.connect(self.previous_slide)
-        self.prev_btn.setStyleSheet(self._get_button_style())
+        self.prev_btn.setObjectName("controlButton")
         controls_layout.addWidget(self.prev_btn)
 
         # Edit Slide button
         self.edit_btn = QPushButton("Edit Slide")
-        self.edit_btn.setFont(QFont("Segoe UI", 10))
+        self.edit_btn.setFont(_font("Segoe UI", 10))
         self.edit_btn.setEnabled(False)
         self.edit_btn.clicked.connect(self.edit_slide)
-        self.edit_btn.setStyleSheet(self._get_button_style())
+        self.edit_btn.setObjectName("controlButton")
         controls_layout.addWidget(self.edit_btn)
 
         # Delete Slide button
         self.delete_btn = QPushButton("Delete Slide")
-        self.delete_btn.setFont(QFont("Segoe UI", 10))
+        self.delete_btn.setFont(_font("Segoe UI", 10))
         self.delete_btn.setEnabled(False)
         self.delete_btn.clicked.connect(self.delete_slide)
-        self.delete_btn.setStyleSheet(self._get_button_style("#EF4444", "#DC2626"))
+        self.delete_btn.setObjectName("deleteSlideButton")
         controls_layout.addWidget(self.delete_btn)
 
         # Add Slide button
         self.add_btn = QPushButton("Add Slide")
-        self.add_btn.setFont(QFont("Segoe UI", 10))
+        self.add_btn.setFont(_font("Segoe UI", 10))
         self.add_btn.setEnabled(False)
         self.add_btn.clicked.connect(self.add_slide)
-        self.add_btn.setStyleSheet(self._get_button_style("#10B981", "#059669"))
+        self.add_btn.setObjectName("addSlideButton")
         controls_layout.addWidget(self.add_btn)
 
         # Next button
         self.next_btn = QPushButton("Next ►")
-        self.next_btn.setFont(QFont("Segoe UI", 10))
+        self.next_btn.setFont(_font("Segoe UI", 10))
         self.next_btn.setEnabled(False)
         self.next_btn.clicked.connect(self.next_slide)
-        self.next_btn.setStyleSheet(self._get_button_style())
+        self.next_btn.setObjectName("controlButton")
         controls_layout.addWidget(self.next_btn)
 
         layout.addLayout(controls_layout)
 
-    def _get_button_style(self, bg_color="#2563EB", hover_color="#1D4ED8"):
-        """Get button stylesheet"""
-        return f"""
-            QPushButton {{
-                background-color: {bg_color};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-            }}
-            QPushButton:disabled {{
-                background-color: #D1D5DB;
-                color: #9CA3AF;
-            }}
-        """
-
     def show_placeholder_message(self):
         """Show placeholder message in slide preview"""
-        self.slide_scene.clear()
-        text = self.slide_scene.addText(
-            "After the report is prepared,\nthe slides will be shown here\n"
-            "page by page. The user will be\nable to edit the pages too.",
-            QFont("Segoe UI", 14)
-        )
-        text.setDefaultTextColor(QColor("#EF4444"))
-        text_rect = text.boundingRect()
-        text.setPos(-text_rect.width()/2, -text_rect.height()/2)
+        self.slide_view.setUpdatesEnabled(False)
+        try:
+            self._set_preview_text(
+                "After the report is prepared,\nthe slides will be shown here\n"
+                "page by page. The user will be\nable to edit the pages too.",
+                _font("Segoe UI", 14),
+                QColor("#EF4444")
+            )
+        finally:
+            self._end_preview_update()
+
+    def _end_preview_update(self):
+        """Re-enable preview updates and repaint the viewport once"""
+        self.slide_view.setUpdatesEnabled(True)
+        self.slide_view.viewport().update()
+
+    def _set_preview_text(self, text, font, color):
+        """Update the preview text item in place and center it"""
+        self._pix_item.setVisible(False)
+        item = self._slide_text_item
+        item.setVisible(True)
+        item.setFont(font)
+        item.setDefaultTextColor(color)
+        item.setPlainText(text)
+        text_rect = item.boundingRect()
+        item.setPos(-text_rect.width()/2, -text_rect.height()/2)
 
     # Step 1: Import Data
     def import_data(self):
@@ -445,8 +615,6 @@ class MainWindow(QMainWindow):
             return
 
         # Create template selection dialog
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QDialogButtonBox
-
         dialog = QDialog(self)
         dialog.setWindowTitle("Select Template")
         dialog.setMinimumWidth(400)
@@ -454,11 +622,11 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(dialog)
 
         label = QLabel("Choose a template:")
-        label.setFont(QFont("Segoe UI", 11))
+        label.setFont(_font("Segoe UI", 11))
         layout.addWidget(label)
 
         template_combo = QComboBox()
-        template_combo.setFont(QFont("Segoe UI", 10))
+        template_combo.setFont(_font("Segoe UI", 10))
 
         # Load templates dynamically from templates/configs/
         template_items = []
@@ -508,6 +676,9 @@ class MainWindow(QMainWindow):
                     )
                     return
 
+                # Parsed when the report is prepared, so later edits are seen
+                self._template_cfg = None
+
                 self.step2_btn.mark_completed()
                 self.step3_btn.mark_active()
                 QMessageBox.information(
@@ -540,7 +711,6 @@ class MainWindow(QMainWindow):
         output_path = os.path.join(output_dir, f"{report_name}.pptx")
 
         # Prepare variables for text substitution
-        from datetime import datetime
         now = datetime.now()
         variables = {
             'month': now.strftime('%B'),  # Full month name
@@ -553,48 +723,74 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        # Start generation thread
-        self.generator_thread = ReportGeneratorThread(
+        # Previews arrive from the worker via slide_ready
+        self._slide_images = []
+
+        # Parse at generation time so edits made since selection are
+        # picked up; each job gets its own dict
+        try:
+            self._template_cfg = load_json_file(self.template_path)
+        except Exception:
+            self._template_cfg = None
+
+        # Queue generation job on the worker pool
+        self.generator_job = ReportGeneratorJob(
             self.excel_path,
             self.template_path,
             output_path,
-            variables
+            variables,
+            template_data=self._template_cfg
         )
-        self.generator_thread.progress.connect(self.update_progress)
-        self.generator_thread.finished.connect(self.generation_finished)
-        self.generator_thread.start()
+        self.generator_job.signals.progress.connect(self.update_progress)
+        self.generator_job.signals.slide_ready.connect(self.store_slide_image)
+        self.generator_job.signals.finished.connect(self.generation_finished)
+        self._pool.start(self.generator_job)
 
     def update_progress(self, percentage, message):
-        """Update progress bar"""
+        """Queue a progress bar update (applied on the next timer tick)"""
+        self._pending_progress = (percentage, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Apply the latest queued progress update"""
+        if self._pending_progress is None:
+            return
+
+        percentage, message = self._pending_progress
+        self._pending_progress = None
         self.progress_bar.setValue(percentage)
         self.progress_bar.setFormat(message)
 
+    def store_slide_image(self, index, image):
+        """Keep a slide preview rendered by the worker"""
+        if index >= len(self._slide_images):
+            self._slide_images.extend([None] * (index + 1 - len(self._slide_images)))
+        self._slide_images[index] = image
+
     def generation_finished(self, success, message, output_path):
         """Handle report generation completion"""
+        self._progress_timer.stop()
+        self._pending_progress = None
         self.progress_bar.setVisible(False)
 
         if success:
             # Store the output path
             self.output_path = output_path
 
-            # Get actual slide count from generated PowerPoint
-            try:
-                from pptx import Presentation
-                prs = Presentation(output_path)
-                slide_count = len(prs.slides)
-                self.generated_slides = [f"Slide {i}" for i in range(1, slide_count + 1)]
-            except Exception as e:
-                print(f"Warning: Could not read slide count from PPTX: {e}")
-                # Fallback to reading template to estimate
+            # The worker emits one preview per generated slide before finishing
+            if self._slide_images:
+                self._set_slides(len(self._slide_images))
+            else:
+                # No previews (simulation mode or render failure) - estimate
+                # from the template
                 try:
-                    import json
-                    with open(self.template_path, 'r', encoding='utf-8') as f:
-                        template_data = json.load(f)
+                    template_data = self._template_cfg or load_json_file(self.template_path)
                     slide_count = len(template_data.get('slides', []))
-                    self.generated_slides = [f"Slide {i}" for i in range(1, slide_count + 1)]
+                    self._set_slides(slide_count)
                 except Exception:
                     # Last resort fallback
-                    self.generated_slides = ["Slide 1"]
+                    self._set_slides(1)
 
             self.current_slide_index = 0
 
@@ -613,27 +809,47 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.critical(self, "Error", message)
 
+    def _set_slides(self, slide_count):
+        """Reset the slide list and mark every slide as alive"""
+        self.generated_slides = [f"Slide {i}" for i in range(1, slide_count + 1)]
+        self._alive = bytearray(b"\x01") * slide_count
+        self._alive_count = slide_count
+
+    def _slide_number(self, index):
+        """1-based position of a slide among the slides not deleted"""
+        return self._alive.count(1, 0, index) + 1
+
     def show_slide(self, index):
         """Display slide at given index"""
-        if 0 <= index < len(self.generated_slides):
+        if 0 <= index < len(self.generated_slides) and self._alive[index]:
             self.current_slide_index = index
             self.slide_counter.setText(
-                f"Slide {index + 1} of {len(self.generated_slides)}"
+                f"Slide {self._slide_number(index)} of {self._alive_count}"
             )
 
-            # TODO: Render actual slide content
-            self.slide_scene.clear()
-            text = self.slide_scene.addText(
-                f"{self.generated_slides[index]}\n\n"
-                f"[Preview of slide content will appear here]",
-                QFont("Segoe UI", 16)
-            )
-            text_rect = text.boundingRect()
-            text.setPos(-text_rect.width()/2, -text_rect.height()/2)
+            # Batch the scene mutations into a single viewport repaint
+            self.slide_view.setUpdatesEnabled(False)
+            try:
+                # Pre-rendered image if the worker produced one
+                image = self._slide_images[index] if index < len(self._slide_images) else None
+                if image is not None:
+                    self._slide_text_item.setVisible(False)
+                    self._pix_item.setPixmap(QPixmap.fromImage(image))
+                    self._pix_item.setOffset(-image.width() / 2, -image.height() / 2)
+                    self._pix_item.setVisible(True)
+                else:
+                    self._set_preview_text(
+                        f"{self.generated_slides[index]}\n\n"
+                        f"[Preview of slide content will appear here]",
+                        _font("Segoe UI", 16),
+                        self._slide_text_default_color
+                    )
+            finally:
+                self._end_preview_update()
 
             # Update navigation buttons
-            self.prev_btn.setEnabled(index > 0)
-            self.next_btn.setEnabled(index < len(self.generated_slides) - 1)
+            self.prev_btn.setEnabled(self._alive.rfind(1, 0, index) != -1)
+            self.next_btn.setEnabled(self._alive.find(1, index + 1) != -1)
 
     def enable_slide_controls(self, enabled):
         """Enable/disable slide control buttons"""
@@ -643,18 +859,18 @@ class MainWindow(QMainWindow):
 
     def previous_slide(self):
         """Navigate to previous slide"""
-        self.show_slide(self.current_slide_index - 1)
+        self.show_slide(self._alive.rfind(1, 0, self.current_slide_index))
 
     def next_slide(self):
         """Navigate to next slide"""
-        self.show_slide(self.current_slide_index + 1)
+        self.show_slide(self._alive.find(1, self.current_slide_index + 1))
 
     def edit_slide(self):
         """Edit current slide"""
         QMessageBox.information(
             self,
             "Edit Slide",
-            f"Editing slide {self.current_slide_index + 1}\n\n"
+            f"Editing slide {self._slide_number(self.current_slide_index)}\n\n"
             "Slide editing functionality will be implemented here."
         )
 
@@ -663,16 +879,23 @@ class MainWindow(QMainWindow):
         reply = QMessageBox.question(
             self,
             "Delete Slide",
-            f"Are you sure you want to delete slide {self.current_slide_index + 1}?",
+            f"Are you sure you want to delete slide "
+            f"{self._slide_number(self.current_slide_index)}?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            del self.generated_slides[self.current_slide_index]
-            if self.current_slide_index >= len(self.generated_slides):
-                self.current_slide_index = len(self.generated_slides) - 1
-            if self.generated_slides:
-                self.show_slide(self.current_slide_index)
+            index = self.current_slide_index
+            self._alive[index] = 0
+            self._alive_count -= 1
+
+            # Move to the next surviving slide, or the previous one at the end
+            target = self._alive.find(1, index + 1)
+            if target == -1:
+                target = self._alive.rfind(1, 0, index)
+
+            if target != -1:
+                self.show_slide(target)
             else:
                 self.show_placeholder_message()
                 self.enable_slide_controls(False)
@@ -689,7 +912,7 @@ class MainWindow(QMainWindow):
     # Step 4: Download Report
     def download_report(self):
         """Download generated PowerPoint report"""
-        if not self.generated_slides:
+        if not self._alive_count:
             QMessageBox.warning(
                 self,
                 "No Report",
@@ -711,14 +934,14 @@ class MainWindow(QMainWindow):
                 self,
                 "Download Complete",
                 f"Report saved successfully to:\n{file_path}\n\n"
-                f"Total slides: {len(self.generated_slides)}"
+                f"Total slides: {self._alive_count}"
             )
             self.step4_btn.mark_completed()
 
     # Template Builder Integration
     def open_template_builder(self):
         """Open Template Builder window"""
-        from gui.template_builder import TemplateBuilder
+        TemplateBuilder = _template_builder_cls()
 
         # Create and show Template Builder window in full-screen
         self.template_builder_window = TemplateBuilder()
@@ -733,40 +956,39 @@ class MainWindow(QMainWindow):
         Load all templates from templates/configs/ directory.
         Returns a dictionary mapping display names to file paths.
         """
-        import os
-        import json
-
         template_map = {}
-        templates_dir = os.path.join(os.getcwd(), "templates", "configs")
+        templates_dir = default_config_dir()
 
-        # Create directory if it doesn't exist
-        os.makedirs(templates_dir, exist_ok=True)
+        # Nothing to scan until the Template Builder saves the first template
+        if not os.path.isdir(templates_dir):
+            return template_map
 
         # Scan for JSON files
         try:
-            for filename in os.listdir(templates_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(templates_dir, filename)
-
-                    # Read template to get display name
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            template_data = json.load(f)
-
-                        # Get name from metadata (PPTGenerator format) or top-level (Template Builder format)
-                        if 'metadata' in template_data:
-                            display_name = template_data['metadata'].get('name', filename[:-5])
-                        else:
-                            display_name = template_data.get('name', filename[:-5])
-
-                        # Use relative path
-                        relative_path = os.path.join("templates", "configs", filename)
-                        template_map[display_name] = relative_path
-
-                    except Exception as e:
-                        print(f"Error loading template {filename}: {e}")
-                        # Use filename as fallback
-                        template_map[filename[:-5]] = os.path.join("templates", "configs", filename)
+            with os.scandir(templates_dir) as it:
+                entries = [entry for entry in it if entry.name.endswith('.json')]
+
+            for entry in entries:
+                filename = entry.name
+
+                # Read template to get display name
+                try:
+                    template_data = load_json_file(entry.path)
+
+                    # Get name from metadata (PPTGenerator format) or top-level (Template Builder format)
+                    if 'metadata' in template_data:
+                        display_name = template_data['metadata'].get('name', filename[:-5])
+                    else:
+                        display_name = template_data.get('name', filename[:-5])
+
+                    # Use relative path
+                    relative_path = os.path.join(*CONFIGS_SUBPATH, filename)
+                    template_map[display_name] = relative_path
+
+                except Exception as e:
+                    print(f"Error loading template {filename}: {e}")
+                    # Use filename as fallback
+                    template_map[filename[:-5]] = os.path.join(*CONFIGS_SUBPATH, filename)
 
         except Exception as e:
             print(f"Error scanning templates directory: {e}")
@@ -774,10 +996,43 @@ class MainWindow(QMainWindow):
         # If no templates found, return empty dict (user will need to create templates)
         return template_map
 
+    def _templates_signature(self):
+        """
+        Cheap fingerprint of templates/configs/: directory mtime plus the
+        name and mtime of every template file (no JSON parsing).
+        """
+        templates_dir = default_config_dir()
+        try:
+            dir_mtime = os.stat(templates_dir).st_mtime_ns
+            with os.scandir(templates_dir) as it:
+                files = sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in it if entry.name.endswith('.json')
+                )
+        except OSError:
+            return None
+
+        return (dir_mtime, tuple(files))
+
+    def _load_templates_cached(self):
+        """Return the template map, re-scanning only if templates changed"""
+        signature = self._templates_signature()
+
+        if signature is None or signature != self._tpl_cache["signature"]:
+            self._tpl_cache = {"signature": signature, "map": self.load_templates()}
+
+        return self._tpl_cache["map"]
+
     def refresh_templates(self):
         """Refresh template list after Template Builder closes"""
-        # Reload templates from directory
-        self.template_map = self.load_templates()
+        previous_signature = self._tpl_cache["signature"]
+
+        # Reload templates from directory (cached if nothing changed)
+        self.template_map = self._load_templates_cached()
+
+        # Nothing changed on disk - keep the current dropdown
+        if previous_signature is not None and previous_signature == self._tpl_cache["signature"]:
+            return
 
         # Update the dropdown in Step 1
         if hasattr(self, 'template_combo'):
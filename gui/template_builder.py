@@ -8,62 +8,516 @@ from PyQt6.QtWidgets import (
     QLabel, QLineEdit, QFileDialog, QComboBox, QListWidget, QSplitter,
     QGraphicsView, QGraphicsScene, QFrame, QScrollArea, QCheckBox,
     QSpinBox, QColorDialog, QMessageBox, QDialog, QDialogButtonBox,
-    QGroupBox, QFormLayout, QListWidgetItem, QGraphicsTextItem, QGraphicsPixmapItem
+    QGroupBox, QFormLayout, QListWidgetItem, QGraphicsPixmapItem,
+    QGraphicsSimpleTextItem, QListView
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
-from PyQt6.QtGui import QFont, QColor, QPainter, QPixmap, QIcon
+from PyQt6.QtCore import (
+    Qt, QSize, QRectF, QTimer, QStringListModel,
+    QObject, QRunnable, QThreadPool, pyqtSignal
+)
+from PyQt6.QtGui import (
+    QFont, QColor, QBrush, QPainter, QPainterPath, QPen, QPixmap, QIcon,
+    QOpenGLContext
+)
+import copy
+import functools
 import json
+import re
+import traceback
 from datetime import datetime
 import os
 
+# Bound once; used for every file label and default name
+_basename = os.path.basename
 
-class ComponentWidget(QPushButton):
-    """Clickable component widget for component library"""
-    component_clicked = pyqtSignal(str)  # Custom signal emitted with component_type
-    
-    def __init__(self, component_type, icon_text, tooltip, parent=None):
-        super().__init__(parent)
-        self.component_type = component_type
-        self.setToolTip(tooltip)
-        self.setup_ui(icon_text)
-        # Connect built-in clicked signal to emit our custom signal
-        super().clicked.connect(lambda: self.component_clicked.emit(self.component_type))
-
-    def setup_ui(self, icon_text):
-        """Setup component widget UI"""
-        layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.setContentsMargins(10, 10, 10, 10)
-
-        # Icon (emoji or text)
-        icon_label = QLabel(icon_text)
-        icon_label.setFont(QFont("Segoe UI", 24))
-        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(icon_label)
-
-        # Type label
-        type_label = QLabel(self.component_type)
-        type_label.setFont(QFont("Segoe UI", 9))
-        type_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(type_label)
-
-        self.setFixedSize(100, 100)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                border: 2px solid #E5E7EB;
-                border-radius: 8px;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #F3F4F6;
-                border: 2px solid #2563EB;
-            }
-            QPushButton:pressed {
-                background-color: #EFF6FF;
-                border: 2px solid #1D4ED8;
-            }
-        """)
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:
+    QOpenGLWidget = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from gui.utils import default_config_dir, load_json_file, loads_json
+
+# Set to 1 to render the preview through an OpenGL viewport. Off by default:
+# on remote desktops, VMs and software-rendered hosts the GL viewport can
+# come up blank even though QtOpenGLWidgets imports fine
+_OPENGL_PREVIEW_ENV = "REPORTFORGE_OPENGL_PREVIEW"
+
+
+@functools.lru_cache(maxsize=None)
+def _use_opengl_preview():
+    """Whether the preview should get an OpenGL viewport (opt-in, GL context must work)"""
+    if QOpenGLWidget is None or os.environ.get(_OPENGL_PREVIEW_ENV) != "1":
+        return False
+    return QOpenGLContext().create()
+
+
+def _dumps(data, pretty=False):
+    """Encode template data as UTF-8 JSON bytes (2-space indented if pretty)"""
+    if orjson is not None:
+        # Non-str keys are stringified, as the stdlib encoder does
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Flags for rewriting a template file (O_BINARY only exists on Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Template name -> default file name: spaces and path separators become "_"
+_FILENAME_TRANSLATION = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+# First "name" string in a template file - metadata.name (or the top-level
+# name) in files written by the builder, since it comes first. Escaped
+# names don't match and fall back to a full parse.
+_TEMPLATE_NAME_RE = re.compile(rb'"name"\s*:\s*"([^"\\]{0,200})"')
+
+
+def _peek_template_name(file_path, head_size=8192):
+    """Read a template's name from the start of the file, or None"""
+    with open(file_path, 'rb') as f:
+        head = f.read(head_size)
+    match = _TEMPLATE_NAME_RE.search(head)
+    if match is None:
+        return None
+    try:
+        return match.group(1).decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+
+
+# Template a new builder window starts from. Both templates here are kept
+# pre-encoded: decoding yields a fresh nested copy with no shared lists
+_DEFAULT_TEMPLATE_DATA = {
+    'name': '',
+    'industry': '',
+    'logo_path': None,
+    'embedded_logo_path': None,
+    'title_slide': {
+        'title': '',
+        'subtitle': '',
+        'description': ''
+    },
+    'table_slide': {
+        'title': 'Yönetici Özeti',
+        'subtitle': 'Haberlerin Dağılımı',
+        'columns': ['Firma', 'Net Etki', 'Erişim', 'Reklam Eşdeğeri'],
+        'sort_by': 'Net Etki',
+        'ascending': False,
+        'group_by': 'Firma',
+        'aggregations': {
+            'Toplam': 'count',
+            **dict.fromkeys(
+                ('Pozitif', 'Negatif', 'Erişim', 'STXCM', 'Reklam Eşdeğeri'),
+                'sum'
+            )
+        },
+        'note': '',
+        'style': {
+            'font_name': 'Calibri',
+            'font_size': 11,
+            'header_color': '#2563EB',
+            'header_text_color': '#FFFFFF',
+            'row_color_1': '#FFFFFF',
+            'row_color_2': '#F9FAFB',
+            'text_color': '#1F2937'
+        }
+    },
+    'chart_slide': {
+        'chart_type': 'column',
+        'title': '',
+        'x_column': 'Firma',
+        'y_column': 'Net Etki',
+        'calculation': 'sum',
+        'sort_by': 'Net Etki',
+        'ascending': False,
+        'top_n': None,
+        'style': {
+            'colors': ['#2563EB', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6'],
+            'show_values': True,
+            'grid': True,
+            'legend_position': 'none'
+        }
+    },
+    'colors': {
+        'primary': '#2563EB',
+        'secondary': '#10B981',
+        'accent': '#F59E0B'
+    },
+    'font_family': 'Segoe UI',
+    'slides': []
+}
+_DEFAULT_TEMPLATE_BYTES = _dumps(_DEFAULT_TEMPLATE_DATA)
+
+# Blank template the builder resets to when the loaded template is deleted
+_EMPTY_TEMPLATE_DATA = {
+    'name': '',
+    'industry': '',
+    'logo_path': None,
+    'embedded_logo_path': None,
+    'title_slide': {
+        'title': '',
+        'subtitle': '',
+        'description': ''
+    },
+    'colors': {
+        'primary': '#2563EB',
+        'secondary': '#10B981',
+        'accent': '#F59E0B'
+    },
+    'font_family': 'Segoe UI',
+    'slides': []
+}
+_EMPTY_TEMPLATE_BYTES = _dumps(_EMPTY_TEMPLATE_DATA)
+
+
+# Table color pickers: color_type -> (style key, default, widget attribute
+# prefix for the <prefix>_btn swatch and <prefix>_label hex label)
+_TABLE_COLORS = {
+    'header': ('header_color', '#2563EB', 'table_header_color'),
+    'row1': ('row_color_1', '#FFFFFF', 'table_row1_color'),
+    'row2': ('row_color_2', '#F9FAFB', 'table_row2_color'),
+    'background': ('background_color', '#FFFFFF', 'table_bg_color'),
+    'header_text': ('header_text_color', '#FFFFFF', 'table_header_text_color'),
+    'text': ('text_color', '#1F2937', 'table_text_color'),
+    'border': ('border_color', '#E5E7EB', 'table_border_color')
+}
+
+# Keys every slide component must have (checked by validate_template)
+_COMPONENT_REQUIRED_KEYS = frozenset(('type', 'position', 'size'))
+
+# Flags for slide list rows: QListWidgetItem defaults plus inline renaming
+_SLIDE_ITEM_FLAGS = (
+    Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable |
+    Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsDragEnabled |
+    Qt.ItemFlag.ItemIsEditable
+)
+
+INDUSTRIES = (
+    "Fashion & Retail",
+    "Pharmaceutical",
+    "Energy & Utilities",
+    "Banking & Finance",
+    "Technology",
+    "FMCG",
+    "Custom / Other"
+)
+
+FONTS = (
+    "Segoe UI",
+    "Calibri",
+    "Arial",
+    "Times New Roman",
+    "Helvetica"
+)
+
+SLIDE_TYPES = (
+    "Blank Slide",
+    "Title Slide",
+    "Table Slide",
+    "Chart Slide",
+    "Mixed Content (Table + Chart)",
+    "Summary/Insights Slide"
+)
+
+# Font choices for table and chart text
+CONTENT_FONTS = ('Calibri', 'Arial', 'Segoe UI', 'Times New Roman', 'Verdana')
+SORT_ORDERS = ('Descending', 'Ascending')
+ALIGNMENTS = ('Left', 'Center', 'Right')
+CHART_TYPES = ('column', 'bar', 'pie', 'line', 'stacked_column', 'stacked_bar')
+CALCULATIONS = ('sum', 'count', 'average', 'mean', 'max', 'min', 'percentage')
+
+
+@functools.lru_cache(maxsize=None)
+def _list_model(items):
+    """Get a QStringListModel for items, shared by every combo box that shows them"""
+    return QStringListModel(list(items))
+
+
+@functools.lru_cache(maxsize=None)
+def _font(family, size, weight=QFont.Weight.Normal, italic=False):
+    """Get a shared QFont for (family, size, weight, italic) - don't modify it"""
+    return QFont(family, size, weight, italic)
+
+
+@functools.lru_cache(maxsize=256)
+def _color(name):
+    """Get a shared QColor for a color name such as '#2563EB'"""
+    return QColor(name)
+
+
+@functools.lru_cache(maxsize=64)
+def _render_slide_info_pixmap(slide_name, slide_type, slide_layout, component_types):
+    """
+    Render the info preview of a plain slide into a 720x540 pixmap.
+
+    Cached on the slide's name, type, layout and component types, so
+    navigating back to a slide reuses the same pixmap.
+    """
+    pixmap = QPixmap(720, 540)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    preview_text = f"{slide_name}\n"
+    if slide_type != 'N/A':
+        preview_text += f"Type: {slide_type}\n"
+    if slide_layout != 'N/A':
+        preview_text += f"Layout: {slide_layout}\n"
+    preview_text += f"\nComponents: {len(component_types)}"
+
+    painter = QPainter(pixmap)
+    painter.setFont(_font("Segoe UI", 14))
+    painter.setPen(_color("#1F2937"))
+    painter.drawText(QRectF(0, 0, 720, 540), Qt.AlignmentFlag.AlignCenter, preview_text)
+
+    # One placeholder box per component along the bottom of the slide
+    if component_types:
+        box_width = min(120, (680 - 10 * (len(component_types) - 1)) / len(component_types))
+        painter.setFont(_font("Segoe UI", 9))
+        for i, comp_type in enumerate(component_types):
+            rect = QRectF(20 + i * (box_width + 10), 450, box_width, 60)
+            painter.setPen(_color("#D1D5DB"))
+            painter.drawRect(rect)
+            painter.setPen(_color("#6B7280"))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, str(comp_type))
+
+    painter.end()
+    return pixmap
+
+
+@functools.lru_cache(maxsize=1)
+def _render_placeholder_pixmap():
+    """Render the empty-preview message into a 720x540 pixmap (built once)"""
+    pixmap = QPixmap(720, 540)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setFont(_font("Segoe UI", 14))
+    painter.setPen(_color("#9CA3AF"))
+    painter.drawText(
+        QRectF(0, 0, 720, 540),
+        Qt.AlignmentFlag.AlignCenter,
+        "Select a slide to preview\n\nOr add a new slide to get started"
+    )
+    painter.end()
+    return pixmap
+
+
+@functools.lru_cache(maxsize=64)
+def _swatch_icon(hex_color):
+    """Get a bordered 24x16 color swatch icon (built once per color)"""
+    swatch = QPixmap(24, 16)
+    swatch.fill(QColor(hex_color))
+
+    # Border keeps white/near-white swatches visible on light panels
+    painter = QPainter(swatch)
+    painter.setPen(_color("#E5E7EB"))
+    painter.drawRect(0, 0, 23, 15)
+    painter.end()
+    return QIcon(swatch)
+
+
+def _set_swatch(button, hex_color):
+    """
+    Show a color on a swatch button as its icon, skipping unchanged colors.
+
+    The panel stylesheets set background-color on every child, which
+    overrides palette backgrounds, so the color is drawn as an icon rather
+    than set through a per-button stylesheet (no QSS parse per change).
+    """
+    if button.property("swatch") == hex_color:
+        return
+    button.setProperty("swatch", hex_color)
+    button.setIconSize(QSize(24, 16))
+    button.setIcon(_swatch_icon(hex_color))
+
+
+def _set_path_label_selected(label, selected):
+    """Toggle a logo path label between its muted and 'file chosen' look
+
+    The look comes from the QLabel#pathLabel rules in _BUILDER_QSS, so this
+    only flips a property and repolishes instead of parsing a new sheet.
+    """
+    if label.property("selected") == selected:
+        return
+    label.setProperty("selected", selected)
+    label.style().unpolish(label)
+    label.style().polish(label)
+
+
+# Components library entries: (component type, emoji, tooltip)
+COMPONENT_TYPES = (
+    ("Title Slide", "📄", "Title slide with logo and text"),
+    ("Table", "📊", "Data table for structured information"),
+    ("Chart", "📈", "Visualizations (bar, column, pie, line)"),
+    ("Text", "📝", "Titles, headings, paragraphs"),
+    ("Image", "🖼️", "Logos, photos, graphics"),
+    ("Summary", "💡", "Auto-generated insights from data")
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _emoji_pixmap(text, size=48):
+    """Rasterize an emoji into a square pixmap (shaped and drawn once per emoji)"""
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setFont(_font("Segoe UI", size // 2))
+    painter.drawText(QRectF(0, 0, size, size), Qt.AlignmentFlag.AlignCenter, text)
+    painter.end()
+    return pixmap
+
+
+@functools.lru_cache(maxsize=None)
+def _emoji_icon(text, size=48):
+    """Get a square icon for an emoji (built once per emoji)"""
+    return QIcon(_emoji_pixmap(text, size))
+
+
+# Single stylesheet for the whole builder window, parsed once in init_ui.
+# Panel rules also cover descendants ("#id *") to match the old per-panel
+# sheets, which had no selector and so cascaded to every child widget.
+_BUILDER_QSS = """
+    QFrame#headerFrame, QFrame#headerFrame * {
+        background-color: #1F2937;
+        padding: 10px;
+    }
+    QFrame#leftPanel, QFrame#leftPanel *,
+    QFrame#rightPanel, QFrame#rightPanel * {
+        background-color: #F9FAFB;
+    }
+    QFrame#centerPanel, QFrame#centerPanel * {
+        background-color: white;
+    }
+    QLabel#headerTitle {
+        color: white;
+    }
+    QPushButton#backButton {
+        background-color: #3B82F6;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+    }
+    QPushButton#backButton:hover {
+        background-color: #2563EB;
+    }
+    QPushButton#saveButton {
+        background-color: #2563EB;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 10px;
+    }
+    QPushButton#saveButton:hover {
+        background-color: #1D4ED8;
+    }
+    QPushButton#deleteButton {
+        background-color: #DC2626;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 10px;
+    }
+    QPushButton#deleteButton:hover {
+        background-color: #B91C1C;
+    }
+    QGraphicsView#previewView {
+        border: 2px solid #E5E7EB;
+        border-radius: 8px;
+        background-color: #F9FAFB;
+    }
+    QListWidget#componentList {
+        background-color: transparent;
+        border: none;
+    }
+    QListWidget#componentList::item {
+        background-color: white;
+        border: 2px solid #E5E7EB;
+        border-radius: 8px;
+        color: #1F2937;
+    }
+    QListWidget#componentList::item:hover {
+        background-color: #F3F4F6;
+        border: 2px solid #2563EB;
+    }
+    QListWidget#componentList::item:selected {
+        background-color: #EFF6FF;
+        border: 2px solid #1D4ED8;
+    }
+    QLabel#pathLabel {
+        color: #6B7280;
+    }
+    QLabel#pathLabel[selected="true"] {
+        color: #10B981;
+        font-weight: bold;
+    }
+    QLabel#mutedLabel {
+        color: #6B7280;
+    }
+    QLabel#placeholderLabel {
+        color: #9CA3AF;
+        padding: 20px;
+    }
+    QFrame#separator {
+        background-color: #E5E7EB;
+    }
+"""
+
+
+class _JsonIOSignals(QObject):
+    """Signals emitted by _JsonIOTask"""
+    finished = pyqtSignal(object, object)  # (result, error)
+
+
+class _JsonIOTask(QRunnable):
+    """Read or write a template JSON file off the GUI thread
+
+    With data=None the file is parsed and the result is (mtime_ns, data);
+    otherwise data is written to the file (compact unless pretty) and the
+    result is the path.
+    """
+
+    def __init__(self, file_path, data=None, pretty=False):
+        super().__init__()
+        self.signals = _JsonIOSignals()
+        self.file_path = file_path
+        self.data = data
+        self.pretty = pretty
+
+    def run(self):
+        try:
+            if self.data is None:
+                result = self._read()
+            else:
+                result = self._write()
+        except Exception as e:
+            self.signals.finished.emit(None, e)
+        else:
+            self.signals.finished.emit(result, None)
+
+    def _read(self):
+        mtime = os.stat(self.file_path).st_mtime_ns
+        return mtime, load_json_file(self.file_path)
+
+    def _write(self):
+        # The encoded bytes go straight to the fd - no buffered file object
+        data = memoryview(_dumps(self.data, self.pretty))
+        fd = os.open(self.file_path, _WRITE_FLAGS, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        return self.file_path
 
 
 class TemplateBuilder(QMainWindow):
@@ -71,73 +525,51 @@ class TemplateBuilder(QMainWindow):
 
     def __init__(self):
         super().__init__()
-        self.template_data = {
-            'name': '',
-            'industry': '',
-            'logo_path': None,
-            'embedded_logo_path': None,
-            'title_slide': {
-                'title': '',
-                'subtitle': '',
-                'description': ''
-            },
-            'table_slide': {
-                'title': 'Yönetici Özeti',
-                'subtitle': 'Haberlerin Dağılımı',
-                'columns': ['Firma', 'Net Etki', 'Erişim', 'Reklam Eşdeğeri'],
-                'sort_by': 'Net Etki',
-                'ascending': False,
-                'group_by': 'Firma',
-                'aggregations': {
-                    'Toplam': 'count',
-                    'Pozitif': 'sum',
-                    'Negatif': 'sum',
-                    'Erişim': 'sum',
-                    'STXCM': 'sum',
-                    'Reklam Eşdeğeri': 'sum'
-                },
-                'note': '',
-                'style': {
-                    'font_name': 'Calibri',
-                    'font_size': 11,
-                    'header_color': '#2563EB',
-                    'header_text_color': '#FFFFFF',
-                    'row_color_1': '#FFFFFF',
-                    'row_color_2': '#F9FAFB',
-                    'text_color': '#1F2937'
-                }
-            },
-            'chart_slide': {
-                'chart_type': 'column',
-                'title': '',
-                'x_column': 'Firma',
-                'y_column': 'Net Etki',
-                'calculation': 'sum',
-                'sort_by': 'Net Etki',
-                'ascending': False,
-                'top_n': None,
-                'style': {
-                    'colors': ['#2563EB', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6'],
-                    'show_values': True,
-                    'grid': True,
-                    'legend_position': 'none'
-                }
-            },
-            'colors': {
-                'primary': '#2563EB',
-                'secondary': '#10B981',
-                'accent': '#F59E0B'
-            },
-            'font_family': 'Segoe UI',
-            'slides': []
-        }
+        self.template_data = loads_json(_DEFAULT_TEMPLATE_BYTES)
         self.current_slide_index = -1
         self.selected_component_type = None  # Track which component is being edited
+        # Parsed template files: path -> (mtime_ns, data)
+        self._tpl_cache = {}
+        # (path, mtime_ns) of the file that holds template_data exactly as
+        # loaded or last saved; a clean re-save to it is skipped
+        self._saved_source = None
+
+        # Template file reads/writes run here, one at a time, so parsing and
+        # serializing large templates never blocks the event loop
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+        self._io_task = None
+        self._is_saving = False
+        self._close_after_save = False
+
+        # Last validate_template result, keyed on the template name. Cleared
+        # by every change to the slide list (add, remove, move, rename, load)
+        self._validation_cache = None
+
+        # Inline slide renames are applied once edits settle (see slide_renamed)
+        self._pending_rename = None
+        self._rename_timer = QTimer(self)
+        self._rename_timer.setSingleShot(True)
+        self._rename_timer.setInterval(150)
+        self._rename_timer.timeout.connect(self._commit_rename)
+        # Set by any edit, cleared on save/load - avoids no-op save prompts
+        self._dirty = False
+
+        # One template file dialog, built on first use and reused by
+        # save/load/delete (see _pick_template_file)
+        self._file_dialog = None
+
+        # Known starting directories for file dialogs, so they never open on
+        # (and enumerate) an arbitrary large folder
+        # (created on first save, not just for opening the builder)
+        self.templates_dir = default_config_dir()
+        self.assets_dir = os.path.dirname(self.templates_dir)
         self.init_ui()
 
     def init_ui(self):
         """Initialize user interface"""
         self.setMinimumSize(1200, 700)
+        self.setStyleSheet(_BUILDER_QSS)
 
         # Create central widget with splitter
         central_widget = QWidget()
@@ -154,60 +586,68 @@ class TemplateBuilder(QMainWindow):
         h_layout = QHBoxLayout()
         h_layout.setContentsMargins(0, 0, 0, 0)
 
-        # Create 3-panel splitter
-        splitter = QSplitter(Qt.Orientation.Horizontal)
+        # Create 3-panel splitter. The settings panel is built right away;
+        # the preview and components panels start as empty placeholders and
+        # are swapped in after the window is first shown (see _finish_build)
+        self.splitter = QSplitter(Qt.Orientation.Horizontal)
+        self.splitter.addWidget(self._create_left_panel())
+        for _ in range(2):
+            self.splitter.addWidget(QWidget())
 
-        # Left panel: Template Settings
-        left_panel = self._create_left_panel()
-        splitter.addWidget(left_panel)
+        # Set initial sizes (30%, 40%, 30%)
+        self.splitter.setSizes([420, 560, 420])
 
-        # Center panel: Slide Preview
-        center_panel = self._create_center_panel()
-        splitter.addWidget(center_panel)
+        h_layout.addWidget(self.splitter)
+        main_layout.addLayout(h_layout)
 
-        # Right panel: Components Library
-        right_panel = self._create_right_panel()
-        splitter.addWidget(right_panel)
+        self._panels_built = False
 
-        # Set initial sizes (30%, 40%, 30%)
-        splitter.setSizes([420, 560, 420])
+    def showEvent(self, event):
+        """Build the deferred panels on the first show"""
+        super().showEvent(event)
+        if not self._panels_built:
+            self._panels_built = True
+            QTimer.singleShot(0, self._finish_build)
 
-        h_layout.addWidget(splitter)
-        main_layout.addLayout(h_layout)
+    def _finish_build(self):
+        """Replace the placeholders with the preview and components panels"""
+        sizes = self.splitter.sizes()
+
+        # Center panel: Slide Preview, Right panel: Components Library
+        panels = (self._create_center_panel(), self._create_right_panel())
+        for i, panel in enumerate(panels, start=1):
+            placeholder = self.splitter.replaceWidget(i, panel)
+            if placeholder is not None:
+                placeholder.deleteLater()
+
+        self.splitter.setSizes(sizes)
 
     def _create_header(self, layout):
         """Create header with title and navigation buttons"""
         header_frame = QFrame()
-        header_frame.setStyleSheet("background-color: #1F2937; padding: 10px;")
+        header_frame.setObjectName("headerFrame")
         header_frame.setFixedHeight(60)
 
         header_layout = QHBoxLayout(header_frame)
         header_layout.setContentsMargins(20, 10, 20, 10)
 
-        # Title
-        title = QLabel("🛠️ ReportForge - Template Builder")
-        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-        title.setStyleSheet("color: white;")
+        # Title - the emoji is a pre-rendered pixmap next to the plain text
+        title_icon = QLabel()
+        title_icon.setPixmap(_emoji_pixmap("🛠️", 32))
+        header_layout.addWidget(title_icon)
+
+        title = QLabel("ReportForge - Template Builder")
+        title.setFont(_font("Segoe UI", 16, QFont.Weight.Bold))
+        title.setObjectName("headerTitle")
         header_layout.addWidget(title)
 
         header_layout.addStretch()
 
         # Back to Main App button
         back_btn = QPushButton("← Back to Main App")
-        back_btn.setFont(QFont("Segoe UI", 11))
+        back_btn.setFont(_font("Segoe UI", 11))
         back_btn.setFixedHeight(35)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3B82F6;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #2563EB;
-            }
-        """)
+        back_btn.setObjectName("backButton")
         back_btn.clicked.connect(self.back_to_main_app)
         header_layout.addWidget(back_btn)
 
@@ -216,14 +656,14 @@ class TemplateBuilder(QMainWindow):
     def _create_left_panel(self):
         """Create left panel with template settings"""
         panel = QFrame()
-        panel.setStyleSheet("background-color: #F9FAFB;")
+        panel.setObjectName("leftPanel")
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(10)
 
         # Title
         title = QLabel("TEMPLATE SETTINGS")
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(_font("Segoe UI", 12, QFont.Weight.Bold))
         layout.addWidget(title)
 
         # Scroll area for settings
@@ -269,34 +709,33 @@ class TemplateBuilder(QMainWindow):
 
         return panel
 
+    def _make_group(self, title, layout_cls=QFormLayout):
+        """Create a settings group box with the shared bold title font and its layout"""
+        group = QGroupBox(title)
+        group.setFont(_font("Segoe UI", 10, QFont.Weight.Bold))
+        return group, layout_cls(group)
+
     def _create_template_info_section(self):
         """Create template information section"""
-        group = QGroupBox("Template Info")
-        group.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        layout = QFormLayout(group)
+        group, layout = self._make_group("Template Info")
 
         # Template Name
         self.template_name_input = QLineEdit()
         self.template_name_input.setPlaceholderText("e.g., BSH Monthly Media Report")
+        self.template_name_input.textChanged.connect(self._mark_dirty)
         layout.addRow("Template Name:", self.template_name_input)
 
         # Industry
         self.industry_combo = QComboBox()
-        self.industry_combo.addItems([
-            "Fashion & Retail",
-            "Pharmaceutical",
-            "Energy & Utilities",
-            "Banking & Finance",
-            "Technology",
-            "FMCG",
-            "Custom / Other"
-        ])
+        self.industry_combo.setModel(_list_model(INDUSTRIES))
+        self.industry_combo.currentTextChanged.connect(self._mark_dirty)
         layout.addRow("Industry:", self.industry_combo)
 
         # Logo
         logo_layout = QHBoxLayout()
         self.logo_path_label = QLabel("No logo selected")
-        self.logo_path_label.setStyleSheet("color: #6B7280;")
+        self.logo_path_label.setObjectName("pathLabel")
+        _set_path_label_selected(self.logo_path_label, False)
         logo_layout.addWidget(self.logo_path_label)
 
         logo_btn = QPushButton("Browse...")
@@ -309,78 +748,69 @@ class TemplateBuilder(QMainWindow):
 
     def _create_brand_colors_section(self):
         """Create brand colors section"""
-        group = QGroupBox("Brand Colors")
-        group.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        layout = QFormLayout(group)
-
-        # Primary Color
-        primary_layout = QHBoxLayout()
-        self.primary_color_btn = QPushButton("■")
-        self.primary_color_btn.setFixedSize(40, 30)
-        self.primary_color_btn.setStyleSheet(f"background-color: {self.template_data['colors']['primary']};")
-        self.primary_color_btn.clicked.connect(lambda: self.pick_color('primary'))
-        primary_layout.addWidget(self.primary_color_btn)
-
-        self.primary_color_label = QLabel(self.template_data['colors']['primary'])
-        primary_layout.addWidget(self.primary_color_label)
-        primary_layout.addStretch()
-
-        layout.addRow("Primary:", primary_layout)
-
-        # Secondary Color
-        secondary_layout = QHBoxLayout()
-        self.secondary_color_btn = QPushButton("■")
-        self.secondary_color_btn.setFixedSize(40, 30)
-        self.secondary_color_btn.setStyleSheet(f"background-color: {self.template_data['colors']['secondary']};")
-        self.secondary_color_btn.clicked.connect(lambda: self.pick_color('secondary'))
-        secondary_layout.addWidget(self.secondary_color_btn)
-
-        self.secondary_color_label = QLabel(self.template_data['colors']['secondary'])
-        secondary_layout.addWidget(self.secondary_color_label)
-        secondary_layout.addStretch()
-
-        layout.addRow("Secondary:", secondary_layout)
-
-        # Accent Color
-        accent_layout = QHBoxLayout()
-        self.accent_color_btn = QPushButton("■")
-        self.accent_color_btn.setFixedSize(40, 30)
-        self.accent_color_btn.setStyleSheet(f"background-color: {self.template_data['colors']['accent']};")
-        self.accent_color_btn.clicked.connect(lambda: self.pick_color('accent'))
-        accent_layout.addWidget(self.accent_color_btn)
-
-        self.accent_color_label = QLabel(self.template_data['colors']['accent'])
-        accent_layout.addWidget(self.accent_color_label)
-        accent_layout.addStretch()
-
-        layout.addRow("Accent:", accent_layout)
+        group, layout = self._make_group("Brand Colors")
+
+        # color_type -> (swatch button, hex label)
+        self._color_widgets = {}
+        for color_type, row_label in (
+            ('primary', "Primary:"),
+            ('secondary', "Secondary:"),
+            ('accent', "Accent:")
+        ):
+            row_layout, button, label = self._build_color_row(color_type)
+            self._color_widgets[color_type] = (button, label)
+            layout.addRow(row_label, row_layout)
 
         return group
 
+    def _build_color_row(self, color_type):
+        """Build a swatch button + hex label row for one brand color"""
+        hex_color = self.template_data['colors'][color_type]
+
+        row_layout = QHBoxLayout()
+        button = QPushButton("■")
+        button.setFixedSize(40, 30)
+        self._init_color_swatch(button, hex_color)
+        button.setProperty("color_key", color_type)
+        button.clicked.connect(self._on_color_clicked)
+        row_layout.addWidget(button)
+
+        label = QLabel(hex_color)
+        row_layout.addWidget(label)
+        row_layout.addStretch()
+
+        return row_layout, button, label
+
+    def _mark_dirty(self, *args):
+        """Record that the template has unsaved changes"""
+        self._dirty = True
+
+    def _init_color_swatch(self, button, hex_color):
+        """Make a button that shows a color swatch as its icon"""
+        button.setText("")
+        _set_swatch(button, hex_color)
+
+    def _apply_brand_color(self, color_type, hex_color):
+        """Show a brand color on its swatch button and label"""
+        button, label = self._color_widgets[color_type]
+        _set_swatch(button, hex_color)
+        label.setText(hex_color)
+
     def _create_typography_section(self):
         """Create typography section"""
-        group = QGroupBox("Typography")
-        group.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        layout = QFormLayout(group)
+        group, layout = self._make_group("Typography")
 
         # Font Family
         self.font_combo = QComboBox()
-        self.font_combo.addItems([
-            "Segoe UI",
-            "Calibri",
-            "Arial",
-            "Times New Roman",
-            "Helvetica"
-        ])
+        self.font_combo.setModel(_list_model(FONTS))
+        self.font_combo.currentTextChanged.connect(self._mark_dirty)
         layout.addRow("Font Family:", self.font_combo)
 
         return group
 
     def _create_title_slide_section(self):
         """Create title slide configuration section"""
-        group = QGroupBox("Title Slide")
-        group.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        layout = QFormLayout(group)
+        group, layout = self._make_group("Title Slide")
 
         # Title
         self.title_slide_title_input = QLineEdit()
@@ -403,7 +833,8 @@ class TemplateBuilder(QMainWindow):
         # Embedded Logo
         embedded_logo_layout = QHBoxLayout()
         self.embedded_logo_path_label = QLabel("No embedded logo selected")
-        self.embedded_logo_path_label.setStyleSheet("color: #6B7280;")
+        self.embedded_logo_path_label.setObjectName("pathLabel")
+        _set_path_label_selected(self.embedded_logo_path_label, False)
         embedded_logo_layout.addWidget(self.embedded_logo_path_label)
 
         embedded_logo_btn = QPushButton("Browse...")
@@ -416,9 +847,7 @@ class TemplateBuilder(QMainWindow):
 
     def _create_table_slide_section(self):
         """Create table slide configuration section"""
-        group = QGroupBox("Table Slide")
-        group.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        layout = QFormLayout(group)
+        group, layout = self._make_group("Table Slide")
 
         # Title
         self.table_slide_title_input = QLineEdit()
@@ -458,7 +887,7 @@ class TemplateBuilder(QMainWindow):
 
         # Sort Order
         self.table_sort_order_combo = QComboBox()
-        self.table_sort_order_combo.addItems(['Descending', 'Ascending'])
+        self.table_sort_order_combo.setModel(_list_model(SORT_ORDERS))
         self.table_sort_order_combo.currentTextChanged.connect(self.on_table_slide_changed)
         layout.addRow("Sort Order:", self.table_sort_order_combo)
 
@@ -476,12 +905,12 @@ class TemplateBuilder(QMainWindow):
 
         # Styling Section
         styling_label = QLabel("Table Styling:")
-        styling_label.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
+        styling_label.setFont(_font("Segoe UI", 9, QFont.Weight.Bold))
         layout.addRow(styling_label)
 
         # Font Family
         self.table_font_combo = QComboBox()
-        self.table_font_combo.addItems(['Calibri', 'Arial', 'Segoe UI', 'Times New Roman', 'Verdana'])
+        self.table_font_combo.setModel(_list_model(CONTENT_FONTS))
         self.table_font_combo.currentTextChanged.connect(self.on_table_slide_changed)
         layout.addRow("Font Family:", self.table_font_combo)
 
@@ -497,8 +926,9 @@ class TemplateBuilder(QMainWindow):
         header_color_layout = QHBoxLayout()
         self.table_header_color_btn = QPushButton()
         self.table_header_color_btn.setFixedSize(40, 30)
-        self.table_header_color_btn.setStyleSheet("background-color: #2563EB; border: 1px solid #E5E7EB;")
-        self.table_header_color_btn.clicked.connect(lambda: self.pick_table_color('header'))
+        _set_swatch(self.table_header_color_btn, '#2563EB')
+        self.table_header_color_btn.setProperty("color_key", 'header')
+        self.table_header_color_btn.clicked.connect(self._on_table_color_clicked)
         header_color_layout.addWidget(self.table_header_color_btn)
         self.table_header_color_label = QLabel("#2563EB")
         header_color_layout.addWidget(self.table_header_color_label)
@@ -508,8 +938,9 @@ class TemplateBuilder(QMainWindow):
         row1_color_layout = QHBoxLayout()
         self.table_row1_color_btn = QPushButton()
         self.table_row1_color_btn.setFixedSize(40, 30)
-        self.table_row1_color_btn.setStyleSheet("background-color: #FFFFFF; border: 1px solid #E5E7EB;")
-        self.table_row1_color_btn.clicked.connect(lambda: self.pick_table_color('row1'))
+        _set_swatch(self.table_row1_color_btn, '#FFFFFF')
+        self.table_row1_color_btn.setProperty("color_key", 'row1')
+        self.table_row1_color_btn.clicked.connect(self._on_table_color_clicked)
         row1_color_layout.addWidget(self.table_row1_color_btn)
         self.table_row1_color_label = QLabel("#FFFFFF")
         row1_color_layout.addWidget(self.table_row1_color_label)
@@ -519,8 +950,9 @@ class TemplateBuilder(QMainWindow):
         row2_color_layout = QHBoxLayout()
         self.table_row2_color_btn = QPushButton()
         self.table_row2_color_btn.setFixedSize(40, 30)
-        self.table_row2_color_btn.setStyleSheet("background-color: #F9FAFB; border: 1px solid #E5E7EB;")
-        self.table_row2_color_btn.clicked.connect(lambda: self.pick_table_color('row2'))
+        _set_swatch(self.table_row2_color_btn, '#F9FAFB')
+        self.table_row2_color_btn.setProperty("color_key", 'row2')
+        self.table_row2_color_btn.clicked.connect(self._on_table_color_clicked)
         row2_color_layout.addWidget(self.table_row2_color_btn)
         self.table_row2_color_label = QLabel("#F9FAFB")
         row2_color_layout.addWidget(self.table_row2_color_label)
@@ -530,9 +962,7 @@ class TemplateBuilder(QMainWindow):
 
     def _create_slide_structure_section(self):
         """Create slide structure section"""
-        group = QGroupBox("Slide Structure")
-        group.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        layout = QVBoxLayout(group)
+        group, layout = self._make_group("Slide Structure", QVBoxLayout)
 
         # Slide list with inline editing
         self.slide_list = QListWidget()
@@ -576,77 +1006,73 @@ class TemplateBuilder(QMainWindow):
         layout.addWidget(self._create_separator())
 
         save_btn = QPushButton("Save Template")
-        save_btn.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2563EB;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #1D4ED8;
-            }
-        """)
+        save_btn.setFont(_font("Segoe UI", 10, QFont.Weight.Bold))
+        save_btn.setObjectName("saveButton")
         save_btn.clicked.connect(self.save_template)
         layout.addWidget(save_btn)
 
         load_btn = QPushButton("Load Template")
-        load_btn.setFont(QFont("Segoe UI", 10))
+        load_btn.setFont(_font("Segoe UI", 10))
         load_btn.clicked.connect(self.load_template)
         layout.addWidget(load_btn)
 
         delete_btn = QPushButton("Delete Template")
-        delete_btn.setFont(QFont("Segoe UI", 10))
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #DC2626;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #B91C1C;
-            }
-        """)
+        delete_btn.setFont(_font("Segoe UI", 10))
+        delete_btn.setObjectName("deleteButton")
         delete_btn.clicked.connect(self.delete_template)
         layout.addWidget(delete_btn)
 
         export_btn = QPushButton("Export as JSON")
-        export_btn.setFont(QFont("Segoe UI", 10))
+        export_btn.setFont(_font("Segoe UI", 10))
         export_btn.clicked.connect(self.export_template)
         layout.addWidget(export_btn)
 
     def _create_center_panel(self):
         """Create center panel with slide preview"""
         panel = QFrame()
-        panel.setStyleSheet("background-color: white;")
+        panel.setObjectName("centerPanel")
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(15, 15, 15, 15)
 
         # Title
         title = QLabel("SLIDE PREVIEW")
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(_font("Segoe UI", 12, QFont.Weight.Bold))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         # Preview canvas
         self.preview_view = QGraphicsView()
         self.preview_scene = QGraphicsScene()
+        # A few dozen items at most - a BSP index costs more than it saves
+        self.preview_scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.preview_view.setScene(self.preview_scene)
-        self.preview_view.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.preview_view.setStyleSheet("""
-            QGraphicsView {
-                border: 2px solid #E5E7EB;
-                border-radius: 8px;
-                background-color: #F9FAFB;
-            }
-        """)
+        if _use_opengl_preview():
+            # GPU-composited viewport, when asked for and a context is available
+            self.preview_view.setViewport(QOpenGLWidget())
+        # No antialiasing by default - previews are mostly axis-aligned boxes
+        # and text; curved chart previews turn it on for themselves
+
+        # Previews replace the whole scene at once, so repainting the full
+        # viewport is cheaper than tracking dirty regions
+        self.preview_view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.preview_view.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.preview_view.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+        self.preview_view.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        self.preview_view.setObjectName("previewView")
 
         # Set scene size (PowerPoint slide dimensions)
         self.preview_scene.setSceneRect(0, 0, 720, 540)
+
+        # Persistent items: the placeholder, set up once and only shown or
+        # hidden, and the cached plain-slide info pixmap
+        self._placeholder_item = QGraphicsPixmapItem(_render_placeholder_pixmap())
+        self._placeholder_item.setVisible(False)
+        self.preview_scene.addItem(self._placeholder_item)
+
+        self._preview_pixmap = QGraphicsPixmapItem()
+        self._preview_pixmap.setVisible(False)
+        self.preview_scene.addItem(self._preview_pixmap)
+
         self.show_preview_placeholder()
 
         layout.addWidget(self.preview_view)
@@ -673,62 +1099,42 @@ class TemplateBuilder(QMainWindow):
     def _create_right_panel(self):
         """Create right panel with components library"""
         panel = QFrame()
-        panel.setStyleSheet("background-color: #F9FAFB;")
+        panel.setObjectName("rightPanel")
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(15, 15, 15, 15)
 
         # Title
         title = QLabel("COMPONENTS LIBRARY")
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(_font("Segoe UI", 12, QFont.Weight.Bold))
         layout.addWidget(title)
 
         # Instructions
         instructions = QLabel("Click a component to edit:")
-        instructions.setFont(QFont("Segoe UI", 9))
-        instructions.setStyleSheet("color: #6B7280;")
+        instructions.setFont(_font("Segoe UI", 9))
+        instructions.setObjectName("mutedLabel")
         layout.addWidget(instructions)
 
-        # Component palette
-        components_layout = QHBoxLayout()
-        components_layout.setSpacing(10)
-
-        # Title Slide Component
-        title_slide_widget = ComponentWidget("Title Slide", "📄", "Title slide with logo and text")
-        title_slide_widget.component_clicked.connect(self.show_component_editor)
-        components_layout.addWidget(title_slide_widget)
-
-        # Table Component
-        table_widget = ComponentWidget("Table", "📊", "Data table for structured information")
-        table_widget.component_clicked.connect(self.show_component_editor)
-        components_layout.addWidget(table_widget)
-
-        # Chart Component
-        chart_widget = ComponentWidget("Chart", "📈", "Visualizations (bar, column, pie, line)")
-        chart_widget.component_clicked.connect(self.show_component_editor)
-        components_layout.addWidget(chart_widget)
-
-        # Text Component
-        text_widget = ComponentWidget("Text", "📝", "Titles, headings, paragraphs")
-        text_widget.component_clicked.connect(self.show_component_editor)
-        components_layout.addWidget(text_widget)
-
-        # Image Component
-        image_widget = ComponentWidget("Image", "🖼️", "Logos, photos, graphics")
-        image_widget.component_clicked.connect(self.show_component_editor)
-        components_layout.addWidget(image_widget)
-
-        # Summary Component
-        summary_widget = ComponentWidget("Summary", "💡", "Auto-generated insights from data")
-        summary_widget.component_clicked.connect(self.show_component_editor)
-        components_layout.addWidget(summary_widget)
-
-        layout.addLayout(components_layout)
+        # Component palette - one list view with an icon item per component
+        self.components_list = QListWidget()
+        self.components_list.setObjectName("componentList")
+        self.components_list.setViewMode(QListView.ViewMode.IconMode)
+        self.components_list.setIconSize(QSize(48, 48))
+        self.components_list.setGridSize(QSize(110, 110))
+        self.components_list.setMovement(QListView.Movement.Static)
+        self.components_list.setResizeMode(QListView.ResizeMode.Adjust)
+        self.components_list.setMaximumHeight(240)
+        self.components_list.setFont(_font("Segoe UI", 9))
+        self._populate_components()
+        self.components_list.itemClicked.connect(
+            lambda item: self.show_component_editor(item.text())
+        )
+        layout.addWidget(self.components_list)
 
         layout.addWidget(self._create_separator())
 
         # Component configuration area
         config_label = QLabel("SELECTED COMPONENT")
-        config_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        config_label.setFont(_font("Segoe UI", 11, QFont.Weight.Bold))
         layout.addWidget(config_label)
 
         # Scroll area for component configuration
@@ -743,7 +1149,7 @@ class TemplateBuilder(QMainWindow):
         # Initial placeholder
         self.config_placeholder = QLabel("Select a component to configure")
         self.config_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.config_placeholder.setStyleSheet("color: #9CA3AF; padding: 20px;")
+        self.config_placeholder.setObjectName("placeholderLabel")
         self.config_layout.addWidget(self.config_placeholder)
 
         self.config_scroll.setWidget(self.config_widget)
@@ -751,6 +1157,14 @@ class TemplateBuilder(QMainWindow):
 
         return panel
 
+    def _populate_components(self):
+        """Fill the component palette list"""
+        for component_type, icon_text, tooltip in COMPONENT_TYPES:
+            item = QListWidgetItem(_emoji_icon(icon_text), component_type)
+            item.setToolTip(tooltip)
+            item.setSizeHint(QSize(100, 100))
+            self.components_list.addItem(item)
+
     def show_component_editor(self, component_type):
         """Show editing panel for selected component type"""
         self.selected_component_type = component_type
@@ -784,7 +1198,7 @@ class TemplateBuilder(QMainWindow):
             # Show placeholder if unknown component
             placeholder = QLabel(f"Configuration for {component_type}\n(Coming soon)")
             placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            placeholder.setStyleSheet("color: #9CA3AF; padding: 20px;")
+            placeholder.setObjectName("placeholderLabel")
             self.config_layout.addWidget(placeholder)
         
         # Update preview
@@ -793,7 +1207,7 @@ class TemplateBuilder(QMainWindow):
     def _show_title_slide_editor(self):
         """Show title slide editing panel"""
         title_label = QLabel("Title Slide Configuration")
-        title_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title_label.setFont(_font("Segoe UI", 12, QFont.Weight.Bold))
         self.config_layout.addWidget(title_label)
 
         # Get existing values from template_data
@@ -832,11 +1246,13 @@ class TemplateBuilder(QMainWindow):
         # Embedded logo label - always recreate to avoid deleted widget issues
         existing_logo = title_slide_settings.get('embedded_logo_path', '')
         if existing_logo:
-            self.embedded_logo_path_label = QLabel(os.path.basename(existing_logo))
-            self.embedded_logo_path_label.setStyleSheet("color: #10B981; font-weight: bold;")
+            self.embedded_logo_path_label = QLabel(_basename(existing_logo))
+            self.embedded_logo_path_label.setObjectName("pathLabel")
+            _set_path_label_selected(self.embedded_logo_path_label, True)
         else:
             self.embedded_logo_path_label = QLabel("No embedded logo selected")
-            self.embedded_logo_path_label.setStyleSheet("color: #6B7280;")
+            self.embedded_logo_path_label.setObjectName("pathLabel")
+            _set_path_label_selected(self.embedded_logo_path_label, False)
         
         form_layout = QFormLayout()
         form_layout.setSpacing(10)
@@ -861,11 +1277,10 @@ class TemplateBuilder(QMainWindow):
     def _show_table_editor(self):
         """Show table editing panel"""
         print(f"[DEBUG] _show_table_editor: Called")
-        import traceback
         print(f"[DEBUG] _show_table_editor: Call stack:\n{''.join(traceback.format_stack()[-5:-1])}")
 
         title_label = QLabel("Table Configuration")
-        title_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title_label.setFont(_font("Segoe UI", 12, QFont.Weight.Bold))
         self.config_layout.addWidget(title_label)
 
         # Get existing values from template_data instead of potentially deleted widgets
@@ -954,20 +1369,20 @@ class TemplateBuilder(QMainWindow):
         self.table_font_size_spin.setValue(existing_font_size)
         
         # Set colors
-        self.table_header_color_btn.setStyleSheet(f"background-color: {existing_header_color}; border: 1px solid #E5E7EB;")
+        _set_swatch(self.table_header_color_btn, existing_header_color)
         self.table_header_color_label.setText(existing_header_color)
-        self.table_row1_color_btn.setStyleSheet(f"background-color: {existing_row1_color}; border: 1px solid #E5E7EB;")
+        _set_swatch(self.table_row1_color_btn, existing_row1_color)
         self.table_row1_color_label.setText(existing_row1_color)
-        self.table_row2_color_btn.setStyleSheet(f"background-color: {existing_row2_color}; border: 1px solid #E5E7EB;")
+        _set_swatch(self.table_row2_color_btn, existing_row2_color)
         self.table_row2_color_label.setText(existing_row2_color)
-        self.table_bg_color_btn.setStyleSheet(f"background-color: {existing_bg_color}; border: 1px solid #E5E7EB;")
+        _set_swatch(self.table_bg_color_btn, existing_bg_color)
         self.table_bg_color_label.setText(existing_bg_color)
-        self.table_header_text_color_btn.setStyleSheet(f"background-color: {existing_header_text_color}; border: 1px solid #E5E7EB;")
+        _set_swatch(self.table_header_text_color_btn, existing_header_text_color)
         self.table_header_text_color_label.setText(existing_header_text_color)
-        self.table_text_color_btn.setStyleSheet(f"background-color: {existing_text_color}; border: 1px solid #E5E7EB;")
+        _set_swatch(self.table_text_color_btn, existing_text_color)
         self.table_text_color_label.setText(existing_text_color)
         if hasattr(self, 'table_border_color_btn'):
-            self.table_border_color_btn.setStyleSheet(f"background-color: {existing_border_color}; border: 1px solid #E5E7EB;")
+            _set_swatch(self.table_border_color_btn, existing_border_color)
             self.table_border_color_label.setText(existing_border_color)
 
         # Set alignments
@@ -1002,7 +1417,7 @@ class TemplateBuilder(QMainWindow):
         
         # Styling section
         styling_label = QLabel("Table Styling:")
-        styling_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        styling_label.setFont(_font("Segoe UI", 10, QFont.Weight.Bold))
         form_layout.addRow(styling_label)
         
         form_layout.addRow("Font Family:", self.table_font_combo)
@@ -1089,7 +1504,7 @@ class TemplateBuilder(QMainWindow):
         self.table_sort_column_combo.currentTextChanged.connect(self.on_table_slide_changed)
         
         self.table_sort_order_combo = QComboBox()
-        self.table_sort_order_combo.addItems(['Descending', 'Ascending'])
+        self.table_sort_order_combo.setModel(_list_model(SORT_ORDERS))
         self.table_sort_order_combo.currentTextChanged.connect(self.on_table_slide_changed)
         
         self.table_group_by_combo = QComboBox()
@@ -1101,7 +1516,7 @@ class TemplateBuilder(QMainWindow):
         self.table_slide_note_input.textChanged.connect(self.on_table_slide_changed)
         
         self.table_font_combo = QComboBox()
-        self.table_font_combo.addItems(['Calibri', 'Arial', 'Segoe UI', 'Times New Roman', 'Verdana'])
+        self.table_font_combo.setModel(_list_model(CONTENT_FONTS))
         self.table_font_combo.currentTextChanged.connect(self.on_table_slide_changed)
         
         self.table_font_size_spin = QSpinBox()
@@ -1113,59 +1528,66 @@ class TemplateBuilder(QMainWindow):
         # Color buttons
         self.table_header_color_btn = QPushButton()
         self.table_header_color_btn.setFixedSize(40, 30)
-        self.table_header_color_btn.setStyleSheet("background-color: #2563EB; border: 1px solid #E5E7EB;")
-        self.table_header_color_btn.clicked.connect(lambda: self.pick_table_color('header'))
+        _set_swatch(self.table_header_color_btn, '#2563EB')
+        self.table_header_color_btn.setProperty("color_key", 'header')
+        self.table_header_color_btn.clicked.connect(self._on_table_color_clicked)
         self.table_header_color_label = QLabel("#2563EB")
         
         self.table_row1_color_btn = QPushButton()
         self.table_row1_color_btn.setFixedSize(40, 30)
-        self.table_row1_color_btn.setStyleSheet("background-color: #FFFFFF; border: 1px solid #E5E7EB;")
-        self.table_row1_color_btn.clicked.connect(lambda: self.pick_table_color('row1'))
+        _set_swatch(self.table_row1_color_btn, '#FFFFFF')
+        self.table_row1_color_btn.setProperty("color_key", 'row1')
+        self.table_row1_color_btn.clicked.connect(self._on_table_color_clicked)
         self.table_row1_color_label = QLabel("#FFFFFF")
         
         self.table_row2_color_btn = QPushButton()
         self.table_row2_color_btn.setFixedSize(40, 30)
-        self.table_row2_color_btn.setStyleSheet("background-color: #F9FAFB; border: 1px solid #E5E7EB;")
-        self.table_row2_color_btn.clicked.connect(lambda: self.pick_table_color('row2'))
+        _set_swatch(self.table_row2_color_btn, '#F9FAFB')
+        self.table_row2_color_btn.setProperty("color_key", 'row2')
+        self.table_row2_color_btn.clicked.connect(self._on_table_color_clicked)
         self.table_row2_color_label = QLabel("#F9FAFB")
 
         # Background color
         self.table_bg_color_btn = QPushButton()
         self.table_bg_color_btn.setFixedSize(40, 30)
-        self.table_bg_color_btn.setStyleSheet("background-color: #FFFFFF; border: 1px solid #E5E7EB;")
-        self.table_bg_color_btn.clicked.connect(lambda: self.pick_table_color('background'))
+        _set_swatch(self.table_bg_color_btn, '#FFFFFF')
+        self.table_bg_color_btn.setProperty("color_key", 'background')
+        self.table_bg_color_btn.clicked.connect(self._on_table_color_clicked)
         self.table_bg_color_label = QLabel("#FFFFFF")
 
         # Header text color
         self.table_header_text_color_btn = QPushButton()
         self.table_header_text_color_btn.setFixedSize(40, 30)
-        self.table_header_text_color_btn.setStyleSheet("background-color: #FFFFFF; border: 1px solid #E5E7EB;")
-        self.table_header_text_color_btn.clicked.connect(lambda: self.pick_table_color('header_text'))
+        _set_swatch(self.table_header_text_color_btn, '#FFFFFF')
+        self.table_header_text_color_btn.setProperty("color_key", 'header_text')
+        self.table_header_text_color_btn.clicked.connect(self._on_table_color_clicked)
         self.table_header_text_color_label = QLabel("#FFFFFF")
 
         # Data text color
         self.table_text_color_btn = QPushButton()
         self.table_text_color_btn.setFixedSize(40, 30)
-        self.table_text_color_btn.setStyleSheet("background-color: #1F2937; border: 1px solid #E5E7EB;")
-        self.table_text_color_btn.clicked.connect(lambda: self.pick_table_color('text'))
+        _set_swatch(self.table_text_color_btn, '#1F2937')
+        self.table_text_color_btn.setProperty("color_key", 'text')
+        self.table_text_color_btn.clicked.connect(self._on_table_color_clicked)
         self.table_text_color_label = QLabel("#1F2937")
 
         # Border/Grid color
         self.table_border_color_btn = QPushButton()
         self.table_border_color_btn.setFixedSize(40, 30)
-        self.table_border_color_btn.setStyleSheet("background-color: #E5E7EB; border: 1px solid #E5E7EB;")
-        self.table_border_color_btn.clicked.connect(lambda: self.pick_table_color('border'))
+        _set_swatch(self.table_border_color_btn, '#E5E7EB')
+        self.table_border_color_btn.setProperty("color_key", 'border')
+        self.table_border_color_btn.clicked.connect(self._on_table_color_clicked)
         self.table_border_color_label = QLabel("#E5E7EB")
 
         # Text alignment
         self.table_text_align_combo = QComboBox()
-        self.table_text_align_combo.addItems(['Left', 'Center', 'Right'])
+        self.table_text_align_combo.setModel(_list_model(ALIGNMENTS))
         self.table_text_align_combo.setCurrentText('Left')
         self.table_text_align_combo.currentTextChanged.connect(self.on_table_slide_changed)
 
         # Header alignment
         self.table_header_align_combo = QComboBox()
-        self.table_header_align_combo.addItems(['Left', 'Center', 'Right'])
+        self.table_header_align_combo.setModel(_list_model(ALIGNMENTS))
         self.table_header_align_combo.setCurrentText('Center')
         self.table_header_align_combo.currentTextChanged.connect(self.on_table_slide_changed)
 
@@ -1189,7 +1611,7 @@ class TemplateBuilder(QMainWindow):
     def _show_chart_editor(self):
         """Show chart editing panel"""
         title_label = QLabel("Chart Configuration")
-        title_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title_label.setFont(_font("Segoe UI", 12, QFont.Weight.Bold))
         self.config_layout.addWidget(title_label)
         
         # Get existing values from template_data instead of potentially deleted widgets
@@ -1316,7 +1738,7 @@ class TemplateBuilder(QMainWindow):
         
         # Styling section
         styling_label = QLabel("Chart Styling:")
-        styling_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        styling_label.setFont(_font("Segoe UI", 10, QFont.Weight.Bold))
         form_layout.addRow(styling_label)
         
         form_layout.addRow("Show Values:", self.chart_show_values_check)
@@ -1337,7 +1759,7 @@ class TemplateBuilder(QMainWindow):
         """Initialize chart input fields if they don't exist"""
         # Chart type
         self.chart_type_combo = QComboBox()
-        self.chart_type_combo.addItems(['column', 'bar', 'pie', 'line', 'stacked_column', 'stacked_bar'])
+        self.chart_type_combo.setModel(_list_model(CHART_TYPES))
         self.chart_type_combo.currentTextChanged.connect(self.on_chart_changed)
         
         # Chart title
@@ -1347,7 +1769,7 @@ class TemplateBuilder(QMainWindow):
 
         # Font controls
         self.chart_font_combo = QComboBox()
-        self.chart_font_combo.addItems(['Calibri', 'Arial', 'Segoe UI', 'Times New Roman', 'Verdana'])
+        self.chart_font_combo.setModel(_list_model(CONTENT_FONTS))
         self.chart_font_combo.currentTextChanged.connect(self.on_chart_changed)
 
         self.chart_font_size_spin = QSpinBox()
@@ -1382,7 +1804,7 @@ class TemplateBuilder(QMainWindow):
         
         # Calculation type
         self.chart_calculation_combo = QComboBox()
-        self.chart_calculation_combo.addItems(['sum', 'count', 'average', 'mean', 'max', 'min', 'percentage'])
+        self.chart_calculation_combo.setModel(_list_model(CALCULATIONS))
         self.chart_calculation_combo.currentTextChanged.connect(self.on_chart_changed)
         
         # Sort column
@@ -1392,7 +1814,7 @@ class TemplateBuilder(QMainWindow):
         
         # Sort order
         self.chart_sort_order_combo = QComboBox()
-        self.chart_sort_order_combo.addItems(['Descending', 'Ascending'])
+        self.chart_sort_order_combo.setModel(_list_model(SORT_ORDERS))
         self.chart_sort_order_combo.currentTextChanged.connect(self.on_chart_changed)
         
         # Top N
@@ -1432,6 +1854,7 @@ class TemplateBuilder(QMainWindow):
 
     def on_chart_changed(self):
         """Handle chart input changes - update preview if on chart slide"""
+        self._dirty = True
         # Save current chart settings to template_data
         self._save_chart_settings_to_template()
         
@@ -1446,21 +1869,21 @@ class TemplateBuilder(QMainWindow):
         """Show text editing panel"""
         label = QLabel("Text Configuration\n(Coming soon)")
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet("color: #9CA3AF; padding: 20px;")
+        label.setObjectName("placeholderLabel")
         self.config_layout.addWidget(label)
 
     def _show_image_editor(self):
         """Show image editing panel"""
         label = QLabel("Image Configuration\n(Coming soon)")
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet("color: #9CA3AF; padding: 20px;")
+        label.setObjectName("placeholderLabel")
         self.config_layout.addWidget(label)
 
     def _show_summary_editor(self):
         """Show summary editing panel"""
         label = QLabel("Summary Configuration\n(Coming soon)")
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet("color: #9CA3AF; padding: 20px;")
+        label.setObjectName("placeholderLabel")
         self.config_layout.addWidget(label)
 
     def _create_separator(self):
@@ -1468,19 +1891,34 @@ class TemplateBuilder(QMainWindow):
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
         line.setFrameShadow(QFrame.Shadow.Sunken)
-        line.setStyleSheet("background-color: #E5E7EB;")
+        line.setObjectName("separator")
         return line
 
     def show_preview_placeholder(self):
         """Show placeholder in preview"""
-        self.preview_scene.clear()
-        text = self.preview_scene.addText(
-            "Select a slide to preview\n\nOr add a new slide to get started",
-            QFont("Segoe UI", 14)
-        )
-        text.setDefaultTextColor(QColor("#9CA3AF"))
-        text_rect = text.boundingRect()
-        text.setPos(360 - text_rect.width()/2, 270 - text_rect.height()/2)
+        self._clear_preview_scene()
+        self._placeholder_item.setVisible(True)
+
+    def _add_scene_text(self, text, font, color):
+        """Add a plain-text item to the preview scene
+
+        QGraphicsSimpleTextItem draws the string directly, without the
+        QTextDocument layout a QGraphicsTextItem (addText) builds.
+        """
+        item = QGraphicsSimpleTextItem(text)
+        item.setFont(font)
+        item.setBrush(QBrush(color))
+        self.preview_scene.addItem(item)
+        return item
+
+    def _clear_preview_scene(self):
+        """Remove rendered slide items, keeping (and hiding) the persistent ones"""
+        persistent = (self._placeholder_item, self._preview_pixmap)
+        for item in self.preview_scene.items():
+            if item.parentItem() is None and item not in persistent:
+                self.preview_scene.removeItem(item)
+        self._placeholder_item.setVisible(False)
+        self._preview_pixmap.setVisible(False)
 
     # Template Settings Methods
     def select_logo(self):
@@ -1488,14 +1926,15 @@ class TemplateBuilder(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Logo",
-            "",
-            "Image Files (*.png *.jpg *.svg);;All Files (*.*)"
+            self.assets_dir,
+            "Image Files (*.png *.jpg *.svg);;All Files (*.*)",
+            options=QFileDialog.Option.DontResolveSymlinks
         )
         if file_path:
             self.template_data['logo_path'] = file_path
-            import os
-            self.logo_path_label.setText(os.path.basename(file_path))
-            self.logo_path_label.setStyleSheet("color: #10B981; font-weight: bold;")
+            self._dirty = True
+            self.logo_path_label.setText(_basename(file_path))
+            _set_path_label_selected(self.logo_path_label, True)
             # Update preview if on title slide
             if self.current_slide_index == 0:
                 self.update_preview()
@@ -1505,18 +1944,27 @@ class TemplateBuilder(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Embedded Logo",
-            "",
-            "Image Files (*.png *.jpg *.svg);;All Files (*.*)"
+            self.assets_dir,
+            "Image Files (*.png *.jpg *.svg);;All Files (*.*)",
+            options=QFileDialog.Option.DontResolveSymlinks
         )
         if file_path:
             self.template_data['embedded_logo_path'] = file_path
-            import os
-            self.embedded_logo_path_label.setText(os.path.basename(file_path))
-            self.embedded_logo_path_label.setStyleSheet("color: #10B981; font-weight: bold;")
+            self._dirty = True
+            self.embedded_logo_path_label.setText(_basename(file_path))
+            _set_path_label_selected(self.embedded_logo_path_label, True)
             # Update preview if on title slide
             if self.current_slide_index == 0:
                 self.update_preview()
 
+    def _on_color_clicked(self):
+        """Shared slot for the brand color buttons (keyed by their color_key)"""
+        self.pick_color(self.sender().property("color_key"))
+
+    def _on_table_color_clicked(self):
+        """Shared slot for the table color buttons (keyed by their color_key)"""
+        self.pick_table_color(self.sender().property("color_key"))
+
     def pick_color(self, color_type):
         """Pick color for template"""
         current_color = QColor(self.template_data['colors'][color_type])
@@ -1525,33 +1973,16 @@ class TemplateBuilder(QMainWindow):
         if color.isValid():
             hex_color = color.name()
             self.template_data['colors'][color_type] = hex_color
+            self._dirty = True
 
             # Update button and label
-            if color_type == 'primary':
-                self.primary_color_btn.setStyleSheet(f"background-color: {hex_color};")
-                self.primary_color_label.setText(hex_color)
-            elif color_type == 'secondary':
-                self.secondary_color_btn.setStyleSheet(f"background-color: {hex_color};")
-                self.secondary_color_label.setText(hex_color)
-            elif color_type == 'accent':
-                self.accent_color_btn.setStyleSheet(f"background-color: {hex_color};")
-                self.accent_color_label.setText(hex_color)
+            self._apply_brand_color(color_type, hex_color)
 
     def pick_table_color(self, color_type):
         """Pick color for table styling"""
         table_style = self.template_data.get('table_slide', {}).get('style', {})
         
-        color_map = {
-            'header': ('header_color', '#2563EB'),
-            'row1': ('row_color_1', '#FFFFFF'),
-            'row2': ('row_color_2', '#F9FAFB'),
-            'background': ('background_color', '#FFFFFF'),
-            'header_text': ('header_text_color', '#FFFFFF'),
-            'text': ('text_color', '#1F2937'),
-            'border': ('border_color', '#E5E7EB')
-        }
-        
-        style_key, default_color = color_map.get(color_type, ('header_color', '#2563EB'))
+        style_key, default_color, widget_prefix = _TABLE_COLORS.get(color_type, _TABLE_COLORS['header'])
         current_color_hex = table_style.get(style_key, default_color)
         current_color = QColor(current_color_hex)
         
@@ -1566,33 +1997,19 @@ class TemplateBuilder(QMainWindow):
             if 'style' not in self.template_data['table_slide']:
                 self.template_data['table_slide']['style'] = {}
             self.template_data['table_slide']['style'][style_key] = hex_color
+            self._dirty = True
 
             # Update UI
-            if color_type == 'header':
-                self.table_header_color_btn.setStyleSheet(f"background-color: {hex_color}; border: 1px solid #E5E7EB;")
-                self.table_header_color_label.setText(hex_color)
-            elif color_type == 'row1':
-                self.table_row1_color_btn.setStyleSheet(f"background-color: {hex_color}; border: 1px solid #E5E7EB;")
-                self.table_row1_color_label.setText(hex_color)
-            elif color_type == 'row2':
-                self.table_row2_color_btn.setStyleSheet(f"background-color: {hex_color}; border: 1px solid #E5E7EB;")
-                self.table_row2_color_label.setText(hex_color)
-            elif color_type == 'background':
-                self.table_bg_color_btn.setStyleSheet(f"background-color: {hex_color}; border: 1px solid #E5E7EB;")
-                self.table_bg_color_label.setText(hex_color)
-            elif color_type == 'header_text':
-                self.table_header_text_color_btn.setStyleSheet(f"background-color: {hex_color}; border: 1px solid #E5E7EB;")
-                self.table_header_text_color_label.setText(hex_color)
-            elif color_type == 'text':
-                self.table_text_color_btn.setStyleSheet(f"background-color: {hex_color}; border: 1px solid #E5E7EB;")
-                self.table_text_color_label.setText(hex_color)
-            elif color_type == 'border':
-                self.table_border_color_btn.setStyleSheet(f"background-color: {hex_color}; border: 1px solid #E5E7EB;")
-                self.table_border_color_label.setText(hex_color)
+            self._apply_table_color(widget_prefix, hex_color)
 
             # Update preview
             self.on_table_slide_changed()
 
+    def _apply_table_color(self, widget_prefix, hex_color):
+        """Show a table color on its swatch button and hex label"""
+        _set_swatch(getattr(self, widget_prefix + '_btn'), hex_color)
+        getattr(self, widget_prefix + '_label').setText(hex_color)
+
     # Slide Management Methods
     def add_slide(self):
         """Add new slide"""
@@ -1604,18 +2021,11 @@ class TemplateBuilder(QMainWindow):
         layout = QVBoxLayout(dialog)
 
         label = QLabel("Slide Type:")
-        label.setFont(QFont("Segoe UI", 11))
+        label.setFont(_font("Segoe UI", 11))
         layout.addWidget(label)
 
         type_combo = QComboBox()
-        type_combo.addItems([
-            "Blank Slide",
-            "Title Slide",
-            "Table Slide",
-            "Chart Slide",
-            "Mixed Content (Table + Chart)",
-            "Summary/Insights Slide"
-        ])
+        type_combo.setModel(_list_model(SLIDE_TYPES))
         layout.addWidget(type_combo)
 
         name_label = QLabel("Slide Name:")
@@ -1643,14 +2053,19 @@ class TemplateBuilder(QMainWindow):
             }
 
             self.template_data['slides'].append(slide_data)
+            self._dirty = True
+            self._validation_cache = None
 
             # Add item with editable flag
             item = QListWidgetItem(f"{len(self.template_data['slides'])}. {slide_name}")
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
+            item.setFlags(_SLIDE_ITEM_FLAGS)
             self.slide_list.addItem(item)
 
     def remove_slide(self):
         """Remove selected slide"""
+        # Apply an inline rename still waiting on its timer
+        self._commit_rename()
+
         current_row = self.slide_list.currentRow()
         if current_row >= 0:
             reply = QMessageBox.question(
@@ -1662,48 +2077,77 @@ class TemplateBuilder(QMainWindow):
 
             if reply == QMessageBox.StandardButton.Yes:
                 del self.template_data['slides'][current_row]
+                self._dirty = True
+                self._validation_cache = None
                 self.slide_list.takeItem(current_row)
-                self.update_slide_numbers()
+                # Only rows after the removed one shift
+                self.update_slide_numbers(current_row)
 
     def move_slide_up(self):
         """Move slide up in order"""
         current_row = self.slide_list.currentRow()
         if current_row > 0:
-            # Swap in data
-            self.template_data['slides'][current_row], self.template_data['slides'][current_row - 1] = \
-                self.template_data['slides'][current_row - 1], self.template_data['slides'][current_row]
-
-            # Swap in list
-            item = self.slide_list.takeItem(current_row)
-            self.slide_list.insertItem(current_row - 1, item)
-            self.slide_list.setCurrentRow(current_row - 1)
-            self.update_slide_numbers()
+            self._swap_slides(current_row, current_row - 1)
 
     def move_slide_down(self):
         """Move slide down in order"""
         current_row = self.slide_list.currentRow()
         if current_row >= 0 and current_row < self.slide_list.count() - 1:
-            # Swap in data
-            self.template_data['slides'][current_row], self.template_data['slides'][current_row + 1] = \
-                self.template_data['slides'][current_row + 1], self.template_data['slides'][current_row]
-
-            # Swap in list
-            item = self.slide_list.takeItem(current_row)
-            self.slide_list.insertItem(current_row + 1, item)
-            self.slide_list.setCurrentRow(current_row + 1)
-            self.update_slide_numbers()
-
-    def update_slide_numbers(self):
-        """Update slide numbers in list"""
-        for i in range(self.slide_list.count()):
-            item = self.slide_list.item(i)
-            slide_name = self.template_data['slides'][i]['name']
-            item.setText(f"{i + 1}. {slide_name}")
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
+            self._swap_slides(current_row, current_row + 1)
+
+    def _swap_slides(self, src, dst):
+        """Swap slide src with its neighbour dst in the data and the list"""
+        # Apply an inline rename still waiting on its timer
+        self._commit_rename()
+
+        slides = self.template_data['slides']
+        slides[src], slides[dst] = slides[dst], slides[src]
+        self._dirty = True
+        self._validation_cache = None
+
+        # The slide being edited moves with its row
+        if self.current_slide_index == src:
+            self.current_slide_index = dst
+
+        # Rows stay where they are; only the two labels trade names (the
+        # number prefixes are unchanged)
+        self.update_slide_numbers(min(src, dst), max(src, dst) + 1)
+        self.slide_list.setCurrentRow(dst)
+        self.update_preview()
+
+    def update_slide_numbers(self, start=0, end=None):
+        """Update slide numbers in list for rows start..end (exclusive, default: all)"""
+        if end is None or end > self.slide_list.count():
+            end = self.slide_list.count()
+
+        # setText would otherwise fire itemChanged (slide_renamed) per row
+        self.slide_list.setUpdatesEnabled(False)
+        self.slide_list.blockSignals(True)
+        try:
+            for i in range(start, end):
+                item = self.slide_list.item(i)
+                slide_name = self.template_data['slides'][i]['name']
+                # Rows are created editable; only the number prefix changes
+                item.setText(f"{i + 1}. {slide_name}")
+        finally:
+            self.slide_list.blockSignals(False)
+            self.slide_list.setUpdatesEnabled(True)
+        self.slide_list.viewport().update()
 
     def slide_renamed(self, item):
         """Handle slide rename (double-click to edit)"""
-        # Get the row index
+        # Applied by _commit_rename once the list stops changing
+        self._pending_rename = item
+        self._rename_timer.start()
+
+    def _commit_rename(self):
+        """Write the pending slide rename back to template_data"""
+        self._rename_timer.stop()
+        item, self._pending_rename = self._pending_rename, None
+        if item is None:
+            return
+
+        # Row is looked up now - the slide may have moved since the edit
         row = self.slide_list.row(item)
         if 0 <= row < len(self.template_data['slides']):
             # Extract new name from "1. New Name" format
@@ -1714,11 +2158,21 @@ class TemplateBuilder(QMainWindow):
             else:
                 new_name = new_text
 
-            # Update template data
-            self.template_data['slides'][row]['name'] = new_name
+            slide = self.template_data['slides'][row]
+            if slide['name'] != new_name:
+                # Update template data
+                slide['name'] = new_name
+                self._dirty = True
+                self._validation_cache = None
 
             # Update the item text to ensure proper formatting
-            item.setText(f"{row + 1}. {new_name}")
+            formatted = f"{row + 1}. {new_name}"
+            if new_text != formatted:
+                self.slide_list.blockSignals(True)
+                try:
+                    item.setText(formatted)
+                finally:
+                    self.slide_list.blockSignals(False)
 
     def slide_selected(self, index):
         """Handle slide selection"""
@@ -1755,7 +2209,8 @@ class TemplateBuilder(QMainWindow):
                 f"Slide {self.current_slide_index + 1} of {len(self.template_data['slides'])}"
             )
 
-            self.preview_scene.clear()
+            self._clear_preview_scene()
+            self.preview_view.setRenderHint(QPainter.RenderHint.Antialiasing, False)
 
             # Check if this is the title slide (first slide)
             if self.current_slide_index == 0:
@@ -1767,22 +2222,14 @@ class TemplateBuilder(QMainWindow):
             elif self._is_chart_slide(slide) or (self.current_slide_index > 0 and self._has_chart_settings()):
                 self._render_chart_slide_preview(slide)
             else:
-                # For other slides, show component info
-                slide_name = slide.get('name', 'Untitled Slide')
-                slide_type = slide.get('type', 'N/A')
-                slide_layout = slide.get('layout', 'N/A')
-                num_components = len(slide.get('components', []))
-
-                preview_text = f"{slide_name}\n"
-                if slide_type != 'N/A':
-                    preview_text += f"Type: {slide_type}\n"
-                if slide_layout != 'N/A':
-                    preview_text += f"Layout: {slide_layout}\n"
-                preview_text += f"\nComponents: {num_components}"
-
-                text = self.preview_scene.addText(preview_text, QFont("Segoe UI", 14))
-                text_rect = text.boundingRect()
-                text.setPos(360 - text_rect.width()/2, 270 - text_rect.height()/2)
+                # For other slides, show component info (cached pixmap)
+                self._preview_pixmap.setPixmap(_render_slide_info_pixmap(
+                    slide.get('name', 'Untitled Slide'),
+                    slide.get('type', 'N/A'),
+                    slide.get('layout', 'N/A'),
+                    tuple(comp.get('type', '?') for comp in slide.get('components', []))
+                ))
+                self._preview_pixmap.setVisible(True)
 
     def _render_title_slide_preview(self):
         """Render title slide components in preview"""
@@ -1842,9 +2289,8 @@ class TemplateBuilder(QMainWindow):
 
         # Render title text
         if title:
-            title_font = QFont("Calibri", 40, QFont.Weight.Bold)
-            title_item = self.preview_scene.addText(title, title_font)
-            title_item.setDefaultTextColor(QColor("#1F2937"))
+            title_font = _font("Calibri", 40, QFont.Weight.Bold)
+            title_item = self._add_scene_text(title, title_font, _color("#1F2937"))
             # Center horizontally, position vertically
             title_rect = title_item.boundingRect()
             title_x = (720 - title_rect.width()) / 2  # Center in 720px width
@@ -1852,18 +2298,16 @@ class TemplateBuilder(QMainWindow):
 
         # Render subtitle text
         if subtitle:
-            subtitle_font = QFont("Calibri", 28)
-            subtitle_item = self.preview_scene.addText(subtitle, subtitle_font)
-            subtitle_item.setDefaultTextColor(QColor("#2563EB"))
+            subtitle_font = _font("Calibri", 28)
+            subtitle_item = self._add_scene_text(subtitle, subtitle_font, _color("#2563EB"))
             subtitle_rect = subtitle_item.boundingRect()
             subtitle_x = (720 - subtitle_rect.width()) / 2
             subtitle_item.setPos(subtitle_x, (title_pos['y'] + 1.0) * INCH_TO_PIXEL)
 
         # Render description text
         if description:
-            desc_font = QFont("Calibri", 16)
-            desc_item = self.preview_scene.addText(description, desc_font)
-            desc_item.setDefaultTextColor(QColor("#6B7280"))
+            desc_font = _font("Calibri", 16)
+            desc_item = self._add_scene_text(description, desc_font, _color("#6B7280"))
             desc_rect = desc_item.boundingRect()
             desc_x = (720 - desc_rect.width()) / 2
             desc_item.setPos(desc_x, (title_pos['y'] + 2.0) * INCH_TO_PIXEL)
@@ -1972,9 +2416,8 @@ class TemplateBuilder(QMainWindow):
         
         # Render title
         if title:
-            title_font = QFont("Calibri", 16, QFont.Weight.Bold)
-            title_item = self.preview_scene.addText(title, title_font)
-            title_item.setDefaultTextColor(QColor("#1F2937"))
+            title_font = _font("Calibri", 16, QFont.Weight.Bold)
+            title_item = self._add_scene_text(title, title_font, _color("#1F2937"))
             title_item.setPos(0.5 * INCH_TO_PIXEL, 0.3 * INCH_TO_PIXEL)
         
         # Get chart type
@@ -1993,7 +2436,7 @@ class TemplateBuilder(QMainWindow):
         self.preview_scene.addRect(
             chart_x, chart_y,
             chart_width, chart_height,
-            QColor("#FFFFFF"), QColor("#E5E7EB")
+            _color("#FFFFFF"), _color("#E5E7EB")
         )
 
         # Get colors from UI or settings
@@ -2010,6 +2453,11 @@ class TemplateBuilder(QMainWindow):
         if not colors:
             colors = ['#2563EB', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6']
 
+        # Only curved chart previews benefit from antialiasing
+        self.preview_view.setRenderHint(
+            QPainter.RenderHint.Antialiasing, chart_type in ('pie', 'line')
+        )
+
         # Render appropriate chart type
         if chart_type == 'pie':
             self._render_pie_preview(chart_x, chart_y, chart_width, chart_height, colors)
@@ -2039,7 +2487,7 @@ class TemplateBuilder(QMainWindow):
             bar_y = chart_y + chart_height - bar_height
 
             color_index = i % len(colors)
-            bar_color = QColor(colors[color_index])
+            bar_color = _color(colors[color_index])
 
             self.preview_scene.addRect(
                 bar_x - bar_width * 0.3, bar_y,
@@ -2048,16 +2496,14 @@ class TemplateBuilder(QMainWindow):
             )
 
             value_text = str(100 - i * 15)
-            value_font = QFont("Calibri", 9)
-            value_item = self.preview_scene.addText(value_text, value_font)
-            value_item.setDefaultTextColor(QColor("#1F2937"))
+            value_font = _font("Calibri", 9)
+            value_item = self._add_scene_text(value_text, value_font, _color("#1F2937"))
             value_rect = value_item.boundingRect()
             value_item.setPos(bar_x - value_rect.width() / 2, bar_y - value_rect.height() - 2)
 
             category_text = f"Item {i + 1}"
-            category_font = QFont("Calibri", 8)
-            category_item = self.preview_scene.addText(category_text, category_font)
-            category_item.setDefaultTextColor(QColor("#6B7280"))
+            category_font = _font("Calibri", 8)
+            category_item = self._add_scene_text(category_text, category_font, _color("#6B7280"))
             category_rect = category_item.boundingRect()
             category_item.setPos(bar_x - category_rect.width() / 2, chart_y + chart_height + 5)
 
@@ -2072,7 +2518,7 @@ class TemplateBuilder(QMainWindow):
             bar_width = max_width * (0.9 - i * 0.15)
 
             color_index = i % len(colors)
-            bar_color = QColor(colors[color_index])
+            bar_color = _color(colors[color_index])
 
             self.preview_scene.addRect(
                 chart_x + 100, bar_y - bar_height * 0.3,
@@ -2081,22 +2527,19 @@ class TemplateBuilder(QMainWindow):
             )
 
             value_text = str(100 - i * 15)
-            value_font = QFont("Calibri", 9)
-            value_item = self.preview_scene.addText(value_text, value_font)
-            value_item.setDefaultTextColor(QColor("#1F2937"))
+            value_font = _font("Calibri", 9)
+            value_item = self._add_scene_text(value_text, value_font, _color("#1F2937"))
             value_rect = value_item.boundingRect()
             value_item.setPos(chart_x + 100 + bar_width + 5, bar_y - value_rect.height() / 2)
 
             category_text = f"Item {i + 1}"
-            category_font = QFont("Calibri", 8)
-            category_item = self.preview_scene.addText(category_text, category_font)
-            category_item.setDefaultTextColor(QColor("#6B7280"))
+            category_font = _font("Calibri", 8)
+            category_item = self._add_scene_text(category_text, category_font, _color("#6B7280"))
             category_rect = category_item.boundingRect()
             category_item.setPos(chart_x + 10, bar_y - category_rect.height() / 2)
 
     def _render_pie_preview(self, chart_x, chart_y, chart_width, chart_height, colors):
         """Render pie chart preview"""
-        import math
         center_x = chart_x + chart_width / 2
         center_y = chart_y + chart_height / 2
         radius = min(chart_width, chart_height) * 0.35
@@ -2107,12 +2550,9 @@ class TemplateBuilder(QMainWindow):
 
         for i, angle in enumerate(angles):
             color_index = i % len(colors)
-            slice_color = QColor(colors[color_index])
+            slice_color = _color(colors[color_index])
 
             # Use QPainterPath to draw pie slice
-            from PyQt6.QtGui import QPainterPath
-            from PyQt6.QtCore import QRectF
-
             rect = QRectF(center_x - radius, center_y - radius, radius * 2, radius * 2)
             path = QPainterPath()
             path.moveTo(center_x, center_y)
@@ -2125,16 +2565,13 @@ class TemplateBuilder(QMainWindow):
 
     def _render_line_preview(self, chart_x, chart_y, chart_width, chart_height, colors):
         """Render line chart preview"""
-        from PyQt6.QtGui import QPen
-        from PyQt6.QtCore import Qt
-
         num_points = 6
         point_spacing = chart_width / (num_points + 1)
 
         # Generate sample data points
         heights = [0.3, 0.6, 0.5, 0.7, 0.4, 0.8]
 
-        pen = QPen(QColor(colors[0]))
+        pen = QPen(_color(colors[0]))
         pen.setWidth(3)
 
         for i in range(len(heights) - 1):
@@ -2147,12 +2584,12 @@ class TemplateBuilder(QMainWindow):
             self.preview_scene.addLine(x1, y1, x2, y2, pen)
 
             # Draw point
-            self.preview_scene.addEllipse(x1 - 4, y1 - 4, 8, 8, pen, QColor(colors[0]))
+            self.preview_scene.addEllipse(x1 - 4, y1 - 4, 8, 8, pen, _color(colors[0]))
 
         # Draw last point
         x_last = chart_x + len(heights) * point_spacing
         y_last = chart_y + chart_height - (heights[-1] * chart_height * 0.8)
-        self.preview_scene.addEllipse(x_last - 4, y_last - 4, 8, 8, pen, QColor(colors[0]))
+        self.preview_scene.addEllipse(x_last - 4, y_last - 4, 8, 8, pen, _color(colors[0]))
 
     def _render_stacked_column_preview(self, chart_x, chart_y, chart_width, chart_height, colors):
         """Render stacked vertical column chart preview"""
@@ -2167,7 +2604,7 @@ class TemplateBuilder(QMainWindow):
             segments = [0.3, 0.25, 0.2]
             for j, segment_height in enumerate(segments):
                 color_index = j % len(colors)
-                segment_color = QColor(colors[color_index])
+                segment_color = _color(colors[color_index])
 
                 height = chart_height * segment_height
                 current_y -= height
@@ -2178,9 +2615,8 @@ class TemplateBuilder(QMainWindow):
                 )
 
             category_text = f"Item {i + 1}"
-            category_font = QFont("Calibri", 8)
-            category_item = self.preview_scene.addText(category_text, category_font)
-            category_item.setDefaultTextColor(QColor("#6B7280"))
+            category_font = _font("Calibri", 8)
+            category_item = self._add_scene_text(category_text, category_font, _color("#6B7280"))
             category_rect = category_item.boundingRect()
             category_item.setPos(bar_x - category_rect.width() / 2, chart_y + chart_height + 5)
 
@@ -2197,7 +2633,7 @@ class TemplateBuilder(QMainWindow):
             segments = [0.3, 0.25, 0.2]
             for j, segment_width in enumerate(segments):
                 color_index = j % len(colors)
-                segment_color = QColor(colors[color_index])
+                segment_color = _color(colors[color_index])
 
                 width = chart_width * segment_width
                 self.preview_scene.addRect(
@@ -2208,9 +2644,8 @@ class TemplateBuilder(QMainWindow):
                 current_x += width
 
             category_text = f"Item {i + 1}"
-            category_font = QFont("Calibri", 8)
-            category_item = self.preview_scene.addText(category_text, category_font)
-            category_item.setDefaultTextColor(QColor("#6B7280"))
+            category_font = _font("Calibri", 8)
+            category_item = self._add_scene_text(category_text, category_font, _color("#6B7280"))
             category_rect = category_item.boundingRect()
             category_item.setPos(chart_x + 10, bar_y - category_rect.height() / 2)
 
@@ -2254,13 +2689,13 @@ class TemplateBuilder(QMainWindow):
             font_size = self.table_font_size_spin.value() if hasattr(self, 'table_font_size_spin') and self.table_font_size_spin else table_style.get('font_size', 11)
         except RuntimeError:
             font_size = table_style.get('font_size', 11)
-        header_color = QColor(table_style.get('header_color', '#2563EB'))
-        header_text_color = QColor(table_style.get('header_text_color', '#FFFFFF'))
-        row_color_1 = QColor(table_style.get('row_color_1', '#FFFFFF'))
-        row_color_2 = QColor(table_style.get('row_color_2', '#F9FAFB'))
-        text_color = QColor(table_style.get('text_color', '#1F2937'))
-        bg_color = QColor(table_style.get('background_color', '#FFFFFF'))
-        border_color = QColor(table_style.get('border_color', '#E5E7EB'))
+        header_color = _color(table_style.get('header_color', '#2563EB'))
+        header_text_color = _color(table_style.get('header_text_color', '#FFFFFF'))
+        row_color_1 = _color(table_style.get('row_color_1', '#FFFFFF'))
+        row_color_2 = _color(table_style.get('row_color_2', '#F9FAFB'))
+        text_color = _color(table_style.get('text_color', '#1F2937'))
+        bg_color = _color(table_style.get('background_color', '#FFFFFF'))
+        border_color = _color(table_style.get('border_color', '#E5E7EB'))
 
         # Get text style settings
         header_bold = table_style.get('header_bold', True)
@@ -2294,25 +2729,22 @@ class TemplateBuilder(QMainWindow):
 
         # Render title
         if title:
-            title_font = QFont("Calibri", 32, QFont.Weight.Bold)
-            title_item = self.preview_scene.addText(title, title_font)
-            title_item.setDefaultTextColor(QColor("#1F2937"))
+            title_font = _font("Calibri", 32, QFont.Weight.Bold)
+            title_item = self._add_scene_text(title, title_font, _color("#1F2937"))
             title_item.setPos(0.5 * INCH_TO_PIXEL, 0.4 * INCH_TO_PIXEL)
 
         # Render subtitle
         if subtitle:
-            subtitle_font = QFont("Calibri", 16)
-            subtitle_item = self.preview_scene.addText(subtitle, subtitle_font)
-            subtitle_item.setDefaultTextColor(QColor("#6B7280"))
+            subtitle_font = _font("Calibri", 16)
+            subtitle_item = self._add_scene_text(subtitle, subtitle_font, _color("#6B7280"))
             subtitle_item.setPos(0.5 * INCH_TO_PIXEL, 1.0 * INCH_TO_PIXEL)
 
         # Render table preview with proper structure
         # If no columns selected, show empty table or message
         if not selected_columns:
             # Show a message that no columns are selected
-            empty_msg_font = QFont("Calibri", 14)
-            empty_msg = self.preview_scene.addText("No columns selected. Please select columns to display.", empty_msg_font)
-            empty_msg.setDefaultTextColor(QColor("#9CA3AF"))
+            empty_msg_font = _font("Calibri", 14)
+            empty_msg = self._add_scene_text("No columns selected. Please select columns to display.", empty_msg_font, _color("#9CA3AF"))
             empty_msg.setPos(0.5 * INCH_TO_PIXEL, 2.0 * INCH_TO_PIXEL)
             return  # Don't render table if no columns
         
@@ -2343,8 +2775,11 @@ class TemplateBuilder(QMainWindow):
         )
         
         # Column headers with borders
-        header_font = QFont(font_name, font_size, QFont.Weight.Bold if header_bold else QFont.Weight.Normal)
-        header_font.setItalic(header_italic)
+        header_font = _font(
+            font_name, font_size,
+            QFont.Weight.Bold if header_bold else QFont.Weight.Normal,
+            bool(header_italic)
+        )
         for i, col in enumerate(selected_columns):
             col_x = table_x + i * col_width
             # Cell border
@@ -2384,8 +2819,11 @@ class TemplateBuilder(QMainWindow):
 
         # Data rows (always show at least 5 empty rows)
         sample_rows = 5
-        cell_font = QFont(font_name, font_size, QFont.Weight.Bold if text_bold else QFont.Weight.Normal)
-        cell_font.setItalic(text_italic)
+        cell_font = _font(
+            font_name, font_size,
+            QFont.Weight.Bold if text_bold else QFont.Weight.Normal,
+            bool(text_italic)
+        )
         for row_idx in range(sample_rows):
             row_y = table_y + row_height + row_idx * row_height
             # Alternate row colors
@@ -2412,8 +2850,7 @@ class TemplateBuilder(QMainWindow):
                 if col_idx == 0:
                     cell_text = f"Row {row_idx + 1}" if row_idx < 3 else ""
                     if cell_text:
-                        cell_item = self.preview_scene.addText(cell_text, cell_font)
-                        cell_item.setDefaultTextColor(text_color)
+                        cell_item = self._add_scene_text(cell_text, cell_font, text_color)
                         cell_rect = cell_item.boundingRect()
 
                         # Apply text alignment
@@ -2431,13 +2868,13 @@ class TemplateBuilder(QMainWindow):
 
         # Render note if present
         if note:
-            note_font = QFont("Calibri", 11)
-            note_item = self.preview_scene.addText(f"• {note}", note_font)
-            note_item.setDefaultTextColor(QColor("#6B7280"))
+            note_font = _font("Calibri", 11)
+            note_item = self._add_scene_text(f"• {note}", note_font, _color("#6B7280"))
             note_item.setPos(0.5 * INCH_TO_PIXEL, 5.5 * INCH_TO_PIXEL)
 
     def on_title_slide_changed(self):
         """Handle title slide input changes - update preview if on first slide"""
+        self._dirty = True
         if self.current_slide_index == 0:
             self.update_preview()
 
@@ -2504,6 +2941,7 @@ class TemplateBuilder(QMainWindow):
 
     def on_table_slide_changed(self):
         """Handle table slide input changes - update preview if on table slide"""
+        self._dirty = True
         # Save current table styling settings to template_data
         self._save_table_styling_to_template()
 
@@ -2865,8 +3303,20 @@ class TemplateBuilder(QMainWindow):
         Validate template before saving.
         Returns (is_valid, error_message)
         """
-        # Check template name
+        # Slides only change through the handlers that clear the cache, so
+        # the name is the only other input to check
         template_name = self.template_name_input.text().strip()
+        cached = self._validation_cache
+        if cached is not None and cached[0] == template_name:
+            return cached[1]
+
+        result = self._validate_template(template_name)
+        self._validation_cache = (template_name, result)
+        return result
+
+    def _validate_template(self, template_name):
+        """Walk the template name, slides and components for validate_template"""
+        # Check template name
         if not template_name:
             return False, "Template name is required."
 
@@ -2888,20 +3338,13 @@ class TemplateBuilder(QMainWindow):
                 continue
 
             # Validate each component
-            for j, component in enumerate(slide['components']):
-                comp_num = j + 1
-
-                # Check component type
-                if 'type' not in component:
-                    return False, f"Slide {slide_num}, Component {comp_num}: Missing type."
-
-                # Check position
-                if 'position' not in component:
-                    return False, f"Slide {slide_num}, Component {comp_num}: Missing position."
-
-                # Check size
-                if 'size' not in component:
-                    return False, f"Slide {slide_num}, Component {comp_num}: Missing size."
+            for comp_num, component in enumerate(slide['components'], 1):
+                # One C-level keys-view test covers the common all-present case
+                if not component.keys() >= _COMPONENT_REQUIRED_KEYS:
+                    # Report the first missing key: type, position, size
+                    for key in ('type', 'position', 'size'):
+                        if key not in component:
+                            return False, f"Slide {slide_num}, Component {comp_num}: Missing {key}."
 
                 # Type-specific validation
                 comp_type = component['type']
@@ -2924,15 +3367,23 @@ class TemplateBuilder(QMainWindow):
 
     def save_template(self):
         """Save template to JSON file in PPTGenerator format"""
+        self._save_template(pretty=False)
+
+    def _save_template(self, pretty):
+        """Validate, ask for a path and write the template (indented if pretty)"""
         print(f"[DEBUG] save_template: Starting save")
 
-        # Prevent re-entrant calls
-        if hasattr(self, '_is_saving') and self._is_saving:
-            print(f"[DEBUG] save_template: Already saving, ignoring duplicate call")
+        # Prevent re-entrant calls, and saving over a load still in flight
+        if self._is_saving or self._io_task is not None:
+            print(f"[DEBUG] save_template: Template I/O in progress, ignoring call")
             return
 
         self._is_saving = True
+        dispatched = False
         try:
+            # Apply an inline rename still waiting on its timer
+            self._commit_rename()
+
             # Save current component settings before saving template
             self._save_table_styling_to_template()
             self._save_chart_settings_to_template()
@@ -2972,19 +3423,18 @@ class TemplateBuilder(QMainWindow):
                 return
 
             # Default save location: templates/configs/
-            import os
-            default_dir = os.path.join(os.getcwd(), "templates", "configs")
-            os.makedirs(default_dir, exist_ok=True)
-            default_filename = os.path.join(default_dir, f"{template_name.replace(' ', '_')}_Template.json")
+            os.makedirs(self.templates_dir, exist_ok=True)
+            safe_name = template_name.translate(_FILENAME_TRANSLATION)
+            default_filename = os.path.join(self.templates_dir, f"{safe_name}_Template.json")
 
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
-                "Save Template",
-                default_filename,
-                "JSON Files (*.json)"
-            )
+            file_path = self._pick_template_file("Save Template", default_filename, save=True)
+
+            if file_path and not pretty and not self._dirty and self._is_saved_source(file_path):
+                # Nothing changed since this file was loaded or saved
+                self._on_template_saved(file_path, None)
+            elif file_path:
+                today = datetime.now().strftime("%Y-%m-%d")
 
-            if file_path:
                 # Convert to PPTGenerator format
                 ppt_template = {
                     "metadata": {
@@ -2993,8 +3443,9 @@ class TemplateBuilder(QMainWindow):
                     "industry": industry,
                     "author": "ReportForge Template Builder",
                     "version": "1.0",
-                    "created_date": datetime.now().strftime("%Y-%m-%d"),
-                    "modified_date": datetime.now().strftime("%Y-%m-%d")
+                    # Re-saving a loaded template keeps its creation date
+                    "created_date": self.template_data.get('created_date') or today,
+                    "modified_date": today
                 },
                 "settings": {
                     "page_size": "16:9",
@@ -3027,354 +3478,458 @@ class TemplateBuilder(QMainWindow):
                 "slides": self.template_data['slides']
             }
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(ppt_template, f, indent=2, ensure_ascii=False)
-
-            QMessageBox.information(
+                # Serialize and write on the I/O pool. The worker gets its own
+                # copy so edits made meanwhile can't race the encoder
+                self._io_task = _JsonIOTask(file_path, copy.deepcopy(ppt_template), pretty)
+                self._io_task.signals.finished.connect(self._on_template_saved)
+                self._io_pool.start(self._io_task)
+                dispatched = True
+        finally:
+            # A dispatched save keeps the flag until _on_template_saved
+            if not dispatched:
+                self._is_saving = False
+                print(f"[DEBUG] save_template: Cleared _is_saving flag")
+
+    def _on_template_saved(self, file_path, error):
+        """Report the result of a background template save"""
+        self._io_task = None
+        self._is_saving = False
+        close_after_save, self._close_after_save = self._close_after_save, False
+
+        if error is not None:
+            QMessageBox.critical(
                 self,
-                "Template Saved",
-                f"Template saved successfully to:\n{file_path}\n\n"
-                f"Slides: {len(self.template_data['slides'])}\n"
-                f"Format: PPTGenerator JSON"
+                "Save Error",
+                f"Failed to save template:\n{str(error)}"
             )
-            print(f"[DEBUG] save_template: Save completed successfully")
-        finally:
-            self._is_saving = False
-            print(f"[DEBUG] save_template: Cleared _is_saving flag")
+            return
+
+        self._dirty = False
+        try:
+            self._saved_source = (file_path, os.stat(file_path).st_mtime_ns)
+        except OSError:
+            self._saved_source = None
+
+        QMessageBox.information(
+            self,
+            "Template Saved",
+            f"Template saved successfully to:\n{file_path}\n\n"
+            f"Slides: {len(self.template_data['slides'])}\n"
+            f"Format: PPTGenerator JSON"
+        )
+        print(f"[DEBUG] save_template: Save completed successfully")
+
+        if close_after_save:
+            self.close()
+
+    def _pick_template_file(self, title, default_path="", save=False):
+        """Ask for a template JSON file; returns its path, or "" if cancelled"""
+        dialog = self._file_dialog
+        if dialog is None:
+            dialog = self._file_dialog = QFileDialog(self)
+            dialog.setNameFilters(["JSON Files (*.json)", "All Files (*.*)"])
+            dialog.setOption(QFileDialog.Option.DontResolveSymlinks)
+
+        dialog.setWindowTitle(title)
+        if save:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+            dialog.setDefaultSuffix("json")
+        else:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            dialog.setDefaultSuffix("")
+        dialog.setDirectory(self.templates_dir)
+        dialog.selectNameFilter("JSON Files (*.json)")
+        dialog.selectFile(default_path)
+
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return ""
+        selected = dialog.selectedFiles()
+        return selected[0] if selected else ""
+
+    def _is_saved_source(self, file_path):
+        """Whether file_path is unchanged on disk since template_data was loaded from or saved to it"""
+        if self._saved_source is None or self._saved_source[0] != file_path:
+            return False
+        try:
+            return os.stat(file_path).st_mtime_ns == self._saved_source[1]
+        except OSError:
+            return False
 
     def load_template(self):
         """Load template from JSON file (supports PPTGenerator format)"""
-        import os
-        default_dir = os.path.join(os.getcwd(), "templates", "configs")
+        # One template read/write at a time - a second load would race the
+        # first, and loading during a save would replace what is being saved
+        if self._io_task is not None:
+            return
 
-        file_path, _ = QFileDialog.getOpenFileName(
+        file_path = self._pick_template_file("Load Template")
+
+        if not file_path:
+            return
+
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+        except OSError as e:
+            self._show_load_error(e)
+            return
+
+        cached = self._tpl_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            # Unchanged since last load - skip the read and parse
+            self._apply_loaded_template(copy.deepcopy(cached[1]), (file_path, mtime))
+            return
+
+        # Read and parse on the I/O pool; the result comes back on the
+        # GUI thread through _on_template_read, with the path bound here
+        self._io_task = _JsonIOTask(file_path)
+        self._io_task.signals.finished.connect(
+            functools.partial(self._on_template_read, file_path)
+        )
+        self._io_pool.start(self._io_task)
+
+    def _on_template_read(self, file_path, result, error):
+        """Cache and apply a template parsed in the background"""
+        self._io_task = None
+        if error is not None:
+            self._show_load_error(error)
+            return
+
+        mtime, loaded_data = result
+        # Keep a private copy - loaded_data becomes template_data
+        self._tpl_cache[file_path] = (mtime, copy.deepcopy(loaded_data))
+        self._apply_loaded_template(loaded_data, (file_path, mtime))
+
+    def _show_load_error(self, error):
+        """Report a template that could not be loaded"""
+        QMessageBox.critical(
             self,
-            "Load Template",
-            default_dir if os.path.exists(default_dir) else "",
-            "JSON Files (*.json);;All Files (*.*)"
+            "Load Error",
+            f"Failed to load template:\n{str(error)}"
         )
 
-        if file_path:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
-
-                # Detect format: PPTGenerator format has "metadata" and "settings" keys
-                if 'metadata' in loaded_data and 'settings' in loaded_data:
-                    # PPTGenerator format - convert to internal format
-                    settings = loaded_data['settings']
-                    title_slide = settings.get('title_slide', {})
-                    table_slide = settings.get('table_slide', {})
-                    chart_slide = settings.get('chart_slide', {})
-                    
-                    self.template_data = {
-                        'name': loaded_data['metadata'].get('name', ''),
-                        'industry': loaded_data['metadata'].get('industry', ''),
-                        'logo_path': settings.get('logo_path'),
-                        'embedded_logo_path': settings.get('embedded_logo_path'),
-                        'title_slide': {
-                            'title': title_slide.get('title', ''),
-                            'subtitle': title_slide.get('subtitle', ''),
-                            'description': title_slide.get('description', ''),
-                            'logo_position': title_slide.get('logo_position', {'x': 5.0, 'y': 1.0}),
-                            'logo_size': title_slide.get('logo_size', {'width': 2.0, 'height': 1.5}),
-                            'title_position': title_slide.get('title_position', {'x': 0.5, 'y': 2.5}),
-                            'embedded_logo_position': title_slide.get('embedded_logo_position', {'x': 0.5, 'y': 6.5}),
-                            'embedded_logo_size': title_slide.get('embedded_logo_size', {'width': 1.5, 'height': 0.5})
-                        },
-                        'table_slide': {
-                            'title': table_slide.get('title', 'Yönetici Özeti'),
-                            'subtitle': table_slide.get('subtitle', 'Haberlerin Dağılımı'),
-                            'columns': table_slide.get('columns', []),
-                            'sort_by': table_slide.get('sort_by'),
-                            'ascending': table_slide.get('ascending', False),
-                            'group_by': table_slide.get('group_by'),
-                            'note': table_slide.get('note', ''),
-                            'style': table_slide.get('style', {
-                                'font_name': 'Calibri',
-                                'font_size': 11,
-                                'header_color': '#2563EB',
-                                'header_text_color': '#FFFFFF',
-                                'row_color_1': '#FFFFFF',
-                                'row_color_2': '#F9FAFB',
-                                'text_color': '#1F2937'
-                            })
-                        },
-                        'chart_slide': {
-                            'chart_type': chart_slide.get('chart_type', 'column'),
-                            'title': chart_slide.get('title', ''),
-                            'x_column': chart_slide.get('x_column', 'Firma'),
-                            'y_column': chart_slide.get('y_column', 'Net Etki'),
-                            'calculation': chart_slide.get('calculation', 'sum'),
-                            'sort_by': chart_slide.get('sort_by'),
-                            'ascending': chart_slide.get('ascending', False),
-                            'top_n': chart_slide.get('top_n'),
-                            'style': chart_slide.get('style', {
-                                'colors': ['#2563EB', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6'],
-                                'show_values': True,
-                                'grid': True,
-                                'legend_position': 'none'
-                            })
-                        },
-                        'colors': {
-                            'primary': settings.get('color_scheme', {}).get('primary', '#2563EB'),
-                            'secondary': settings.get('color_scheme', {}).get('secondary', '#10B981'),
-                            'accent': settings.get('color_scheme', {}).get('accent', '#F59E0B')
-                        },
-                        'font_family': settings.get('default_font', 'Segoe UI'),
-                        'slides': loaded_data.get('slides', [])
-                    }
-                else:
-                    # Simple format (old Template Builder format)
-                    self.template_data = loaded_data
+    def _apply_loaded_template(self, loaded_data, source=None):
+        """Populate template_data and the UI from parsed template JSON
 
-                # Update UI from loaded data
-                self.template_name_input.setText(self.template_data.get('name', ''))
+        source is the (path, mtime_ns) the data was read from.
+        """
+        # A rename still waiting on its timer belongs to the old slide list
+        self._rename_timer.stop()
+        self._pending_rename = None
+        self._validation_cache = None
+        self._saved_source = None
 
-                # Set industry if it exists in combo box
-                industry = self.template_data.get('industry', '')
-                index = self.industry_combo.findText(industry)
-                if index >= 0:
-                    self.industry_combo.setCurrentIndex(index)
-                else:
-                    self.industry_combo.setCurrentText(industry)
-
-                # Update colors
-                colors = self.template_data.get('colors', {})
-                for color_type in ['primary', 'secondary', 'accent']:
-                    color = colors.get(color_type, '#000000')
-                    if color_type == 'primary':
-                        self.primary_color_btn.setStyleSheet(f"background-color: {color};")
-                        self.primary_color_label.setText(color)
-                    elif color_type == 'secondary':
-                        self.secondary_color_btn.setStyleSheet(f"background-color: {color};")
-                        self.secondary_color_label.setText(color)
-                    elif color_type == 'accent':
-                        self.accent_color_btn.setStyleSheet(f"background-color: {color};")
-                        self.accent_color_label.setText(color)
-
-                # Update font
-                font_family = self.template_data.get('font_family', 'Segoe UI')
-                index = self.font_combo.findText(font_family)
-                if index >= 0:
-                    self.font_combo.setCurrentIndex(index)
-
-                # Update logo paths
-                logo_path = self.template_data.get('logo_path')
-                if logo_path:
-                    import os
-                    self.logo_path_label.setText(os.path.basename(logo_path))
-                    self.logo_path_label.setStyleSheet("color: #10B981; font-weight: bold;")
-                
-                embedded_logo_path = self.template_data.get('embedded_logo_path')
-                if embedded_logo_path:
-                    import os
-                    self.embedded_logo_path_label.setText(os.path.basename(embedded_logo_path))
-                    self.embedded_logo_path_label.setStyleSheet("color: #10B981; font-weight: bold;")
-
-                # Update title slide settings
-                title_slide = self.template_data.get('title_slide', {})
-                self.title_slide_title_input.setText(title_slide.get('title', ''))
-                self.title_slide_subtitle_input.setText(title_slide.get('subtitle', ''))
-                self.title_slide_description_input.setText(title_slide.get('description', ''))
-
-                # Update table slide settings
-                table_slide = self.template_data.get('table_slide', {})
-                self.table_slide_title_input.setText(table_slide.get('title', 'Yönetici Özeti'))
-                self.table_slide_subtitle_input.setText(table_slide.get('subtitle', 'Haberlerin Dağılımı'))
-                self.table_slide_note_input.setText(table_slide.get('note', ''))
-                
-                # Set selected columns - respect what user saved
-                selected_columns = table_slide.get('columns', [])
-                print(f"[DEBUG] load_template: Loaded columns from JSON: {selected_columns}")
-                # Ensure selected_columns is a list
-                if not isinstance(selected_columns, list):
-                    selected_columns = []
-                    print(f"[DEBUG] load_template: Columns was not a list, using empty list: {selected_columns}")
-
-                # Only set checkboxes if the widget exists
-                if hasattr(self, 'table_columns_list') and self.table_columns_list:
-                    try:
-                        # Temporarily disconnect the signal to avoid triggering saves during load
-                        self.table_columns_list.itemChanged.disconnect(self.on_table_slide_changed)
-                        print(f"[DEBUG] load_template: Disconnected itemChanged signal")
-                    except:
-                        print(f"[DEBUG] load_template: Could not disconnect signal (not connected yet)")
-                        pass  # Signal might not be connected yet
-
-                    for i in range(self.table_columns_list.count()):
-                        item = self.table_columns_list.item(i)
-                        if item:
-                            item_text = item.text()
-                            if item_text in selected_columns:
-                                item.setCheckState(Qt.CheckState.Checked)
-                                print(f"[DEBUG] load_template: Set '{item_text}' to CHECKED")
-                            else:
-                                item.setCheckState(Qt.CheckState.Unchecked)
-                                print(f"[DEBUG] load_template: Set '{item_text}' to UNCHECKED")
-                    
-                    # Reconnect the signal
-                    try:
-                        self.table_columns_list.itemChanged.connect(self.on_table_slide_changed)
-                    except:
-                        pass  # Signal might already be connected
-                
-                # Set sort column
-                sort_by = table_slide.get('sort_by')
-                if sort_by:
-                    index = self.table_sort_column_combo.findText(sort_by)
-                    if index >= 0:
-                        self.table_sort_column_combo.setCurrentIndex(index)
-                
-                # Set sort order
-                ascending = table_slide.get('ascending', False)
-                self.table_sort_order_combo.setCurrentIndex(1 if ascending else 0)
-                
-                # Set group by
-                group_by = table_slide.get('group_by')
-                if group_by:
-                    index = self.table_group_by_combo.findText(group_by)
-                    if index >= 0:
-                        self.table_group_by_combo.setCurrentIndex(index)
-                
-                # Load styling settings
-                table_style = table_slide.get('style', {})
-                if hasattr(self, 'table_font_combo'):
-                    font_name = table_style.get('font_name', 'Calibri')
-                    index = self.table_font_combo.findText(font_name)
-                    if index >= 0:
-                        self.table_font_combo.setCurrentIndex(index)
-                
-                if hasattr(self, 'table_font_size_spin'):
-                    self.table_font_size_spin.setValue(table_style.get('font_size', 11))
-                
-                # Update color buttons
-                header_color = table_style.get('header_color', '#2563EB')
-                if hasattr(self, 'table_header_color_btn'):
-                    self.table_header_color_btn.setStyleSheet(f"background-color: {header_color}; border: 1px solid #E5E7EB;")
-                    self.table_header_color_label.setText(header_color)
-                
-                row1_color = table_style.get('row_color_1', '#FFFFFF')
-                if hasattr(self, 'table_row1_color_btn'):
-                    self.table_row1_color_btn.setStyleSheet(f"background-color: {row1_color}; border: 1px solid #E5E7EB;")
-                    self.table_row1_color_label.setText(row1_color)
-                
-                row2_color = table_style.get('row_color_2', '#F9FAFB')
-                if hasattr(self, 'table_row2_color_btn'):
-                    self.table_row2_color_btn.setStyleSheet(f"background-color: {row2_color}; border: 1px solid #E5E7EB;")
-                    self.table_row2_color_label.setText(row2_color)
+        try:
+            # Detect format: PPTGenerator format has "metadata" and "settings" keys
+            if 'metadata' in loaded_data and 'settings' in loaded_data:
+                # PPTGenerator format - convert to internal format
+                meta = loaded_data['metadata']
+                settings = loaded_data['settings']
+                color_scheme = settings.get('color_scheme', {})
+                title_slide = settings.get('title_slide', {})
+                table_slide = settings.get('table_slide', {})
+                chart_slide = settings.get('chart_slide', {})
                 
-                # Update chart slide settings
-                chart_slide = self.template_data.get('chart_slide', {})
-                if hasattr(self, 'chart_title_input'):
-                    self.chart_title_input.setText(chart_slide.get('title', ''))
-                if hasattr(self, 'chart_type_combo'):
-                    chart_type = chart_slide.get('chart_type', 'column')
-                    index = self.chart_type_combo.findText(chart_type)
-                    if index >= 0:
-                        self.chart_type_combo.setCurrentIndex(index)
-                if hasattr(self, 'chart_x_column_combo'):
-                    x_column = chart_slide.get('x_column', 'Firma')
-                    index = self.chart_x_column_combo.findText(x_column)
-                    if index >= 0:
-                        self.chart_x_column_combo.setCurrentIndex(index)
-                if hasattr(self, 'chart_y_column_combo'):
-                    y_column = chart_slide.get('y_column', 'Net Etki')
-                    index = self.chart_y_column_combo.findText(y_column)
-                    if index >= 0:
-                        self.chart_y_column_combo.setCurrentIndex(index)
-                if hasattr(self, 'chart_calculation_combo'):
-                    calculation = chart_slide.get('calculation', 'sum')
-                    index = self.chart_calculation_combo.findText(calculation)
-                    if index >= 0:
-                        self.chart_calculation_combo.setCurrentIndex(index)
-                if hasattr(self, 'chart_sort_column_combo'):
-                    sort_by = chart_slide.get('sort_by')
-                    if sort_by:
-                        index = self.chart_sort_column_combo.findText(sort_by)
-                        if index >= 0:
-                            self.chart_sort_column_combo.setCurrentIndex(index)
-                if hasattr(self, 'chart_sort_order_combo'):
-                    ascending = chart_slide.get('ascending', False)
-                    self.chart_sort_order_combo.setCurrentIndex(1 if ascending else 0)
-                if hasattr(self, 'chart_top_n_spin'):
-                    top_n = chart_slide.get('top_n')
-                    # Handle None case - convert to 0 (show all)
-                    self.chart_top_n_spin.setValue(top_n if top_n is not None else 0)
-                if hasattr(self, 'chart_show_values_check'):
-                    chart_style = chart_slide.get('style', {})
-                    self.chart_show_values_check.setChecked(chart_style.get('show_values', True))
-                if hasattr(self, 'chart_show_grid_check'):
-                    chart_style = chart_slide.get('style', {})
-                    self.chart_show_grid_check.setChecked(chart_style.get('grid', True))
-                if hasattr(self, 'chart_legend_combo'):
-                    chart_style = chart_slide.get('style', {})
-                    legend_pos = chart_style.get('legend_position', 'none')
-                    index = self.chart_legend_combo.findText(legend_pos)
-                    if index >= 0:
-                        self.chart_legend_combo.setCurrentIndex(index)
-                if hasattr(self, 'chart_colors_list'):
-                    chart_style = chart_slide.get('style', {})
-                    selected_colors = chart_style.get('colors', ['#2563EB', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6'])
-                    for i in range(self.chart_colors_list.count()):
-                        item = self.chart_colors_list.item(i)
-                        if item.text() in selected_colors:
+                self.template_data = {
+                    'name': meta.get('name', ''),
+                    'industry': meta.get('industry', ''),
+                    'created_date': meta.get('created_date'),
+                    'logo_path': settings.get('logo_path'),
+                    'embedded_logo_path': settings.get('embedded_logo_path'),
+                    'title_slide': {
+                        'title': title_slide.get('title', ''),
+                        'subtitle': title_slide.get('subtitle', ''),
+                        'description': title_slide.get('description', ''),
+                        'logo_position': title_slide.get('logo_position', {'x': 5.0, 'y': 1.0}),
+                        'logo_size': title_slide.get('logo_size', {'width': 2.0, 'height': 1.5}),
+                        'title_position': title_slide.get('title_position', {'x': 0.5, 'y': 2.5}),
+                        'embedded_logo_position': title_slide.get('embedded_logo_position', {'x': 0.5, 'y': 6.5}),
+                        'embedded_logo_size': title_slide.get('embedded_logo_size', {'width': 1.5, 'height': 0.5})
+                    },
+                    'table_slide': {
+                        'title': table_slide.get('title', 'Yönetici Özeti'),
+                        'subtitle': table_slide.get('subtitle', 'Haberlerin Dağılımı'),
+                        'columns': table_slide.get('columns', []),
+                        'sort_by': table_slide.get('sort_by'),
+                        'ascending': table_slide.get('ascending', False),
+                        'group_by': table_slide.get('group_by'),
+                        'note': table_slide.get('note', ''),
+                        'style': table_slide.get('style', {
+                            'font_name': 'Calibri',
+                            'font_size': 11,
+                            'header_color': '#2563EB',
+                            'header_text_color': '#FFFFFF',
+                            'row_color_1': '#FFFFFF',
+                            'row_color_2': '#F9FAFB',
+                            'text_color': '#1F2937'
+                        })
+                    },
+                    'chart_slide': {
+                        'chart_type': chart_slide.get('chart_type', 'column'),
+                        'title': chart_slide.get('title', ''),
+                        'x_column': chart_slide.get('x_column', 'Firma'),
+                        'y_column': chart_slide.get('y_column', 'Net Etki'),
+                        'calculation': chart_slide.get('calculation', 'sum'),
+                        'sort_by': chart_slide.get('sort_by'),
+                        'ascending': chart_slide.get('ascending', False),
+                        'top_n': chart_slide.get('top_n'),
+                        'style': chart_slide.get('style', {
+                            'colors': ['#2563EB', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6'],
+                            'show_values': True,
+                            'grid': True,
+                            'legend_position': 'none'
+                        })
+                    },
+                    'colors': {
+                        'primary': color_scheme.get('primary', '#2563EB'),
+                        'secondary': color_scheme.get('secondary', '#10B981'),
+                        'accent': color_scheme.get('accent', '#F59E0B')
+                    },
+                    'font_family': settings.get('default_font', 'Segoe UI'),
+                    'slides': loaded_data.get('slides', [])
+                }
+            else:
+                # Simple format (old Template Builder format)
+                self.template_data = loaded_data
+
+            # Update UI from loaded data
+            self.template_name_input.setText(self.template_data.get('name', ''))
+
+            # Set industry if it exists in combo box
+            industry = self.template_data.get('industry', '')
+            index = self.industry_combo.findText(industry)
+            if index >= 0:
+                self.industry_combo.setCurrentIndex(index)
+            else:
+                self.industry_combo.setCurrentText(industry)
+
+            # Update colors
+            colors = self.template_data.get('colors', {})
+            for color_type in self._color_widgets:
+                self._apply_brand_color(color_type, colors.get(color_type, '#000000'))
+
+            # Update font
+            font_family = self.template_data.get('font_family', 'Segoe UI')
+            index = self.font_combo.findText(font_family)
+            if index >= 0:
+                self.font_combo.setCurrentIndex(index)
+
+            # Update logo paths
+            logo_path = self.template_data.get('logo_path')
+            if logo_path:
+                self.logo_path_label.setText(_basename(logo_path))
+                _set_path_label_selected(self.logo_path_label, True)
+            
+            embedded_logo_path = self.template_data.get('embedded_logo_path')
+            if embedded_logo_path:
+                self.embedded_logo_path_label.setText(_basename(embedded_logo_path))
+                _set_path_label_selected(self.embedded_logo_path_label, True)
+
+            # Update title slide settings
+            title_slide = self.template_data.get('title_slide', {})
+            self.title_slide_title_input.setText(title_slide.get('title', ''))
+            self.title_slide_subtitle_input.setText(title_slide.get('subtitle', ''))
+            self.title_slide_description_input.setText(title_slide.get('description', ''))
+
+            # Update table slide settings
+            table_slide = self.template_data.get('table_slide', {})
+            self.table_slide_title_input.setText(table_slide.get('title', 'Yönetici Özeti'))
+            self.table_slide_subtitle_input.setText(table_slide.get('subtitle', 'Haberlerin Dağılımı'))
+            self.table_slide_note_input.setText(table_slide.get('note', ''))
+            
+            # Set selected columns - respect what user saved
+            selected_columns = table_slide.get('columns', [])
+            print(f"[DEBUG] load_template: Loaded columns from JSON: {selected_columns}")
+            # Ensure selected_columns is a list
+            if not isinstance(selected_columns, list):
+                selected_columns = []
+                print(f"[DEBUG] load_template: Columns was not a list, using empty list: {selected_columns}")
+
+            # Only set checkboxes if the widget exists
+            if hasattr(self, 'table_columns_list') and self.table_columns_list:
+                try:
+                    # Temporarily disconnect the signal to avoid triggering saves during load
+                    self.table_columns_list.itemChanged.disconnect(self.on_table_slide_changed)
+                    print(f"[DEBUG] load_template: Disconnected itemChanged signal")
+                except:
+                    print(f"[DEBUG] load_template: Could not disconnect signal (not connected yet)")
+                    pass  # Signal might not be connected yet
+
+                for i in range(self.table_columns_list.count()):
+                    item = self.table_columns_list.item(i)
+                    if item:
+                        item_text = item.text()
+                        if item_text in selected_columns:
                             item.setCheckState(Qt.CheckState.Checked)
+                            print(f"[DEBUG] load_template: Set '{item_text}' to CHECKED")
                         else:
                             item.setCheckState(Qt.CheckState.Unchecked)
-
-                # Load slides
+                            print(f"[DEBUG] load_template: Set '{item_text}' to UNCHECKED")
+                
+                # Reconnect the signal
+                try:
+                    self.table_columns_list.itemChanged.connect(self.on_table_slide_changed)
+                except:
+                    pass  # Signal might already be connected
+            
+            # Set sort column
+            sort_by = table_slide.get('sort_by')
+            if sort_by:
+                index = self.table_sort_column_combo.findText(sort_by)
+                if index >= 0:
+                    self.table_sort_column_combo.setCurrentIndex(index)
+            
+            # Set sort order
+            ascending = table_slide.get('ascending', False)
+            self.table_sort_order_combo.setCurrentIndex(1 if ascending else 0)
+            
+            # Set group by
+            group_by = table_slide.get('group_by')
+            if group_by:
+                index = self.table_group_by_combo.findText(group_by)
+                if index >= 0:
+                    self.table_group_by_combo.setCurrentIndex(index)
+            
+            # Load styling settings
+            table_style = table_slide.get('style', {})
+            if hasattr(self, 'table_font_combo'):
+                font_name = table_style.get('font_name', 'Calibri')
+                index = self.table_font_combo.findText(font_name)
+                if index >= 0:
+                    self.table_font_combo.setCurrentIndex(index)
+            
+            if hasattr(self, 'table_font_size_spin'):
+                self.table_font_size_spin.setValue(table_style.get('font_size', 11))
+            
+            # Update color buttons
+            for color_type in ('header', 'row1', 'row2'):
+                style_key, default_color, widget_prefix = _TABLE_COLORS[color_type]
+                if hasattr(self, widget_prefix + '_btn'):
+                    self._apply_table_color(widget_prefix, table_style.get(style_key, default_color))
+            
+            # Update chart slide settings
+            chart_slide = self.template_data.get('chart_slide', {})
+            if hasattr(self, 'chart_title_input'):
+                self.chart_title_input.setText(chart_slide.get('title', ''))
+            if hasattr(self, 'chart_type_combo'):
+                chart_type = chart_slide.get('chart_type', 'column')
+                index = self.chart_type_combo.findText(chart_type)
+                if index >= 0:
+                    self.chart_type_combo.setCurrentIndex(index)
+            if hasattr(self, 'chart_x_column_combo'):
+                x_column = chart_slide.get('x_column', 'Firma')
+                index = self.chart_x_column_combo.findText(x_column)
+                if index >= 0:
+                    self.chart_x_column_combo.setCurrentIndex(index)
+            if hasattr(self, 'chart_y_column_combo'):
+                y_column = chart_slide.get('y_column', 'Net Etki')
+                index = self.chart_y_column_combo.findText(y_column)
+                if index >= 0:
+                    self.chart_y_column_combo.setCurrentIndex(index)
+            if hasattr(self, 'chart_calculation_combo'):
+                calculation = chart_slide.get('calculation', 'sum')
+                index = self.chart_calculation_combo.findText(calculation)
+                if index >= 0:
+                    self.chart_calculation_combo.setCurrentIndex(index)
+            if hasattr(self, 'chart_sort_column_combo'):
+                sort_by = chart_slide.get('sort_by')
+                if sort_by:
+                    index = self.chart_sort_column_combo.findText(sort_by)
+                    if index >= 0:
+                        self.chart_sort_column_combo.setCurrentIndex(index)
+            if hasattr(self, 'chart_sort_order_combo'):
+                ascending = chart_slide.get('ascending', False)
+                self.chart_sort_order_combo.setCurrentIndex(1 if ascending else 0)
+            if hasattr(self, 'chart_top_n_spin'):
+                top_n = chart_slide.get('top_n')
+                # Handle None case - convert to 0 (show all)
+                self.chart_top_n_spin.setValue(top_n if top_n is not None else 0)
+            if hasattr(self, 'chart_show_values_check'):
+                chart_style = chart_slide.get('style', {})
+                self.chart_show_values_check.setChecked(chart_style.get('show_values', True))
+            if hasattr(self, 'chart_show_grid_check'):
+                chart_style = chart_slide.get('style', {})
+                self.chart_show_grid_check.setChecked(chart_style.get('grid', True))
+            if hasattr(self, 'chart_legend_combo'):
+                chart_style = chart_slide.get('style', {})
+                legend_pos = chart_style.get('legend_position', 'none')
+                index = self.chart_legend_combo.findText(legend_pos)
+                if index >= 0:
+                    self.chart_legend_combo.setCurrentIndex(index)
+            if hasattr(self, 'chart_colors_list'):
+                chart_style = chart_slide.get('style', {})
+                selected_colors = chart_style.get('colors', ['#2563EB', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6'])
+                for i in range(self.chart_colors_list.count()):
+                    item = self.chart_colors_list.item(i)
+                    if item.text() in selected_colors:
+                        item.setCheckState(Qt.CheckState.Checked)
+                    else:
+                        item.setCheckState(Qt.CheckState.Unchecked)
+
+            # Items are built before the list is touched, so it is frozen
+            # only for the clear and the inserts
+            items = [
+                QListWidgetItem(f"{i}. {slide['name']}")
+                for i, slide in enumerate(self.template_data.get('slides', []), 1)
+            ]
+            for item in items:
+                item.setFlags(_SLIDE_ITEM_FLAGS)
+
+            # Load slides - one repaint and no selection/rename signals
+            self.slide_list.setUpdatesEnabled(False)
+            self.slide_list.blockSignals(True)
+            try:
                 self.slide_list.clear()
-                for i, slide in enumerate(self.template_data.get('slides', [])):
-                    item = QListWidgetItem(f"{i + 1}. {slide['name']}")
-                    item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
-                    self.slide_list.addItem(item)
+                add_item = self.slide_list.addItem
+                for item in items:
+                    add_item(item)
+            finally:
+                self.slide_list.blockSignals(False)
+                self.slide_list.setUpdatesEnabled(True)
+            self.slide_list.viewport().update()
+
+            # Select first slide if available
+            if self.slide_list.count() > 0:
+                self.slide_list.setCurrentRow(0)
+
+            # Widget updates above fire change handlers; the freshly
+            # loaded template itself has nothing unsaved
+            self._dirty = False
+            # Only builder-format files match what a save would write
+            if 'metadata' in loaded_data and 'settings' in loaded_data:
+                self._saved_source = source
 
-                # Select first slide if available
-                if self.slide_list.count() > 0:
-                    self.slide_list.setCurrentRow(0)
-
-                QMessageBox.information(
-                    self,
-                    "Template Loaded",
-                    f"Template loaded successfully!\n\n"
-                    f"Name: {self.template_data['name']}\n"
-                    f"Industry: {self.template_data.get('industry', 'N/A')}\n"
-                    f"Slides: {len(self.template_data.get('slides', []))}"
-                )
+            QMessageBox.information(
+                self,
+                "Template Loaded",
+                f"Template loaded successfully!\n\n"
+                f"Name: {self.template_data['name']}\n"
+                f"Industry: {self.template_data.get('industry', 'N/A')}\n"
+                f"Slides: {len(self.template_data.get('slides', []))}"
+            )
 
-            except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Load Error",
-                    f"Failed to load template:\n{str(e)}"
-                )
+        except Exception as e:
+            self._show_load_error(e)
 
     def delete_template(self):
         """Delete an existing template from templates/configs/"""
-        import os
-
-        default_dir = os.path.join(os.getcwd(), "templates", "configs")
-
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Template to Delete",
-            default_dir if os.path.exists(default_dir) else "",
-            "JSON Files (*.json);;All Files (*.*)"
-        )
+        file_path = self._pick_template_file("Select Template to Delete")
 
         if file_path:
-            # Get template name for confirmation
+            # Get template name for confirmation - from the first few KB when
+            # possible, so large templates aren't parsed just to be deleted
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
-
-                if 'metadata' in loaded_data:
-                    template_name = loaded_data['metadata'].get('name', os.path.basename(file_path))
-                else:
-                    template_name = loaded_data.get('name', os.path.basename(file_path))
+                template_name = _peek_template_name(file_path)
+                if template_name is None:
+                    loaded_data = load_json_file(file_path)
+
+                    if 'metadata' in loaded_data:
+                        template_name = loaded_data['metadata'].get('name', _basename(file_path))
+                    else:
+                        template_name = loaded_data.get('name', _basename(file_path))
             except Exception:
-                template_name = os.path.basename(file_path)
+                template_name = _basename(file_path)
 
             # Confirm deletion
             reply = QMessageBox.question(
@@ -3382,7 +3937,7 @@ class TemplateBuilder(QMainWindow):
                 "Delete Template",
                 f"Are you sure you want to delete this template?\n\n"
                 f"Template: {template_name}\n"
-                f"File: {os.path.basename(file_path)}\n\n"
+                f"File: {_basename(file_path)}\n\n"
                 f"This action cannot be undone!",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No
@@ -3391,6 +3946,7 @@ class TemplateBuilder(QMainWindow):
             if reply == QMessageBox.StandardButton.Yes:
                 try:
                     os.remove(file_path)
+                    self._tpl_cache.pop(file_path, None)
                     QMessageBox.information(
                         self,
                         "Template Deleted",
@@ -3399,30 +3955,20 @@ class TemplateBuilder(QMainWindow):
 
                     # If the deleted template was currently loaded, clear the UI
                     if self.template_data.get('name') == template_name:
-                        self.template_data = {
-                            'name': '',
-                            'industry': '',
-                            'logo_path': None,
-                            'embedded_logo_path': None,
-                            'title_slide': {
-                                'title': '',
-                                'subtitle': '',
-                                'description': ''
-                            },
-                            'colors': {
-                                'primary': '#2563EB',
-                                'secondary': '#10B981',
-                                'accent': '#F59E0B'
-                            },
-                            'font_family': 'Segoe UI',
-                            'slides': []
-                        }
+                        self.template_data = loads_json(_EMPTY_TEMPLATE_BYTES)
+                        self._validation_cache = None
+                        # Nothing left to save: closing shouldn't prompt, and
+                        # a stale rename mustn't land on the blank template
+                        self._rename_timer.stop()
+                        self._pending_rename = None
+                        self._saved_source = None
+                        self._dirty = False
                         # Clear UI fields
                         self.template_name_input.clear()
                         self.logo_path_label.setText("No logo selected")
-                        self.logo_path_label.setStyleSheet("color: #6B7280;")
+                        _set_path_label_selected(self.logo_path_label, False)
                         self.embedded_logo_path_label.setText("No embedded logo selected")
-                        self.embedded_logo_path_label.setStyleSheet("color: #6B7280;")
+                        _set_path_label_selected(self.embedded_logo_path_label, False)
                         self.title_slide_title_input.clear()
                         self.title_slide_subtitle_input.clear()
                         self.title_slide_description_input.clear()
@@ -3436,11 +3982,16 @@ class TemplateBuilder(QMainWindow):
                     )
 
     def export_template(self):
-        """Export template as JSON"""
-        self.save_template()  # Same as save for now
+        """Export template as human-readable (indented) JSON"""
+        self._save_template(pretty=True)
 
     def back_to_main_app(self):
         """Return to Main App"""
+        # Nothing edited since the last load/save - no need to prompt
+        if not self._dirty:
+            self.close()
+            return
+
         # Check if there are unsaved changes
         if self.template_data['slides']:
             reply = QMessageBox.question(
@@ -3453,8 +4004,12 @@ class TemplateBuilder(QMainWindow):
             )
 
             if reply == QMessageBox.StandardButton.Save:
+                # The file is written in the background; close once it lands
+                self._close_after_save = True
                 self.save_template()
-                self.close()
+                # Stay open if the save was cancelled or failed validation
+                if not self._is_saving:
+                    self._close_after_save = False
             elif reply == QMessageBox.StandardButton.Discard:
                 self.close()
             # If Cancel, do nothing
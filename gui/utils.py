@@ -0,0 +1,32 @@
+"""
+Shared helpers for the GUI windows
+No Qt imports, so importing this from main_window stays cheap
+"""
+
+import json
+import os
+
+# Template files are read with the core engine's reader so the GUI and the
+# generator share one parser and one mmap threshold
+try:
+    from core.template_manager import _loads_json as loads_json
+    from core.template_manager import _read_json as load_json_file
+except ImportError:
+    # Core engine unavailable (simulation mode) - plain stdlib parsing
+    def loads_json(raw):
+        """Parse JSON bytes into new Python objects"""
+        return json.loads(raw)
+
+    def load_json_file(file_path):
+        """Read and parse a JSON file from raw bytes"""
+        with open(file_path, 'rb') as f:
+            return json.loads(f.read())
+
+
+# Template configs live under <working dir>/templates/configs
+CONFIGS_SUBPATH = ("templates", "configs")
+
+
+def default_config_dir():
+    """Absolute templates/configs path under the current working directory"""
+    return os.path.join(os.getcwd(), *CONFIGS_SUBPATH)
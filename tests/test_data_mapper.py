@@ -0,0 +1,81 @@
+"""
+DataMapper shared-cache tests.
+"""
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pptx")  # core/__init__ imports the generator
+
+from core import data_mapper
+from core.data_mapper import DataMapper
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_frames():
+    """Start every test with an empty process-wide cache."""
+    DataMapper._shared_frames.clear()
+    yield
+    DataMapper._shared_frames.clear()
+
+
+def _write_csv(tmp_path, name, rows=3):
+    path = tmp_path / name
+    pd.DataFrame({
+        "Company": [f"C{i}" for i in range(rows)],
+        "Total": list(range(rows)),
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+def _cached_paths():
+    return [key[0] for key in DataMapper._shared_frames]
+
+
+def test_get_or_create_reuses_cached_frame(tmp_path):
+    """Test that an unchanged file is loaded only once."""
+    path = _write_csv(tmp_path, "data.csv")
+
+    first = DataMapper.get_or_create(path)
+    second = DataMapper.get_or_create(path)
+
+    assert first is not second
+    assert len(DataMapper._shared_frames) == 1
+    assert first.data.equals(second.data)
+
+
+def test_get_or_create_evicts_least_recently_used(tmp_path):
+    """Test that the cache keeps only the most recently used files."""
+    size = data_mapper._SHARED_CACHE_SIZE
+    paths = [_write_csv(tmp_path, f"data_{i}.csv") for i in range(size + 1)]
+
+    for path in paths[:size]:
+        DataMapper.get_or_create(path)
+    # Touch the oldest entry so the second one becomes least recently used
+    DataMapper.get_or_create(paths[0])
+    DataMapper.get_or_create(paths[size])
+
+    cached = _cached_paths()
+    assert len(cached) == size
+    assert not any(p.endswith("data_1.csv") for p in cached)
+    assert any(p.endswith("data_0.csv") for p in cached)
+    assert any(p.endswith(f"data_{size}.csv") for p in cached)
+
+
+def test_returned_mappers_are_isolated(tmp_path):
+    """Test that changing one returned mapper leaves the others untouched."""
+    path = _write_csv(tmp_path, "data.csv", rows=4)
+
+    first = DataMapper.get_or_create(path)
+    second = DataMapper.get_or_create(path)
+
+    first.data["Extra"] = 1
+    first.apply_column_mapping({"Company": "Firm"})
+    first.filter_data("Firm", ["C0"])
+
+    assert list(second.data.columns) == ["Company", "Total"]
+    assert len(second.data) == 4
+    assert second.metadata["columns"] == ["Company", "Total"]
+
+    third = DataMapper.get_or_create(path)
+    assert list(third.data.columns) == ["Company", "Total"]
+    assert len(third.data) == 4
@@ -0,0 +1,106 @@
+"""
+PPTGenerator tests.
+"""
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("pptx")
+
+from core import PPTGenerator
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Generator with a one-slide template and output under tmp_path."""
+    gen = PPTGenerator(output_dir=str(tmp_path))
+    gen.template_manager.create_empty_template("Test")
+    gen.template_manager.add_slide("First")
+    return gen
+
+
+def test_compiled_slides_reused_for_unchanged_template(generator):
+    """Test that compiling the same template twice reuses the result."""
+    template = generator.template_manager.current_template
+
+    first = generator._compile_template(template)
+    second = generator._compile_template(template)
+
+    assert first is second
+
+
+def test_add_slide_recompiles_template(generator):
+    """Test that add_slide bumps template_version and forces a recompile."""
+    manager = generator.template_manager
+    template = manager.current_template
+    compiled = generator._compile_template(template)
+    version = manager.template_version
+
+    manager.add_slide("Second")
+
+    assert manager.template_version == version + 1
+    recompiled = generator._compile_template(template)
+    assert recompiled is not compiled
+    assert len(recompiled) == 2
+
+
+def test_add_slides_recompiles_template(generator):
+    """Test that add_slides bumps template_version and forces a recompile."""
+    manager = generator.template_manager
+    template = manager.current_template
+    compiled = generator._compile_template(template)
+    version = manager.template_version
+
+    manager.add_slides([{"name": "Second"}, {"name": "Third"}])
+
+    assert manager.template_version == version + 1
+    recompiled = generator._compile_template(template)
+    assert recompiled is not compiled
+    assert len(recompiled) == 3
+
+
+def test_generate_writes_output_without_temp_file(generator, tmp_path):
+    """Test that a successful save leaves only the final .pptx."""
+    output_path = tmp_path / "report.pptx"
+
+    assert generator.generate(str(output_path)) == str(output_path)
+
+    assert output_path.exists()
+    assert not (tmp_path / "report.pptx.tmp").exists()
+
+
+def test_failed_save_leaves_no_temp_file(generator, tmp_path, monkeypatch):
+    """Test that the temp file is removed when saving raises."""
+    import pptx.presentation
+
+    def fail_save(self, file):
+        file.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pptx.presentation.Presentation, "save", fail_save)
+    output_path = tmp_path / "report.pptx"
+
+    with pytest.raises(OSError, match="disk full"):
+        generator.generate(str(output_path))
+
+    assert not output_path.exists()
+    assert not (tmp_path / "report.pptx.tmp").exists()
+
+
+def test_generate_rejects_empty_template(tmp_path):
+    """Test that a template without slides raises before building a deck."""
+    gen = PPTGenerator(output_dir=str(tmp_path))
+    gen.template_manager.create_empty_template("Empty")
+
+    with pytest.raises(ValueError, match="at least one slide"):
+        gen.generate(str(tmp_path / "report.pptx"))
+
+    assert gen.presentation is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_generate_requires_template(tmp_path):
+    """Test that generate() without a loaded template raises."""
+    gen = PPTGenerator(output_dir=str(tmp_path))
+
+    with pytest.raises(ValueError, match="No template loaded"):
+        gen.generate(str(tmp_path / "report.pptx"))